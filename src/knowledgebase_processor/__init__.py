@@ -1,10 +1,23 @@
 """Knowledge Base Processor - A tool for extracting and analyzing knowledge base content."""
 
+import importlib
+
 __version__ = "0.1.0"
 
-# Import main components for easier access
-from .main import KnowledgeBaseProcessor
-from .models.content import Document
-from .models.metadata import DocumentMetadata
+# Main components for easier access, imported on first use so that loading a
+# submodule (e.g. the CLI) doesn't pull in the whole processing pipeline
+_EXPORTS = {
+    "KnowledgeBaseProcessor": ".main",
+    "Document": ".models.content",
+    "DocumentMetadata": ".models.metadata",
+}
+
+__all__ = ["KnowledgeBaseProcessor", "Document", "DocumentMetadata"]
+
 
-__all__ = ["KnowledgeBaseProcessor", "Document", "DocumentMetadata"]
\ No newline at end of file
+def __getattr__(name):
+    if name in _EXPORTS:
+        value = getattr(importlib.import_module(_EXPORTS[name], __name__), name)
+        globals()[name] = value
+        return value
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
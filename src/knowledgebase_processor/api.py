@@ -169,7 +169,7 @@ class KnowledgeBaseAPI:
     def sparql_load(self, file_path: Path, graph_uri: Optional[str] = None,
                    endpoint_url: Optional[str] = None, update_endpoint_url: Optional[str] = None,
                    username: Optional[str] = None, password: Optional[str] = None,
-                   rdf_format: str = "turtle") -> None:
+                   rdf_format: Optional[str] = None) -> None:
         """Load RDF file into SPARQL store.
         
         Args:
@@ -179,7 +179,7 @@ class KnowledgeBaseAPI:
             update_endpoint_url: SPARQL update endpoint URL (overrides config if provided)
             username: Username for authentication
             password: Password for authentication
-            rdf_format: Format of the RDF file
+            rdf_format: Format of the RDF file; guessed from the file suffix if not given
         """
         self.sparql_service.load_rdf_file(
             file_path=file_path,
@@ -220,6 +220,22 @@ class KnowledgeBaseAPI:
             source_doc_relative_path=source_doc_relative_path
         )
     
+    def transform_to_kb_entities(self, extracted_entities: List[ExtractedEntity],
+                                 source_doc_relative_path: str) -> List[KbBaseEntity]:
+        """Transform all ExtractedEntities of one document to KbBaseEntities.
+        
+        Args:
+            extracted_entities: The extracted entities to transform
+            source_doc_relative_path: Relative path to the source document
+            
+        Returns:
+            KbBaseEntity instances for the handled entities, in input order
+        """
+        return self.entity_service.transform_batch(
+            extracted_entities=extracted_entities,
+            source_doc_relative_path=source_doc_relative_path
+        )
+    
     # Metadata operations
     def get_metadata(self, document_id: str) -> Optional[DocumentMetadata]:
         """Get metadata for a document.
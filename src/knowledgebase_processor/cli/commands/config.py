@@ -5,6 +5,11 @@ from pathlib import Path
 from typing import Optional
 import yaml
 
+try:
+    from yaml import CSafeLoader as _YamlLoader, CSafeDumper as _YamlDumper
+except ImportError:
+    from yaml import SafeLoader as _YamlLoader, SafeDumper as _YamlDumper
+
 from ..utils import console, print_success, print_error, print_info, show_panel, create_table, format_path
 from ...services.orchestrator import OrchestratorService
 
@@ -95,7 +100,7 @@ def config_cmd(ctx, key, value, list, edit, reset, is_global, path):
                 config_path = kbp_dir / "config.yaml"
                 if config_path.exists():
                     with open(config_path, 'r') as f:
-                        config_data = yaml.safe_load(f) or {}
+                        config_data = yaml.load(f, Loader=_YamlLoader) or {}
                     _display_config(config_data, scope_name)
         return
     
@@ -114,7 +119,7 @@ def config_cmd(ctx, key, value, list, edit, reset, is_global, path):
                     config_path = kbp_dir / "config.yaml"
                     if config_path.exists():
                         with open(config_path, 'r') as f:
-                            config_data = yaml.safe_load(f) or {}
+                            config_data = yaml.load(f, Loader=_YamlLoader) or {}
                         all_keys = _get_all_keys(config_data)
                         similar = [k for k in all_keys if key.lower() in k.lower() or k.lower() in key.lower()]
                         
@@ -187,7 +192,7 @@ def _save_config(config_path: Path, config: dict):
     try:
         config_path.parent.mkdir(parents=True, exist_ok=True)
         with open(config_path, 'w') as f:
-            yaml.dump(config, f, default_flow_style=False, sort_keys=True, indent=2)
+            yaml.dump(config, f, Dumper=_YamlDumper, default_flow_style=False, sort_keys=True, indent=2)
     except Exception as e:
         print_error(f"Error saving config: {e}")
 
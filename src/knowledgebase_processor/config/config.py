@@ -25,6 +25,8 @@ class Config(BaseModel):
     analyze_topics: bool = Field(default=True, description="Analyze topics")
     analyze_entities: bool = Field(default=False, description="Analyze entities using spaCy (disabled by default)")
     enrich_relationships: bool = Field(default=True, description="Enrich with relationship information")
+    processing_workers: Optional[int] = Field(default=None, description="Number of processes extracting entities from documents (default: 1, in the calling process)")
+    incremental_rdf: bool = Field(default=False, description="Skip documents whose RDF output in the output directory is current; their metadata is not saved again")
     
     # Advanced options
     max_file_size: int = Field(default=10 * 1024 * 1024, description="Maximum file size to process in bytes")
@@ -35,6 +37,11 @@ class Config(BaseModel):
     sparql_endpoint_url: Optional[str] = Field(default=None, description="SPARQL query endpoint URL")
     sparql_update_endpoint_url: Optional[str] = Field(default=None, description="SPARQL update endpoint URL")
     sparql_default_graph: Optional[str] = Field(default=None, description="Default graph URI for SPARQL operations")
+    sparql_load_workers: Optional[int] = Field(default=None, description="Number of RDF files loaded into the SPARQL store concurrently (default: 4 per CPU, at most 16)")
+    sparql_cache_ttl: Optional[float] = Field(default=None, description="Seconds for which results of read-only SPARQL queries are reused (default: 0, caching disabled)")
+    sparql_graph_store_url: Optional[str] = Field(default=None, description="SPARQL 1.1 Graph Store Protocol endpoint URL; when set, generated RDF files are uploaded to it unparsed")
+    sparql_server_kind: Optional[str] = Field(default=None, description="Kind of SPARQL store (virtuoso, fuseki or blazegraph); when set, query timeouts are passed to the store so it aborts queries the client gave up on")
+    sparql_server_load: bool = Field(default=False, description="Have the SPARQL store read generated RDF files itself with LOAD <file://...>; requires the store to share the file system with the processor")
 
 
 def load_config(config_path: Optional[str] = None) -> Config:
@@ -51,6 +58,13 @@ def load_config(config_path: Optional[str] = None) -> Config:
     - KBP_KNOWLEDGE_BASE_PATH: Path to knowledge base directory
     - KBP_METADATA_STORE_PATH: Path to metadata store directory
     - KBP_HOME: Base directory for KBP files (defaults to ~/.kbp)
+    - KBP_PROCESSING_WORKERS: Number of processes extracting entities from documents
+    - KBP_INCREMENTAL_RDF: Whether documents with current RDF output are skipped (1, true or yes)
+    - KBP_SPARQL_LOAD_WORKERS: Number of RDF files loaded concurrently
+    - KBP_SPARQL_CACHE_TTL: Seconds read-only query results are reused (off by default)
+    - KBP_SPARQL_GRAPH_STORE_URL: Graph Store Protocol endpoint RDF files are uploaded to
+    - KBP_SPARQL_SERVER_KIND: Kind of SPARQL store (virtuoso, fuseki or blazegraph)
+    - KBP_SPARQL_SERVER_LOAD: Whether the store reads RDF files itself (1, true or yes)
     
     If config_path is not provided, the function will look for a config file
     in the following locations:
@@ -76,12 +90,19 @@ def load_config(config_path: Optional[str] = None) -> Config:
         "analyze_topics": True,
         "analyze_entities": False,
         "enrich_relationships": True,
+        "processing_workers": os.getenv("KBP_PROCESSING_WORKERS"),
+        "incremental_rdf": os.getenv("KBP_INCREMENTAL_RDF", "false").lower() in ("1", "true", "yes"),
         "max_file_size": 10 * 1024 * 1024,
         "cache_enabled": True,
         "log_level": "INFO",
         "sparql_endpoint_url": None,
         "sparql_update_endpoint_url": None,
-        "sparql_default_graph": None
+        "sparql_default_graph": None,
+        "sparql_load_workers": os.getenv("KBP_SPARQL_LOAD_WORKERS"),
+        "sparql_cache_ttl": os.getenv("KBP_SPARQL_CACHE_TTL"),
+        "sparql_graph_store_url": os.getenv("KBP_SPARQL_GRAPH_STORE_URL"),
+        "sparql_server_kind": os.getenv("KBP_SPARQL_SERVER_KIND"),
+        "sparql_server_load": os.getenv("KBP_SPARQL_SERVER_LOAD", "false").lower() in ("1", "true", "yes")
     }
     
     # If a config path is provided, use it
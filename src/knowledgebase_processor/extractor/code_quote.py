@@ -2,11 +2,11 @@
 
 from typing import List, Dict, Optional, Tuple
 import re
-import uuid
 
 from ..models.content import Document, ContentElement
 from ..models.markdown import CodeBlock, Blockquote
 from .base import BaseExtractor
+from ..utils.id_generator import new_element_id
 
 
 class CodeQuoteExtractor(BaseExtractor):
@@ -97,7 +97,7 @@ class CodeQuoteExtractor(BaseExtractor):
             end_pos = start_pos + code_content.count('\n') + 2  # +2 for the ``` lines
             
             # Create code block element
-            code_block_id = str(uuid.uuid4())
+            code_block_id = new_element_id()
             code_block = CodeBlock(
                 id=code_block_id,
                 language=language,
@@ -180,7 +180,7 @@ class CodeQuoteExtractor(BaseExtractor):
             blockquote_data: Dictionary with blockquote data
             blockquotes: List to append the blockquote to
         """
-        blockquote_id = str(uuid.uuid4())
+        blockquote_id = new_element_id()
         blockquote_content = '\n'.join(blockquote_data['content'])
         
         blockquote = Blockquote(
@@ -4,7 +4,6 @@ import re
 from typing import List, Dict, Any, Optional, Tuple
 import datetime
 
-import yaml
 try:
     import tomli as toml
 except ImportError:
@@ -13,6 +12,7 @@ except ImportError:
 from .base import BaseExtractor
 from ..models.content import Document, ContentElement
 from ..models.metadata import Frontmatter
+from ..utils.frontmatter import load_frontmatter_yaml
 
 
 class FrontmatterExtractor(BaseExtractor):
@@ -84,7 +84,7 @@ class FrontmatterExtractor(BaseExtractor):
             if format_type.lower() == "toml":
                 parsed = toml.loads(frontmatter_content)
             else:  # Default to YAML
-                parsed = yaml.safe_load(frontmatter_content) or {}
+                parsed = load_frontmatter_yaml(frontmatter_content) or {}
             
             # Convert datetime objects to strings for consistency
             for key, value in parsed.items():
@@ -2,11 +2,11 @@
 
 from typing import List, Dict, Optional, Tuple
 import re
-import uuid
 
 from ..models.content import Document, ContentElement
 from ..models.markdown import Heading, Section
 from .base import BaseExtractor
+from ..utils.id_generator import new_element_id
 
 
 class HeadingSectionExtractor(BaseExtractor):
@@ -70,7 +70,7 @@ class HeadingSectionExtractor(BaseExtractor):
                 level = len(match.group(1))  # Number of # characters
                 text = match.group(2).strip()
                 
-                heading_id = str(uuid.uuid4())
+                heading_id = new_element_id()
                 position = self.calculate_position(content, i, i)
                 heading = Heading(
                     id=heading_id,
@@ -156,7 +156,7 @@ class HeadingSectionExtractor(BaseExtractor):
             section_content = '\n'.join(lines[start_line:end_line + 1]).strip()
             
             # Create section element
-            section_id = str(uuid.uuid4())
+            section_id = new_element_id()
             position = self.calculate_position(content, start_line, end_line)
             section = Section(
                 id=section_id,
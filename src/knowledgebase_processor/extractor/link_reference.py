@@ -2,11 +2,11 @@
 
 from typing import List, Dict, Optional, Tuple
 import re
-import uuid
 
 from ..models.content import Document, ContentElement
 from ..models.links import Link, Reference, Citation
 from .base import BaseExtractor
+from ..utils.id_generator import new_element_id
 
 
 class LinkReferenceExtractor(BaseExtractor):
@@ -95,7 +95,7 @@ class LinkReferenceExtractor(BaseExtractor):
                                   url.startswith('ftp://') or
                                   url.startswith('mailto:'))
                 
-                link_id = str(uuid.uuid4())
+                link_id = new_element_id()
                 link = Link(
                     id=link_id,
                     text=text,
@@ -145,7 +145,7 @@ class LinkReferenceExtractor(BaseExtractor):
                                       url.startswith('ftp://') or
                                       url.startswith('mailto:'))
                     
-                    link_id = str(uuid.uuid4())
+                    link_id = new_element_id()
                     link = Link(
                         id=link_id,
                         text=text,
@@ -185,7 +185,7 @@ class LinkReferenceExtractor(BaseExtractor):
                 url = match.group(2)
                 title = match.group(3)
                 
-                ref_id = str(uuid.uuid4())
+                ref_id = new_element_id()
                 reference = Reference(
                     id=ref_id,
                     key=key,
@@ -218,7 +218,7 @@ class LinkReferenceExtractor(BaseExtractor):
                 # Either (Author, Year) or [@citation] format
                 citation_text = match.group(1) or match.group(2)
                 
-                citation_id = str(uuid.uuid4())
+                citation_id = new_element_id()
                 citation = Citation(
                     id=citation_id,
                     text=citation_text,
@@ -2,13 +2,13 @@
 
 from typing import List, Dict, Any, Optional, Tuple
 import re
-import uuid
 
 from ..models.content import Document, ContentElement
 from ..models.markdown import (
     MarkdownList, ListItem, TodoItem, Table, TableCell
 )
 from .base import BaseExtractor
+from ..utils.id_generator import new_element_id
 from ..parser.markdown_parser import MarkdownParser
 
 
@@ -73,7 +73,7 @@ class ListTableExtractor(BaseExtractor):
             table_lines = table_text.strip().split('\n')
             
             # Create a new table
-            table_id = str(uuid.uuid4())
+            table_id = new_element_id()
             table = Table(
                 id=table_id,
                 content=table_text,
@@ -96,7 +96,7 @@ class ListTableExtractor(BaseExtractor):
                     
                     # Create cell objects
                     for col_idx, cell_text in enumerate(cells):
-                        cell_id = str(uuid.uuid4())
+                        cell_id = new_element_id()
                         cell = TableCell(
                             id=cell_id,
                             text=cell_text,
@@ -110,7 +110,7 @@ class ListTableExtractor(BaseExtractor):
                 
                 # Create header cell objects
                 for col_idx, header_text in enumerate(headers):
-                    cell_id = str(uuid.uuid4())
+                    cell_id = new_element_id()
                     cell = TableCell(
                         id=cell_id,
                         text=header_text,
@@ -2,9 +2,9 @@
 
 from pydantic import Field
 from typing import Optional, Dict, Any
-import uuid
 from .common import BaseKnowledgeModel
 from .preservation import ContentPreservationMixin
+from ..utils.id_generator import new_element_id
 
 
 class ContentElement(BaseKnowledgeModel, ContentPreservationMixin):
@@ -38,6 +38,6 @@ class ContentElement(BaseKnowledgeModel, ContentPreservationMixin):
         
         # Ensure we have an ID
         if not hasattr(self, 'id') or self.id is None:
-            self.id = str(uuid.uuid4())
+            self.id = new_element_id()
             
         self.preserve_content(original_text, self.position)
\ No newline at end of file
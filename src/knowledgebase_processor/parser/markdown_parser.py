@@ -1,7 +1,6 @@
 """Markdown parser implementation."""
 
 import re
-import uuid
 from typing import List, Dict, Any, Optional, Tuple
 from markdown_it import MarkdownIt
 from markdown_it.token import Token
@@ -12,6 +11,7 @@ from ..models.markdown import (
     ListItem, TodoItem, Table, TableCell, CodeBlock, Blockquote
 )
 from .base import BaseParser
+from ..utils.id_generator import new_element_id
 
 
 class MarkdownParser(BaseParser):
@@ -81,7 +81,7 @@ class MarkdownParser(BaseParser):
                 }
                 
                 # Create heading element
-                heading_id = str(uuid.uuid4())
+                heading_id = new_element_id()
                 heading = Heading(
                     id=heading_id,
                     level=level,
@@ -93,7 +93,7 @@ class MarkdownParser(BaseParser):
                 elements.append(heading)
                 
                 # Create a new section for this heading
-                section_id = str(uuid.uuid4())
+                section_id = new_element_id()
                 current_section = Section(
                     id=section_id,
                     content="",
@@ -112,7 +112,7 @@ class MarkdownParser(BaseParser):
             
             # Process lists
             elif token.type == 'bullet_list_open' or token.type == 'ordered_list_open':
-                list_id = str(uuid.uuid4())
+                list_id = new_element_id()
                 
                 # Determine the parent of this list
                 parent_id = None
@@ -175,7 +175,7 @@ class MarkdownParser(BaseParser):
                 else:
                     item_text = ""
                 
-                item_id = str(uuid.uuid4())
+                item_id = new_element_id()
                 if in_todo:
                     item = TodoItem(
                         id=item_id,
@@ -240,7 +240,7 @@ class MarkdownParser(BaseParser):
             
             # Process code blocks
             elif token.type == 'fence':
-                code_id = str(uuid.uuid4())
+                code_id = new_element_id()
                 code_block = CodeBlock(
                     id=code_id,
                     language=token.info,
@@ -258,7 +258,7 @@ class MarkdownParser(BaseParser):
             
             # Process tables
             elif token.type == 'table_open':
-                table_id = str(uuid.uuid4())
+                table_id = new_element_id()
                 current_table = Table(
                     id=table_id,
                     content="",
@@ -285,7 +285,7 @@ class MarkdownParser(BaseParser):
                                     header_row.append(header_text)
                                     
                                     # Create a cell for this header
-                                    cell_id = str(uuid.uuid4())
+                                    cell_id = new_element_id()
                                     cell = TableCell(
                                         id=cell_id,
                                         text=header_text,
@@ -318,7 +318,7 @@ class MarkdownParser(BaseParser):
                                             row.append(cell_text)
                                             
                                             # Create a cell for this data
-                                            cell_id = str(uuid.uuid4())
+                                            cell_id = new_element_id()
                                             cell = TableCell(
                                                 id=cell_id,
                                                 text=cell_text,
@@ -350,7 +350,7 @@ class MarkdownParser(BaseParser):
             # Process blockquotes
             elif token.type == 'blockquote_open':
                 current_blockquote_level += 1
-                blockquote_id = str(uuid.uuid4())
+                blockquote_id = new_element_id()
                 
                 # Find the content of this blockquote
                 j = i + 1
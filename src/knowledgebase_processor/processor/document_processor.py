@@ -14,6 +14,9 @@ from ..reader.reader import Reader
 
 logger = get_logger("knowledgebase_processor.processor.document")
 
+# Threads reading documents ahead of registration
+_READ_WORKERS = 8
+
 
 class DocumentProcessor:
     """Handles document reading, registration, and basic document operations."""
@@ -92,8 +95,8 @@ class DocumentProcessor:
         """
         documents = []
         
-        for file_path in reader.read_all_paths(pattern):
-            document = reader.read_file(file_path)
+        # Files are read ahead on a small thread pool while documents are registered
+        for file_path, document in reader.iter_documents(pattern, max_workers=_READ_WORKERS):
             
             # Create and register document entity
             kb_document = self.create_document_entity(
@@ -1,7 +1,8 @@
 """Pipeline orchestrator for coordinating document processing pipeline."""
 
+import multiprocessing
 from pathlib import Path
-from typing import Optional, List, Tuple
+from typing import Callable, Optional, List, Tuple
 import os
 
 from rdflib import Graph
@@ -15,11 +16,72 @@ from ..utils.logging import get_logger
 
 from .document_processor import DocumentProcessor
 from .entity_processor import EntityProcessor
+from .rdf_manifest import RdfManifest, manifest_settings
 from .rdf_processor import RdfProcessor
 
 
 logger = get_logger("knowledgebase_processor.processor.pipeline")
 
+# Smallest batch worth starting worker processes for
+_PARALLEL_MIN_DOCUMENTS = 32
+
+# Documents handed to a worker process at a time
+_PARALLEL_CHUNK_SIZE = 8
+
+# Pipeline and RDF output directory of a worker process, set once per worker
+# by _init_worker
+_worker_pipeline: Optional["ProcessingPipeline"] = None
+_worker_rdf_output_dir: Optional[Path] = None
+
+
+def _worker_context():
+    """Multiprocessing context for document workers.
+    
+    Workers are started from a fresh process (forkserver, or spawn where it
+    is unavailable) rather than forked from this one, which may be running
+    threads such as RDF load workers; forking a multi-threaded process can
+    deadlock the child.
+    """
+    if "forkserver" in multiprocessing.get_all_start_methods():
+        return multiprocessing.get_context("forkserver")
+    return multiprocessing.get_context("spawn")
+
+
+def _init_worker(pipeline: "ProcessingPipeline", rdf_output_dir: Optional[Path]) -> None:
+    """Receive the pipeline, with its document registry, once per worker process."""
+    global _worker_pipeline, _worker_rdf_output_dir
+    _worker_pipeline = pipeline
+    _worker_rdf_output_dir = rdf_output_dir
+
+
+def _process_batch_document(
+    task: Tuple[int, str, Document, KbDocument]
+) -> Tuple[int, Optional[DocumentMetadata], bool, Optional[str]]:
+    """Process one document in a worker process.
+    
+    Args:
+        task: Tuple of (index in the batch, document path, document, KB document)
+    
+    Returns:
+        Tuple of (index, document metadata, whether RDF was generated,
+        error message or None)
+    """
+    index, doc_path, document, kb_document = task
+    pipeline, rdf_output_dir = _worker_pipeline, _worker_rdf_output_dir
+    try:
+        entities, doc_metadata = pipeline.process_single_document(document, kb_document)
+        rdf_generated = False
+        if rdf_output_dir and pipeline.rdf_processor:
+            rdf_generated = pipeline.rdf_processor.process_document_to_rdf(
+                entities,
+                rdf_output_dir,
+                kb_document.original_path
+            )
+        return index, doc_metadata, rdf_generated, None
+    except Exception as e:
+        logger.error(f"Failed to process document {doc_path}: {e}", exc_info=True)
+        return index, None, False, str(e)
+
 
 class ProcessingStats:
     """Statistics for document processing operations."""
@@ -30,6 +92,7 @@ class ProcessingStats:
         self.processed_successfully = 0
         self.processing_errors = 0
         self.rdf_generated = 0
+        self.skipped_unchanged = 0
     
     def __str__(self) -> str:
         """String representation of statistics."""
@@ -38,7 +101,8 @@ class ProcessingStats:
             f"  Total documents: {self.total_documents}\n"
             f"  Processed successfully: {self.processed_successfully}\n"
             f"  Processing errors: {self.processing_errors}\n"
-            f"  RDF files generated: {self.rdf_generated}"
+            f"  RDF files generated: {self.rdf_generated}\n"
+            f"  Unchanged documents skipped: {self.skipped_unchanged}"
         )
 
 
@@ -108,16 +172,31 @@ class ProcessingPipeline:
         metadata_store: MetadataStoreInterface,
         pattern: str,
         knowledge_base_path: Path,
-        rdf_output_dir: Optional[Path] = None
+        rdf_output_dir: Optional[Path] = None,
+        workers: int = 1,
+        incremental: bool = False,
+        on_rdf_file: Optional[Callable[[Path], None]] = None
     ) -> ProcessingStats:
         """Process a batch of documents matching pattern.
         
+        With an RDF output directory and incremental set, a manifest of the
+        generated files is kept in it (see RdfManifest), and documents whose
+        content is unchanged since their RDF file was generated are not
+        processed again. Their metadata is left as saved by the earlier run.
+        
         Args:
             reader: Reader for file operations
             metadata_store: Store for document metadata
             pattern: File pattern to match
             knowledge_base_path: Base path of knowledge base
             rdf_output_dir: Optional directory for RDF output
+            workers: Number of processes extracting entities and generating
+                RDF (default: 1, in this process)
+            incremental: Whether to skip documents whose RDF output is current
+                (default: False; only applies with an RDF output directory)
+            on_rdf_file: Called in this process with the path of each RDF file
+                as soon as it is written, or found current, so callers can
+                consume files while the remaining documents are processed
             
         Returns:
             ProcessingStats with results
@@ -134,11 +213,67 @@ class ProcessingPipeline:
         stats.total_documents = len(documents_data)
         
         # Setup RDF output if specified
+        manifest = None
         if rdf_output_dir and self.rdf_processor:
             rdf_output_dir.mkdir(parents=True, exist_ok=True)
+            if incremental:
+                manifest = RdfManifest.load(
+                    rdf_output_dir,
+                    manifest_settings(
+                        self.rdf_processor.serialization_format,
+                        (kb_document.original_path for _, _, kb_document in documents_data),
+                        self._analyzer_names()
+                    )
+                )
+                changed = []
+                for data in documents_data:
+                    relative_path = data[2].original_path
+                    if not manifest.is_current(relative_path, data[0], data[1].content):
+                        changed.append(data)
+                        continue
+                    rdf_file = manifest.entries[relative_path].get("rdf_file")
+                    if rdf_file and on_rdf_file is not None:
+                        on_rdf_file(rdf_output_dir / rdf_file)
+                stats.skipped_unchanged = len(documents_data) - len(changed)
+                if stats.skipped_unchanged:
+                    logger.info(f"Skipping {stats.skipped_unchanged} documents with current RDF output.")
+                documents_data = changed
         
         # Phase 2: Process each document
         logger.info("Phase 2: Processing documents for entities and RDF")
+        try:
+            if workers > 1 and len(documents_data) >= _PARALLEL_MIN_DOCUMENTS:
+                self._process_documents_in_workers(
+                    documents_data, metadata_store, rdf_output_dir, workers, stats, manifest, on_rdf_file
+                )
+            else:
+                self._process_documents_sequentially(
+                    documents_data, metadata_store, rdf_output_dir, stats, manifest, on_rdf_file
+                )
+        finally:
+            if manifest is not None:
+                manifest.save()
+        
+        return stats
+    
+    def _analyzer_names(self) -> List[str]:
+        """Names of the enabled analyzers, whose results end up in the RDF output."""
+        return [
+            type(analyzer).__name__
+            for analyzer in self.entity_processor.named_entity_processor.analyzers
+            if getattr(analyzer, "enabled", True) is not False
+        ]
+    
+    def _process_documents_sequentially(
+        self,
+        documents_data: List[Tuple[str, Document, KbDocument]],
+        metadata_store: MetadataStoreInterface,
+        rdf_output_dir: Optional[Path],
+        stats: ProcessingStats,
+        manifest: Optional[RdfManifest] = None,
+        on_rdf_file: Optional[Callable[[Path], None]] = None
+    ) -> None:
+        """Process registered documents one after another in this process."""
         for doc_path, document, kb_document in documents_data:
             try:
                 # Process document
@@ -149,6 +284,7 @@ class ProcessingPipeline:
                 )
                 
                 # Generate RDF if configured
+                success = False
                 if rdf_output_dir and self.rdf_processor:
                     success = self.rdf_processor.process_document_to_rdf(
                         entities,
@@ -159,12 +295,84 @@ class ProcessingPipeline:
                         stats.rdf_generated += 1
                 
                 stats.processed_successfully += 1
+                if manifest is not None:
+                    self._record_in_manifest(manifest, doc_path, document, kb_document, success)
+                if success and on_rdf_file is not None:
+                    on_rdf_file(rdf_output_dir / self.rdf_processor.output_filename(kb_document.original_path))
                 
             except Exception as e:
                 logger.error(f"Failed to process document {doc_path}: {e}", exc_info=True)
                 stats.processing_errors += 1
+                if manifest is not None:
+                    manifest.discard(kb_document.original_path)
+    
+    def _record_in_manifest(
+        self,
+        manifest: RdfManifest,
+        doc_path: str,
+        document: Document,
+        kb_document: KbDocument,
+        rdf_generated: bool
+    ) -> None:
+        """Record a processed document and the RDF file generated for it, if any."""
+        rdf_file = self.rdf_processor.output_filename(kb_document.original_path) if rdf_generated else None
+        manifest.record(kb_document.original_path, doc_path, document.content, rdf_file)
+    
+    def _process_documents_in_workers(
+        self,
+        documents_data: List[Tuple[str, Document, KbDocument]],
+        metadata_store: MetadataStoreInterface,
+        rdf_output_dir: Optional[Path],
+        workers: int,
+        stats: ProcessingStats,
+        manifest: Optional[RdfManifest] = None,
+        on_rdf_file: Optional[Callable[[Path], None]] = None
+    ) -> None:
+        """Process registered documents in a pool of worker processes.
         
-        return stats
+        Entity extraction and RDF generation are CPU-bound and independent per
+        document, so they run in the workers, which receive the pipeline and
+        the document registry once when started and the documents with their
+        tasks. Metadata is saved here, in the parent, since the store's
+        connection cannot be shared across processes.
+        """
+        tasks = (
+            (index, doc_path, document, kb_document)
+            for index, (doc_path, document, kb_document) in enumerate(documents_data)
+        )
+        with _worker_context().Pool(
+            min(workers, len(documents_data)),
+            initializer=_init_worker,
+            initargs=(self, rdf_output_dir),
+        ) as pool:
+            results = pool.imap_unordered(
+                _process_batch_document,
+                tasks,
+                chunksize=_PARALLEL_CHUNK_SIZE
+            )
+            for index, doc_metadata, rdf_generated, error in results:
+                doc_path, document, kb_document = documents_data[index]
+                if error is not None:
+                    stats.processing_errors += 1
+                    if manifest is not None:
+                        manifest.discard(kb_document.original_path)
+                    continue
+                try:
+                    if metadata_store:
+                        metadata_store.save(doc_metadata)
+                except Exception as e:
+                    logger.error(f"Failed to process document {doc_path}: {e}", exc_info=True)
+                    stats.processing_errors += 1
+                    if manifest is not None:
+                        manifest.discard(kb_document.original_path)
+                    continue
+                if rdf_generated:
+                    stats.rdf_generated += 1
+                stats.processed_successfully += 1
+                if manifest is not None:
+                    self._record_in_manifest(manifest, doc_path, document, kb_document, rdf_generated)
+                if rdf_generated and on_rdf_file is not None:
+                    on_rdf_file(rdf_output_dir / self.rdf_processor.output_filename(kb_document.original_path))
     
     def process_content_to_graph(
         self,
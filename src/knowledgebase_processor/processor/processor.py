@@ -1,7 +1,7 @@
 """Processor implementation for processing knowledge base content."""
 
 from pathlib import Path
-from typing import Optional
+from typing import Callable, Optional
 
 from rdflib import Graph
 
@@ -58,7 +58,18 @@ class Processor:
             else False
         )
         if analyze_entities:
-            self.entity_processor.register_analyzer(EntityRecognizer(enabled=True))
+            self.enable_entity_analysis()
+
+    def enable_entity_analysis(self):
+        """Register the named entity recognizer if it is not registered yet.
+        
+        Lets entity analysis be switched on after construction without
+        rebuilding the processor and its registered extractors and analyzers.
+        """
+        analyzers = self.entity_processor.named_entity_processor.analyzers
+        if any(isinstance(analyzer, EntityRecognizer) and analyzer.enabled for analyzer in analyzers):
+            return
+        self.entity_processor.register_analyzer(EntityRecognizer(enabled=True))
 
     def register_extractor(self, extractor):
         """Register an extractor component."""
@@ -92,6 +103,25 @@ class Processor:
             self.document_processor.register_document(kb_document)
         return kb_document
 
+    def _processing_workers(self) -> int:
+        """Number of processes to process documents with.
+        
+        Worker processes are opt-in: the config's processing_workers when
+        set, otherwise 1, processing in this process.
+        """
+        workers = getattr(self.config, "processing_workers", None) if self.config else None
+        if isinstance(workers, int) and workers > 0:
+            return workers
+        return 1
+
+    def _incremental(self) -> bool:
+        """Whether documents whose RDF output is current are skipped.
+        
+        Incremental runs are opt-in through the config's incremental_rdf,
+        since skipped documents do not have their metadata saved again.
+        """
+        return getattr(self.config, "incremental_rdf", False) is True
+
     def process_and_generate_rdf(
         self,
         reader: Reader,
@@ -99,24 +129,42 @@ class Processor:
         pattern: str,
         knowledge_base_path: Path,
         rdf_output_dir_str: Optional[str] = None,
+        rdf_serialization: Optional[str] = None,
+        on_rdf_file: Optional[Callable[[Path], None]] = None,
     ) -> int:
         """Processes all documents, builds a registry, extracts entities, and generates RDF.
         
         This method has been refactored to use the modular pipeline architecture.
+        RDF files are written in rdf_serialization format ("turtle", "nt" or
+        "xml") for this call only; if not given, the RDF processor's own
+        format is used.
+        on_rdf_file, if given, is called with each RDF file's path as soon as
+        the file is written.
         """
         logger.info(f"Starting processing with knowledge base path: {knowledge_base_path}")
         
         # Convert rdf_output_dir_str to Path if provided
         rdf_output_dir = Path(rdf_output_dir_str) if rdf_output_dir_str else None
-        
-        # Use the pipeline to process documents
-        stats = self.pipeline.process_documents_batch(
-            reader=reader,
-            metadata_store=metadata_store,
-            pattern=pattern,
-            knowledge_base_path=knowledge_base_path,
-            rdf_output_dir=rdf_output_dir
-        )
+        # The format only applies to this call; the shared RDF processor's
+        # own format is restored afterwards
+        previous_serialization = self.rdf_processor.serialization_format
+        if rdf_serialization:
+            self.rdf_processor.serialization_format = rdf_serialization
+        
+        try:
+            # Use the pipeline to process documents
+            stats = self.pipeline.process_documents_batch(
+                reader=reader,
+                metadata_store=metadata_store,
+                pattern=pattern,
+                knowledge_base_path=knowledge_base_path,
+                rdf_output_dir=rdf_output_dir,
+                workers=self._processing_workers(),
+                incremental=self._incremental(),
+                on_rdf_file=on_rdf_file
+            )
+        finally:
+            self.rdf_processor.serialization_format = previous_serialization
         
         # Log final statistics
         logger.info(f"Processing completed: {stats}")
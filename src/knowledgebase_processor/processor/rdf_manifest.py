@@ -0,0 +1,158 @@
+"""Manifest of generated RDF files, used to skip re-processing unchanged documents."""
+
+import hashlib
+import json
+import os
+from pathlib import Path
+from typing import Any, Dict, Iterable, Optional
+
+from .. import __version__
+from ..utils.logging import get_logger
+
+
+logger = get_logger("knowledgebase_processor.processor.rdf_manifest")
+
+# Name of the manifest file kept in the RDF output directory
+MANIFEST_FILENAME = ".kbp_cache.json"
+
+# Bumped whenever the manifest layout or the meaning of its entries changes
+_MANIFEST_VERSION = 1
+
+
+def content_hash(content: str) -> str:
+    """Hash document content for change detection."""
+    return hashlib.blake2b(content.encode("utf-8"), digest_size=16).hexdigest()
+
+
+def manifest_settings(
+    serialization_format: str,
+    document_paths: Iterable[str],
+    analyzers: Iterable[str] = (),
+) -> str:
+    """Fingerprint the settings a document's RDF output depends on besides its content.
+
+    Wikilinks are resolved against all registered documents, so adding,
+    removing or renaming any document invalidates every entry, as does a
+    change of serialization format, of the analyzers run on the documents
+    (e.g. entity analysis switched on, or left off because its model was
+    missing), or of the package version, whose converter and ID code shape
+    the output.
+
+    Args:
+        serialization_format: RDF serialization format of the output files
+        document_paths: Paths of all registered documents
+        analyzers: Names of the enabled analyzers
+    """
+    paths_hash = hashlib.blake2b("\n".join(sorted(document_paths)).encode("utf-8"), digest_size=16)
+    return f"{__version__}:{serialization_format}:{','.join(sorted(analyzers))}:{paths_hash.hexdigest()}"
+
+
+class RdfManifest:
+    """Records, per document, the source state its RDF file was generated from.
+
+    Entries map a document's path relative to the knowledge base to its
+    modification time, size and content hash, and the name of the RDF file
+    generated from it (None if the document produced no triples). A document
+    is current if its file's modification time and size are unchanged, or
+    failing that its content hash is, and its RDF file still exists.
+    """
+
+    def __init__(self, output_dir: Path, settings: str):
+        """Initialize an empty manifest.
+
+        Args:
+            output_dir: RDF output directory the manifest describes
+            settings: Fingerprint from manifest_settings for this run
+        """
+        self.output_dir = output_dir
+        self.path = output_dir / MANIFEST_FILENAME
+        self.settings = settings
+        self.entries: Dict[str, Dict[str, Any]] = {}
+
+    @classmethod
+    def load(cls, output_dir: Path, settings: str) -> "RdfManifest":
+        """Load the manifest of an output directory.
+
+        Entries written with different settings, or an unreadable manifest,
+        are discarded, so every document is processed again.
+        """
+        manifest = cls(output_dir, settings)
+        try:
+            with open(manifest.path, "rb") as f:
+                data = json.load(f)
+        except FileNotFoundError:
+            return manifest
+        except (OSError, ValueError) as e:
+            logger.warning(f"Ignoring unreadable RDF manifest {manifest.path}: {e}")
+            return manifest
+
+        if (
+            isinstance(data, dict)
+            and data.get("version") == _MANIFEST_VERSION
+            and data.get("settings") == settings
+            and isinstance(data.get("documents"), dict)
+        ):
+            manifest.entries = data["documents"]
+        return manifest
+
+    def is_current(self, relative_path: str, file_path: str, content: str) -> bool:
+        """Check whether a document's RDF output is up to date.
+
+        Args:
+            relative_path: Document path relative to the knowledge base
+            file_path: Path of the document's file, for its modification time
+            content: Document content as read in this run
+        """
+        entry = self.entries.get(relative_path)
+        if entry is None:
+            return False
+        rdf_file = entry.get("rdf_file")
+        if rdf_file and not (self.output_dir / rdf_file).is_file():
+            return False
+        try:
+            stat = os.stat(file_path)
+        except OSError:
+            stat = None
+        if stat is not None and entry.get("mtime_ns") == stat.st_mtime_ns and entry.get("size") == stat.st_size:
+            return True
+        if entry.get("hash") != content_hash(content):
+            return False
+        # Unchanged content with a new modification time (e.g. touched or
+        # checked out again); remember the new stat for the next run
+        if stat is not None:
+            entry["mtime_ns"] = stat.st_mtime_ns
+            entry["size"] = stat.st_size
+        return True
+
+    def record(self, relative_path: str, file_path: str, content: str, rdf_file: Optional[str]) -> None:
+        """Record that a document's RDF output was generated from its current content."""
+        try:
+            stat = os.stat(file_path)
+            mtime_ns, size = stat.st_mtime_ns, stat.st_size
+        except OSError:
+            mtime_ns, size = None, None
+        self.entries[relative_path] = {
+            "mtime_ns": mtime_ns,
+            "size": size,
+            "hash": content_hash(content),
+            "rdf_file": rdf_file,
+        }
+
+    def discard(self, relative_path: str) -> None:
+        """Forget a document, so it is processed again next time."""
+        self.entries.pop(relative_path, None)
+
+    def save(self) -> None:
+        """Write the manifest, replacing the previous one atomically."""
+        data = {"version": _MANIFEST_VERSION, "settings": self.settings, "documents": self.entries}
+        temp_path = self.path.with_name(f"{MANIFEST_FILENAME}.{os.getpid()}.tmp")
+        try:
+            with open(temp_path, "w", encoding="utf-8") as f:
+                json.dump(data, f)
+            os.replace(temp_path, self.path)
+        except OSError as e:
+            logger.warning(f"Failed to save RDF manifest {self.path}: {e}")
+            try:
+                os.unlink(temp_path)
+            except OSError:
+                pass
@@ -13,17 +13,23 @@ from ..utils.logging import get_logger
 
 logger = get_logger("knowledgebase_processor.processor.rdf")
 
+# File suffix of each supported per-document serialization format
+_FILE_SUFFIXES = {"turtle": ".ttl", "nt": ".nt", "xml": ".xml"}
+
 
 class RdfProcessor:
     """Handles RDF graph generation and serialization."""
     
-    def __init__(self, rdf_converter: Optional[RdfConverter] = None):
+    def __init__(self, rdf_converter: Optional[RdfConverter] = None, serialization_format: str = "turtle"):
         """Initialize RdfProcessor.
         
         Args:
             rdf_converter: Optional RdfConverter instance, creates new if not provided
+            serialization_format: Format of the per-document RDF files ("turtle",
+                "nt" or "xml"); N-Triples is the fastest to write and to load
         """
         self.rdf_converter = rdf_converter or RdfConverter()
+        self.serialization_format = serialization_format
     
     def create_graph(self) -> Graph:
         """Create a new RDF graph with standard namespace bindings.
@@ -52,16 +58,11 @@ class RdfProcessor:
         Returns:
             RDF graph containing all entities
         """
-        graph = self.create_graph()
-        
-        for entity in entities:
-            entity_graph = self.rdf_converter.kb_entity_to_graph(
-                entity,
-                base_uri_str=base_uri_str or str(KB)
-            )
-            graph += entity_graph
-        
-        return graph
+        return self.rdf_converter.kb_entities_to_graph(
+            entities,
+            graph=self.create_graph(),
+            base_uri_str=base_uri_str or str(KB)
+        )
     
     def serialize_graph(
         self,
@@ -88,14 +89,26 @@ class RdfProcessor:
             output_path.parent.mkdir(parents=True, exist_ok=True)
             
             # Serialize graph
-            graph.serialize(destination=str(output_path), format=format)
-            logger.info(f"Saved RDF graph to {output_path} ({len(graph)} triples)")
+            graph.serialize(destination=str(output_path), format=format, encoding="utf-8")
+            logger.debug(f"Saved RDF graph to {output_path} ({len(graph)} triples)")
             return True
             
         except Exception as e:
             logger.error(f"Failed to serialize graph to {output_path}: {e}", exc_info=True)
             return False
     
+    def output_filename(self, document_path: str) -> str:
+        """Name of the RDF file generated for a document.
+        
+        Args:
+            document_path: Original document path
+            
+        Returns:
+            The document's file name with the serialization format's suffix
+        """
+        suffix = _FILE_SUFFIXES.get(self.serialization_format, ".ttl")
+        return Path(document_path).with_suffix(suffix).name
+    
     def process_document_to_rdf(
         self,
         entities: List[KbBaseEntity],
@@ -123,11 +136,10 @@ class RdfProcessor:
                 return False
             
             # Determine output filename
-            output_filename = Path(document_path).with_suffix(".ttl").name
-            output_path = output_dir / output_filename
+            output_path = output_dir / self.output_filename(document_path)
             
             # Serialize to file
-            return self.serialize_graph(graph, output_path)
+            return self.serialize_graph(graph, output_path, format=self.serialization_format)
             
         except Exception as e:
             logger.error(f"Failed to process RDF for {document_path}: {e}", exc_info=True)
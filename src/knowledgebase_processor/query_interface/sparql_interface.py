@@ -1,16 +1,561 @@
 """SPARQL Query Interface for interacting with SPARQL endpoints."""
 
-import json
+import asyncio
+import gzip
+import io
+import itertools
 import logging
-from typing import Dict, List, Any, Optional, Union
+import random
+import re
+import sys
+import threading
+import time
+import zlib
+from collections import OrderedDict, deque
+from concurrent.futures import Future, ThreadPoolExecutor
+from pathlib import Path
+from typing import BinaryIO, Callable, Dict, Iterable, Iterator, List, Any, Optional, Tuple, Union
 from urllib.parse import urljoin
 
-from SPARQLWrapper import SPARQLWrapper, JSON, XML, TURTLE, N3, RDFXML
+import httpx
 from SPARQLWrapper.SPARQLExceptions import SPARQLWrapperException
-from rdflib import Graph
+from rdflib import BNode, Graph, Literal, URIRef
+from rdflib.plugins.serializers.nt import _nt_row
+
+try:
+    from orjson import loads as _json_loads
+except ImportError:
+    from json import loads as _json_loads
+
+try:
+    import h2  # noqa: F401  (enables HTTP/2 support in httpx)
+    _HTTP2_AVAILABLE = True
+except ImportError:
+    _HTTP2_AVAILABLE = False
+
+try:
+    import pyoxigraph
+except ImportError:
+    pyoxigraph = None
 
 logger = logging.getLogger(__name__)
 
+# Number of per-document delete confirmations logged during a parallel delete.
+_DELETE_LOG_LIMIT = 10
+
+# XSD datatype IRIs recognised by _extract_value
+_XSD_INTEGER = sys.intern('http://www.w3.org/2001/XMLSchema#integer')
+_XSD_DECIMAL = sys.intern('http://www.w3.org/2001/XMLSchema#decimal')
+_XSD_DOUBLE = sys.intern('http://www.w3.org/2001/XMLSchema#double')
+_XSD_FLOAT = sys.intern('http://www.w3.org/2001/XMLSchema#float')
+_XSD_BOOLEAN = sys.intern('http://www.w3.org/2001/XMLSchema#boolean')
+_XSD_STRING = 'http://www.w3.org/2001/XMLSchema#string'
+
+# The xsd:string datatype written as a full IRI or as a prefixed name; a match
+# elsewhere (e.g. in a literal) only sends the data to the slower parser
+_XSD_STRING_MENTION_RE = re.compile(rb'XMLSchema#string|:string\b')
+
+# An N-Triples line whose object is a literal declared as xsd:string; the
+# object ends the triple, so the datatype is anchored to the line end
+_XSD_STRING_IRI = b'<http://www.w3.org/2001/XMLSchema#string>'
+_NT_EXPLICIT_STRING_RE = re.compile(
+    rb'"\^\^<http://www\.w3\.org/2001/XMLSchema#string>\s*\.\s*(?:#.*)?$'
+)
+
+# Bytes of RDF data read at a time when scanning files or parsing N-Triples
+# streams with pyoxigraph
+_PARSE_BLOCK_SIZE = 1 << 20
+
+# Value kinds used to pick a converter for a literal by index
+_KIND_PLAIN, _KIND_INT, _KIND_FLOAT, _KIND_BOOL = range(4)
+
+_DATATYPE_KINDS = {
+    _XSD_INTEGER: _KIND_INT,
+    _XSD_DECIMAL: _KIND_FLOAT,
+    _XSD_DOUBLE: _KIND_FLOAT,
+    _XSD_FLOAT: _KIND_FLOAT,
+    _XSD_BOOLEAN: _KIND_BOOL,
+}
+
+
+def _to_bool(value: str) -> bool:
+    return value.lower() in ('true', '1')
+
+
+# Converters indexed by value kind
+_CONVERTERS = (str, int, float, _to_bool)
+
+# Number of N-Triples lines sent per chunk when streaming INSERT DATA bodies
+_UPLOAD_CHUNK_TRIPLES = 1000
+
+# Default number of triples sent per INSERT DATA request by load_data
+_LOAD_CHUNK_SIZE = 10_000
+
+# Blank node labels in N-Triples text; a match inside a literal only makes
+# chunks keep more lines together
+_BNODE_LABEL_RE = re.compile(r'_:\S+')
+
+# Media types used for SPARQL protocol requests and responses
+_SPARQL_QUERY = 'application/sparql-query'
+_SPARQL_UPDATE = 'application/sparql-update'
+_SPARQL_RESULTS_JSON = 'application/sparql-results+json'
+_TURTLE = 'text/turtle'
+_N_TRIPLES = 'application/n-triples'
+
+# Accept header for graph results. N-Triples is preferred because it is
+# line-oriented and parses faster; it is also valid Turtle for raw callers.
+_GRAPH_ACCEPT = f'{_N_TRIPLES}, {_TURTLE};q=0.5'
+
+# rdflib parser format by response media type
+_GRAPH_FORMATS = {
+    _N_TRIPLES: 'nt',
+    _TURTLE: 'turtle',
+}
+
+# Media types of RDF files uploaded unparsed, by rdflib format name
+_RDF_MEDIA_TYPES = {
+    'nt': _N_TRIPLES,
+    'ntriples': _N_TRIPLES,
+    'turtle': _TURTLE,
+    'ttl': _TURTLE,
+    'xml': 'application/rdf+xml',
+}
+
+# Bytes read from an RDF file per chunk of a streamed upload
+_FILE_UPLOAD_CHUNK_SIZE = 256 * 1024
+
+# pyoxigraph parser formats by rdflib format name
+_OXIGRAPH_FORMATS = {
+    'nt': 'N_TRIPLES',
+    'ntriples': 'N_TRIPLES',
+    'turtle': 'TURTLE',
+    'ttl': 'TURTLE',
+    'xml': 'RDF_XML',
+    'application/rdf+xml': 'RDF_XML',
+}
+
+# Idle connections kept open for reuse by the HTTP client
+_MAX_KEEPALIVE_CONNECTIONS = 16
+# Upper bound on concurrent connections opened by the async client
+_MAX_ASYNC_CONNECTIONS = 32
+
+# Number of SELECT/ASK results kept when query caching is enabled
+_QUERY_CACHE_SIZE = 256
+
+# Upload bodies at least this large are gzip-compressed when compress_uploads is set
+_COMPRESS_MIN_SIZE = 64 * 1024
+# gzip level for uploads; N-Triples compresses well even at the fastest level
+_COMPRESS_LEVEL = 1
+
+# Transient statuses on which read-only queries are retried
+_RETRY_STATUS_CODES = frozenset({502, 503, 504})
+# Default number of query retries, and the backoff bounds in seconds
+_QUERY_RETRIES = 3
+_RETRY_BASE_DELAY = 0.1
+_RETRY_MAX_DELAY = 5.0
+_HEALTH_CHECK_QUERY = "ASK {}"
+# Query-string parameter that makes a store abort a query on its side, and
+# the factor converting the timeout in seconds to its unit, by store kind
+_SERVER_TIMEOUT_PARAMS = {
+    "virtuoso": ("timeout", 1000),
+    "fuseki": ("timeout", 1),
+    "blazegraph": ("maxQueryTimeMillis", 1000),
+}
+
+# Fixed queries used by the store inspection helpers
+_LIST_GRAPHS_QUERY = """
+SELECT DISTINCT ?graph
+WHERE {
+    GRAPH ?graph { ?s ?p ?o }
+}
+ORDER BY ?graph
+"""
+
+_COUNT_TRIPLES_DEFAULT_QUERY = """
+SELECT (COUNT(*) as ?count)
+WHERE { ?s ?p ?o }
+"""
+
+_COUNT_TRIPLES_GRAPH_QUERY = """
+SELECT (COUNT(*) as ?count)
+WHERE {{
+    GRAPH <{graph_uri}> {{ ?s ?p ?o }}
+}}
+"""
+
+# void:triples statistics are read only for the graph being counted: the
+# named graph itself, or the default graph of the service description's
+# default dataset, never VoID data the store holds about other datasets
+_VOID_TRIPLES_DEFAULT_QUERY = """
+PREFIX sd: <http://www.w3.org/ns/sparql-service-description#>
+PREFIX void: <http://rdfs.org/ns/void#>
+SELECT ?count
+WHERE {
+    ?service sd:defaultDataset ?dataset .
+    ?dataset sd:defaultGraph ?graph .
+    ?graph void:triples ?count .
+}
+LIMIT 1
+"""
+
+_VOID_TRIPLES_GRAPH_QUERY = """
+PREFIX void: <http://rdfs.org/ns/void#>
+SELECT ?count
+WHERE {{ <{graph_uri}> void:triples ?count }}
+LIMIT 1
+"""
+_KEEPALIVE_EXPIRY = 60
+
+
+class _ByteStream(io.RawIOBase):
+    """Read-only file object over an iterator of byte chunks."""
+    
+    def __init__(self, chunks: Iterable[bytes]):
+        self._chunks = iter(chunks)
+        self._pending = b''
+    
+    def readable(self) -> bool:
+        return True
+    
+    def readinto(self, buffer) -> int:
+        while not self._pending:
+            try:
+                self._pending = next(self._chunks)
+            except StopIteration:
+                return 0
+        size = min(len(buffer), len(self._pending))
+        buffer[:size] = self._pending[:size]
+        self._pending = self._pending[size:]
+        return size
+
+
+def _oxigraph_term(term: Any, bnodes: Dict[str, BNode]) -> Union[URIRef, BNode, Literal]:
+    """Convert a pyoxigraph term to the equivalent rdflib term.
+    
+    Blank nodes get a fresh rdflib node per label, remembered in bnodes so
+    that the label refers to the same node throughout a document.
+    """
+    if isinstance(term, pyoxigraph.NamedNode):
+        return URIRef(term.value)
+    if isinstance(term, pyoxigraph.BlankNode):
+        node = bnodes.get(term.value)
+        if node is None:
+            node = bnodes[term.value] = BNode()
+        return node
+    if isinstance(term, pyoxigraph.Literal):
+        if term.language:
+            return Literal(term.value, lang=term.language)
+        datatype = term.datatype.value
+        if datatype == _XSD_STRING:
+            # pyoxigraph reports plain literals as xsd:string
+            return Literal(term.value)
+        return Literal(term.value, datatype=URIRef(datatype))
+    raise ValueError(f"Unsupported RDF term: {term!r}")
+
+
+def _line_blocks(stream: BinaryIO) -> Iterator[bytes]:
+    """Yield the data of a binary stream in blocks of whole lines."""
+    pending = b''
+    while True:
+        chunk = stream.read(_PARSE_BLOCK_SIZE)
+        if not chunk:
+            break
+        data = pending + chunk
+        end = max(data.rfind(b'\n'), data.rfind(b'\r')) + 1
+        if end:
+            yield data[:end]
+        pending = data[end:]
+    if pending:
+        yield pending
+
+
+def _add_ntriples(graph: Graph, stream: BinaryIO) -> None:
+    """Parse an N-Triples stream into graph with pyoxigraph, a block of lines at a time.
+    
+    Memory use is bounded by the block size rather than the size of the data.
+    Every triple is on a line of its own, so in a block declaring literals
+    as xsd:string the parsed triples are matched to their lines, and those
+    literals keep their datatype as rdflib's parser would keep it.
+    """
+    bnodes: Dict[str, BNode] = {}
+    n_triples = pyoxigraph.RdfFormat.N_TRIPLES
+    
+    def to_term(term: Any) -> Union[URIRef, BNode, Literal]:
+        return _oxigraph_term(term, bnodes)
+    
+    for block in _line_blocks(stream):
+        # Labels are kept, so blank nodes shared across blocks stay one node
+        quads = pyoxigraph.parse(input=block, format=n_triples, rename_blank_nodes=False)
+        if _XSD_STRING_IRI not in block:
+            graph.addN(
+                (to_term(quad.subject), to_term(quad.predicate), to_term(quad.object), graph)
+                for quad in quads
+            )
+            continue
+        lines = [line for line in block.splitlines() if line.strip() and not line.lstrip().startswith(b'#')]
+        for quad, line in zip(quads, lines):
+            rdf_object = to_term(quad.object)
+            if _XSD_STRING_IRI in line and _NT_EXPLICIT_STRING_RE.search(line):
+                rdf_object = Literal(quad.object.value, datatype=URIRef(_XSD_STRING))
+            graph.add((to_term(quad.subject), to_term(quad.predicate), rdf_object))
+
+
+def _file_mentions_xsd_string(file_path: str) -> bool:
+    """Check whether a file may declare literals as xsd:string, reading it in blocks."""
+    tail = b''
+    with open(file_path, 'rb') as f:
+        while True:
+            block = f.read(_PARSE_BLOCK_SIZE)
+            if not block:
+                return False
+            if _XSD_STRING_MENTION_RE.search(tail + block):
+                return True
+            tail = block[-32:]
+
+
+def _parse_graph(source: Any, format: str, base_iri: Optional[str] = None) -> Graph:
+    """Parse RDF data into an RDFLib graph.
+    
+    Uses the Rust-based pyoxigraph parser when it is installed and supports the
+    format, which is several times faster than rdflib's pure-Python parsers on
+    large inputs; otherwise parses with rdflib. Either way the data is read
+    incrementally rather than all at once, and the result is the same graph
+    rdflib would produce:
+    
+    - N-Triples is parsed with pyoxigraph a block of lines at a time; literals
+      declared as xsd:string keep that datatype, although pyoxigraph reports
+      plain literals as xsd:string too.
+    - Files in other formats are parsed with pyoxigraph unless a first pass
+      over them finds xsd:string mentioned, and with rdflib if it does.
+    - Streams in other formats, which can be read only once, are parsed with
+      rdflib.
+    
+    Args:
+        source: Path of a file, or a binary file object to read from
+        format: rdflib format name of the data
+        base_iri: Base IRI for resolving relative IRIs
+    """
+    graph = Graph()
+    oxigraph_format = _OXIGRAPH_FORMATS.get(format) if pyoxigraph is not None else None
+    if oxigraph_format == 'N_TRIPLES':
+        if isinstance(source, str):
+            with open(source, 'rb') as f:
+                _add_ntriples(graph, f)
+        else:
+            _add_ntriples(graph, source)
+        return graph
+    if oxigraph_format is None or not isinstance(source, str) or _file_mentions_xsd_string(source):
+        graph.parse(source=source, format=format, publicID=base_iri)
+        return graph
+    
+    quads = pyoxigraph.parse(path=source, format=getattr(pyoxigraph.RdfFormat, oxigraph_format),
+                             base_iri=base_iri or Path(source).absolute().as_uri())
+    bnodes: Dict[str, BNode] = {}
+    graph.addN(
+        (_oxigraph_term(quad.subject, bnodes), _oxigraph_term(quad.predicate, bnodes),
+         _oxigraph_term(quad.object, bnodes), graph)
+        for quad in quads
+    )
+    return graph
+
+
+def _parse_file(file_path: str, format: str) -> Union[Graph, Exception]:
+    """Parse an RDF file, returning the exception instead of raising it."""
+    try:
+        return _parse_graph(file_path, format)
+    except Exception as e:
+        return e
+
+
+def _parse_files(file_paths: Iterable[str], format: str, workers: int = 1) -> Iterator[Tuple[str, Union[Graph, Exception]]]:
+    """Parse RDF files in order, yielding each path with its graph or parse error.
+    
+    With workers > 1, up to two files per worker are parsed ahead on a thread
+    pool while the caller handles the current one, so file reads and
+    pyoxigraph's native parsing overlap with batching and sending; rdflib's
+    pure-Python parsers gain little from it.
+    """
+    if workers <= 1:
+        for file_path in file_paths:
+            yield file_path, _parse_file(file_path, format)
+        return
+    
+    pending: "deque[Tuple[str, Future]]" = deque()
+    executor = ThreadPoolExecutor(max_workers=workers)
+    try:
+        for file_path in file_paths:
+            pending.append((file_path, executor.submit(_parse_file, file_path, format)))
+            if len(pending) >= 2 * workers:
+                file_path, future = pending.popleft()
+                yield file_path, future.result()
+        while pending:
+            file_path, future = pending.popleft()
+            yield file_path, future.result()
+    finally:
+        executor.shutdown(wait=True, cancel_futures=True)
+
+
+def _server_timeout_params(server_kind: Optional[str], timeout: int) -> Optional[Dict[str, str]]:
+    """Return the query-string parameters passing a query timeout to the store, if it is known."""
+    param = _SERVER_TIMEOUT_PARAMS.get(server_kind.lower()) if server_kind else None
+    if param is None or not timeout:
+        return None
+    name, factor = param
+    return {name: str(int(timeout * factor))}
+
+
+def _retry_delay(attempt: int) -> float:
+    """Return the backoff before retry number attempt (from 0), with full jitter."""
+    return random.uniform(0, min(_RETRY_MAX_DELAY, _RETRY_BASE_DELAY * 2 ** attempt))
+
+
+def _gzip_chunks(chunks: Iterable[bytes]) -> Iterator[bytes]:
+    """Compress a stream of byte chunks into a gzip stream."""
+    compressor = zlib.compressobj(_COMPRESS_LEVEL, zlib.DEFLATED, 16 + zlib.MAX_WBITS)
+    for chunk in chunks:
+        compressed = compressor.compress(chunk)
+        if compressed:
+            yield compressed
+    yield compressor.flush()
+
+
+def _compress_body(content: Union[bytes, Iterable[bytes]]) -> Tuple[Union[bytes, Iterable[bytes]], bool]:
+    """Gzip a request body if it reaches _COMPRESS_MIN_SIZE.
+    
+    Streamed bodies are buffered only until the threshold is reached, then
+    compressed as they are sent.
+    
+    Returns:
+        The body to send and whether it was compressed
+    """
+    if isinstance(content, bytes):
+        if len(content) < _COMPRESS_MIN_SIZE:
+            return content, False
+        return gzip.compress(content, compresslevel=_COMPRESS_LEVEL), True
+    
+    chunks = iter(content)
+    head: List[bytes] = []
+    size = 0
+    for chunk in chunks:
+        head.append(chunk)
+        size += len(chunk)
+        if size >= _COMPRESS_MIN_SIZE:
+            return _gzip_chunks(itertools.chain(head, chunks)), True
+    return b"".join(head), False
+
+
+def _triple_bnodes(triple: Tuple[Any, Any, Any]) -> List[BNode]:
+    """Return the blank nodes of a triple."""
+    return [term for term in triple if isinstance(term, BNode)]
+
+
+def _ntriples_bnodes(text: str) -> List[str]:
+    """Return the blank node labels in N-Triples text."""
+    return _BNODE_LABEL_RE.findall(text) if '_:' in text else []
+
+
+def _bnode_safe_batches(items: Iterable[Any], chunk_size: int,
+                        bnodes_of: Callable[[Any], List[Any]]) -> Iterator[List[Any]]:
+    """Split items into batches of up to chunk_size without splitting blank nodes.
+    
+    Each INSERT DATA request is its own blank node scope, so items linked
+    through shared blank nodes must be sent in the same request or the store
+    creates a distinct node per request. Items without blank nodes are
+    batched as they stream in; the others are grouped by connected blank
+    nodes once all items are read, and batches are only cut between groups.
+    A group larger than chunk_size is sent as one batch.
+    
+    Args:
+        items: Triples or N-Triples text to split
+        chunk_size: Maximum number of items per batch
+        bnodes_of: Returns the blank nodes (or their labels) of an item
+    """
+    chunk_size = max(1, chunk_size)
+    parent: Dict[Any, Any] = {}
+
+    def find(node: Any) -> Any:
+        while parent[node] != node:
+            parent[node] = parent[parent[node]]
+            node = parent[node]
+        return node
+
+    batch: List[Any] = []
+    linked: List[Tuple[Any, Any]] = []
+    for item in items:
+        bnodes = bnodes_of(item)
+        if not bnodes:
+            batch.append(item)
+            if len(batch) >= chunk_size:
+                yield batch
+                batch = []
+            continue
+        for bnode in bnodes:
+            parent.setdefault(bnode, bnode)
+        root = find(bnodes[0])
+        for bnode in bnodes[1:]:
+            other = find(bnode)
+            if other != root:
+                parent[other] = root
+        linked.append((bnodes[0], item))
+
+    groups: Dict[Any, List[Any]] = {}
+    for bnode, item in linked:
+        groups.setdefault(find(bnode), []).append(item)
+    for group in groups.values():
+        if batch and len(batch) + len(group) > chunk_size:
+            yield batch
+            batch = []
+        batch.extend(group)
+        if len(batch) >= chunk_size:
+            yield batch
+            batch = []
+    if batch:
+        yield batch
+
+
+def _line_chunks(lines: Iterable[str]) -> Iterator[bytes]:
+    """Yield N-Triples text in UTF-8 encoded chunks of up to _UPLOAD_CHUNK_TRIPLES items."""
+    pending: List[str] = []
+    for line in lines:
+        pending.append(line)
+        if len(pending) >= _UPLOAD_CHUNK_TRIPLES:
+            yield "".join(pending).encode('utf-8')
+            pending = []
+    if pending:
+        yield "".join(pending).encode('utf-8')
+
+
+def _file_chunks(f: BinaryIO) -> Iterator[bytes]:
+    """Yield the contents of a binary file in chunks of _FILE_UPLOAD_CHUNK_SIZE bytes."""
+    return iter(lambda: f.read(_FILE_UPLOAD_CHUNK_SIZE), b'')
+
+
+def _ntriples_chunks(triples: Iterable) -> Iterator[bytes]:
+    """Yield triples serialized as N-Triples in UTF-8 encoded chunks."""
+    return _line_chunks(map(_nt_row, triples))
+
+
+def _convert_bindings(results: Dict[str, Any]) -> List[Dict[str, Any]]:
+    """Convert SPARQL JSON results into a list of rows keyed by variable name."""
+    bindings = results.get('results', {}).get('bindings', [])
+    
+    # IRIs repeat heavily across rows, so they are interned to share a single
+    # string object per IRI.
+    intern = sys.intern
+    kinds = _DATATYPE_KINDS
+    converters = _CONVERTERS
+    converted_results = []
+    for binding in bindings:
+        row = {}
+        for var, value_info in binding.items():
+            if value_info.get('type') == 'uri':
+                row[var] = intern(value_info.get('value', ''))
+            else:
+                kind = kinds.get(value_info.get('datatype'), _KIND_PLAIN)
+                row[var] = converters[kind](value_info.get('value', ''))
+        converted_results.append(row)
+    return converted_results
+
 
 class SparqlQueryInterface:
     """Interface for executing SPARQL queries against a configurable SPARQL endpoint.
@@ -20,7 +565,7 @@ class SparqlQueryInterface:
     different result formats.
     """
     
-    def __init__(self, endpoint_url: Optional[str] = None, update_endpoint_url: Optional[str] = None, username: Optional[str] = None, password: Optional[str] = None):
+    def __init__(self, endpoint_url: Optional[str] = None, update_endpoint_url: Optional[str] = None, username: Optional[str] = None, password: Optional[str] = None, delete_workers: int = 1, graph_store_url: Optional[str] = None, cache_enabled: bool = False, query_retries: int = _QUERY_RETRIES, compress_uploads: bool = False, server_kind: Optional[str] = None):
         """Initialize the SPARQL Query Interface.
         
         Args:
@@ -28,33 +573,165 @@ class SparqlQueryInterface:
             update_endpoint_url: The SPARQL update endpoint URL (optional, defaults to endpoint_url + '/update')
             username: The username for authentication
             password: The password for authentication
+            delete_workers: Number of concurrent requests used when deleting
+                per-document data during upserts (default: 1, sequential)
+            graph_store_url: Optional SPARQL 1.1 Graph Store Protocol endpoint URL.
+                When set, load_data uploads N-Triples there instead of sending
+                INSERT DATA updates.
+            cache_enabled: If True, keep recent SELECT/ASK results in an LRU cache
+                that is invalidated by every update sent through this interface.
+                Changes made by other clients are not seen while cached.
+            query_retries: Number of times a read-only query is retried, with
+                exponential backoff, when the endpoint answers 502, 503 or 504.
+                Updates are never retried.
+            compress_uploads: If True, gzip update and graph store request
+                bodies of 64 KiB or more (sent with Content-Encoding: gzip).
+                Only enable this for endpoints that accept compressed requests.
+            server_kind: Kind of store behind the endpoint ("virtuoso",
+                "fuseki" or "blazegraph"). When known, query timeouts are also
+                sent as a query-string parameter, so the store aborts queries
+                the client has given up on instead of running them to the end.
         """
         self.endpoint_url = endpoint_url
         self.update_endpoint_url = update_endpoint_url
+        self.delete_workers = max(1, delete_workers)
+        self.graph_store_url = graph_store_url
+        self.cache_enabled = cache_enabled
+        self.query_retries = max(0, query_retries)
+        self.compress_uploads = compress_uploads
+        self.server_kind = server_kind
+        # Results are keyed by (epoch, query type, query). Every update bumps the
+        # epoch, so results of queries that raced with an update are never reused.
+        self._epoch = 0
+        self._cache: "OrderedDict[Tuple[int, str, str], Any]" = OrderedDict()
+        self._cache_lock = threading.Lock()
+        self._username = username
+        self._password = password
         
         if endpoint_url and not update_endpoint_url:
             self.update_endpoint_url = urljoin(endpoint_url.rstrip('/') + '/', 'update')
 
-        # Initialize SPARQLWrapper instances
-        self._query_wrapper = None
-        if self.endpoint_url:
-            self._query_wrapper = SPARQLWrapper(self.endpoint_url)
-        
-        self._update_wrapper = None
-        if self.update_endpoint_url:
-            self._update_wrapper = SPARQLWrapper(self.update_endpoint_url)
-        
-        if username and password:
-            if self._query_wrapper:
-                self._query_wrapper.setCredentials(username, password)
-            if self._update_wrapper:
-                self._update_wrapper.setCredentials(username, password)
+        # A single HTTP client keeps connections alive between requests, so
+        # repeated queries skip the TCP/TLS handshake. httpx clients are
+        # thread-safe and shared by concurrent deletes. Query and update
+        # endpoints on the same host share the pooled connections, and with
+        # HTTP/2 (negotiated over TLS) concurrent requests are multiplexed
+        # over a single connection.
+        self._http = httpx.Client(
+            http2=_HTTP2_AVAILABLE,
+            timeout=30.0,
+            limits=httpx.Limits(
+                max_keepalive_connections=_MAX_KEEPALIVE_CONNECTIONS,
+                keepalive_expiry=_KEEPALIVE_EXPIRY,
+            ),
+            auth=(username, password) if username and password else None,
+        )
 
         if self.endpoint_url:
             logger.info(f"Initialized SPARQL interface with query endpoint: {self.endpoint_url}")
         if self.update_endpoint_url:
             logger.info(f"Update endpoint: {self.update_endpoint_url}")
     
+    def close(self) -> None:
+        """Close the pooled HTTP connections."""
+        self._http.close()
+    
+    def __enter__(self) -> "SparqlQueryInterface":
+        return self
+    
+    def __exit__(self, exc_type, exc_value, traceback) -> None:
+        self.close()
+    
+    def _cache_get(self, query_type: str, query: str) -> Tuple[Tuple[int, str, str], Any]:
+        """Return the cache key for a query and its cached result, or None."""
+        with self._cache_lock:
+            key = (self._epoch, query_type, query)
+            result = self._cache.get(key)
+            if result is not None:
+                self._cache.move_to_end(key)
+            return key, result
+    
+    def _cache_put(self, key: Tuple[int, str, str], result: Any) -> None:
+        with self._cache_lock:
+            if key[0] != self._epoch:
+                return
+            self._cache[key] = result
+            if len(self._cache) > _QUERY_CACHE_SIZE:
+                self._cache.popitem(last=False)
+    
+    def _invalidate_cache(self) -> None:
+        """Discard cached query results after the store may have changed."""
+        with self._cache_lock:
+            self._epoch += 1
+            self._cache.clear()
+    
+    def _post_query(self, query: str, accept: str, timeout: int, stream: bool = False) -> httpx.Response:
+        """POST a query to the query endpoint and return the successful response.
+        
+        Queries are read-only, so responses with a transient 502/503/504 status
+        are retried up to query_retries times with jittered exponential backoff.
+        The pooled connection stays open between attempts.
+        
+        Args:
+            query: The SPARQL query string
+            accept: Accept header of the request
+            timeout: Request timeout in seconds
+            stream: If True, return without reading the body; the caller must
+                close the response
+        
+        Raises:
+            httpx.HTTPError: If the request fails or returns an error status
+        """
+        request = self._http.build_request(
+            "POST",
+            self.endpoint_url,
+            params=_server_timeout_params(self.server_kind, timeout),
+            content=query.encode('utf-8'),
+            headers={"Content-Type": _SPARQL_QUERY, "Accept": accept},
+            timeout=timeout,
+        )
+        for attempt in range(self.query_retries + 1):
+            response = self._http.send(request, stream=stream)
+            if response.status_code not in _RETRY_STATUS_CODES or attempt == self.query_retries:
+                break
+            response.close()
+            delay = _retry_delay(attempt)
+            logger.warning(f"Query endpoint returned {response.status_code}, retrying in {delay:.2f}s")
+            time.sleep(delay)
+        
+        try:
+            response.raise_for_status()
+        except httpx.HTTPStatusError:
+            response.close()
+            raise
+        return response
+    
+    def is_available(self, timeout: int = 5) -> bool:
+        """Check whether the query endpoint answers a trivial ASK query.
+        
+        The check goes through the pooled client, so it also warms up a
+        connection for the queries that follow. It is not retried.
+        
+        Args:
+            timeout: Request timeout in seconds
+            
+        Returns:
+            True if the endpoint answered successfully, False otherwise
+        """
+        if not self.endpoint_url:
+            return False
+        try:
+            response = self._http.post(
+                self.endpoint_url,
+                content=_HEALTH_CHECK_QUERY.encode('utf-8'),
+                headers={"Content-Type": _SPARQL_QUERY, "Accept": _SPARQL_RESULTS_JSON},
+                timeout=timeout,
+            )
+            return response.is_success
+        except httpx.HTTPError as e:
+            logger.warning(f"SPARQL endpoint {self.endpoint_url} is not available: {e}")
+            return False
+    
     def select(self, query: str, timeout: int = 30) -> List[Dict[str, Any]]:
         """Execute a SPARQL SELECT query.
         
@@ -68,33 +745,54 @@ class SparqlQueryInterface:
         Raises:
             SPARQLWrapperException: If the query fails
         """
-        if not self._query_wrapper:
-            raise ValueError("SPARQL query endpoint not configured.")
         logger.debug(f"Executing SELECT query: {query}")
+        if not self.endpoint_url:
+            raise ValueError("SPARQL query endpoint not configured.")
         
-        self._query_wrapper.setQuery(query)
-        self._query_wrapper.setReturnFormat(JSON)
-        self._query_wrapper.setTimeout(timeout)
+        if self.cache_enabled:
+            cache_key, cached = self._cache_get("SELECT", query)
+            if cached is not None:
+                logger.debug(f"SELECT query served from cache ({len(cached)} results)")
+                return [row.copy() for row in cached]
         
         try:
-            results = self._query_wrapper.query().convert()
-            bindings = results.get('results', {}).get('bindings', [])
-            
-            # Convert to more convenient format
-            converted_results = []
-            for binding in bindings:
-                row = {}
-                for var, value_info in binding.items():
-                    row[var] = self._extract_value(value_info)
-                converted_results.append(row)
+            results = _json_loads(self._post_query(query, _SPARQL_RESULTS_JSON, timeout).content)
+            converted_results = _convert_bindings(results)
             
             logger.debug(f"SELECT query returned {len(converted_results)} results")
+            if self.cache_enabled:
+                self._cache_put(cache_key, [row.copy() for row in converted_results])
             return converted_results
             
         except Exception as e:
             logger.error(f"Failed to execute SELECT query: {e}")
             raise SPARQLWrapperException(f"SELECT query failed: {e}") from e
     
+    def run_select_many(self, queries: List[str], timeout: int = 30) -> List[List[Dict[str, Any]]]:
+        """Execute several SELECT queries concurrently and wait for all results.
+        
+        Args:
+            queries: The SPARQL SELECT query strings
+            timeout: Query timeout in seconds
+            
+        Returns:
+            One result list per query, in the order the queries were given
+            
+        Raises:
+            SPARQLWrapperException: If any query fails
+        """
+        async def _run() -> List[List[Dict[str, Any]]]:
+            async with AsyncSparqlQueryInterface(
+                endpoint_url=self.endpoint_url,
+                update_endpoint_url=self.update_endpoint_url,
+                username=self._username,
+                password=self._password,
+                server_kind=self.server_kind,
+            ) as interface:
+                return await interface.select_many(queries, timeout=timeout)
+        
+        return asyncio.run(_run())
+    
     def ask(self, query: str, timeout: int = 30) -> bool:
         """Execute a SPARQL ASK query.
         
@@ -108,19 +806,23 @@ class SparqlQueryInterface:
         Raises:
             SPARQLWrapperException: If the query fails
         """
-        if not self._query_wrapper:
-            raise ValueError("SPARQL query endpoint not configured.")
         logger.debug(f"Executing ASK query: {query}")
+        if not self.endpoint_url:
+            raise ValueError("SPARQL query endpoint not configured.")
         
-        self._query_wrapper.setQuery(query)
-        self._query_wrapper.setReturnFormat(JSON)
-        self._query_wrapper.setTimeout(timeout)
+        if self.cache_enabled:
+            cache_key, cached = self._cache_get("ASK", query)
+            if cached is not None:
+                logger.debug(f"ASK query served from cache: {cached}")
+                return cached
         
         try:
-            results = self._query_wrapper.query().convert()
+            results = _json_loads(self._post_query(query, _SPARQL_RESULTS_JSON, timeout).content)
             result = results.get('boolean', False)
             
             logger.debug(f"ASK query returned: {result}")
+            if self.cache_enabled:
+                self._cache_put(cache_key, result)
             return result
             
         except Exception as e:
@@ -140,27 +842,45 @@ class SparqlQueryInterface:
         Raises:
             SPARQLWrapperException: If the query fails
         """
-        if not self._query_wrapper:
-            raise ValueError("SPARQL query endpoint not configured.")
-        logger.debug(f"Executing CONSTRUCT query: {query}")
+        return self._graph_query("CONSTRUCT", query, timeout)
+    
+    def construct_raw(self, query: str, timeout: int = 30) -> bytes:
+        """Execute a SPARQL CONSTRUCT query and return the serialized response.
         
-        self._query_wrapper.setQuery(query)
-        self._query_wrapper.setReturnFormat(TURTLE)
-        self._query_wrapper.setTimeout(timeout)
+        Use this instead of construct() when the result is only written out or
+        forwarded, since it skips parsing the response into an RDFLib graph.
         
-        try:
-            results = self._query_wrapper.query().convert()
+        Args:
+            query: The SPARQL CONSTRUCT query string
+            timeout: Query timeout in seconds
             
-            # Parse the turtle result into an RDFLib graph
-            graph = Graph()
-            graph.parse(data=results, format='turtle')
+        Returns:
+            The response body as returned by the endpoint, serialized as
+            N-Triples or Turtle (N-Triples is also valid Turtle)
             
-            logger.debug(f"CONSTRUCT query returned graph with {len(graph)} triples")
-            return graph
+        Raises:
+            SPARQLWrapperException: If the query fails
+        """
+        return self._graph_query_raw("CONSTRUCT", query, timeout)
+    
+    def construct_to_stream(self, query: str, destination: BinaryIO, format: str = 'nt', timeout: int = 30) -> None:
+        """Execute a SPARQL CONSTRUCT query and write the result to a binary stream.
+        
+        The response is copied to destination chunk by chunk as it arrives
+        when the endpoint answers in the requested format (N-Triples, which is
+        also valid Turtle, satisfies both), so the result is never held in
+        memory. Otherwise it is parsed and re-serialized.
+        
+        Args:
+            query: The SPARQL CONSTRUCT query string
+            destination: Binary file to write the result to
+            format: 'nt' for N-Triples or 'turtle'
+            timeout: Query timeout in seconds
             
-        except Exception as e:
-            logger.error(f"Failed to execute CONSTRUCT query: {e}")
-            raise SPARQLWrapperException(f"CONSTRUCT query failed: {e}") from e
+        Raises:
+            SPARQLWrapperException: If the query fails
+        """
+        self._graph_query_to_stream("CONSTRUCT", query, destination, format, timeout)
     
     def describe(self, query: str, timeout: int = 30) -> Graph:
         """Execute a SPARQL DESCRIBE query.
@@ -175,27 +895,101 @@ class SparqlQueryInterface:
         Raises:
             SPARQLWrapperException: If the query fails
         """
-        if not self._query_wrapper:
-            raise ValueError("SPARQL query endpoint not configured.")
-        logger.debug(f"Executing DESCRIBE query: {query}")
+        return self._graph_query("DESCRIBE", query, timeout)
+    
+    def describe_raw(self, query: str, timeout: int = 30) -> bytes:
+        """Execute a SPARQL DESCRIBE query and return the serialized response.
+        
+        Args:
+            query: The SPARQL DESCRIBE query string
+            timeout: Query timeout in seconds
+            
+        Returns:
+            The response body as returned by the endpoint, serialized as
+            N-Triples or Turtle (N-Triples is also valid Turtle)
+            
+        Raises:
+            SPARQLWrapperException: If the query fails
+        """
+        return self._graph_query_raw("DESCRIBE", query, timeout)
+    
+    def describe_to_stream(self, query: str, destination: BinaryIO, format: str = 'nt', timeout: int = 30) -> None:
+        """Execute a SPARQL DESCRIBE query and write the result to a binary stream.
         
-        self._query_wrapper.setQuery(query)
-        self._query_wrapper.setReturnFormat(TURTLE)
-        self._query_wrapper.setTimeout(timeout)
+        See construct_to_stream.
         
-        try:
-            results = self._query_wrapper.query().convert()
+        Args:
+            query: The SPARQL DESCRIBE query string
+            destination: Binary file to write the result to
+            format: 'nt' for N-Triples or 'turtle'
+            timeout: Query timeout in seconds
             
-            # Parse the turtle result into an RDFLib graph
-            graph = Graph()
-            graph.parse(data=results, format='turtle')
+        Raises:
+            SPARQLWrapperException: If the query fails
+        """
+        self._graph_query_to_stream("DESCRIBE", query, destination, format, timeout)
+    
+    def _graph_query(self, query_type: str, query: str, timeout: int) -> Graph:
+        """Execute a graph-returning query, parsing the response as it streams in."""
+        logger.debug(f"Executing {query_type} query: {query}")
+        if not self.endpoint_url:
+            raise ValueError("SPARQL query endpoint not configured.")
+        
+        try:
+            response = self._post_query(query, _GRAPH_ACCEPT, timeout, stream=True)
+            try:
+                media_type = response.headers.get('content-type', '').split(';')[0].strip()
+                graph = _parse_graph(
+                    io.BufferedReader(_ByteStream(response.iter_bytes())),
+                    _GRAPH_FORMATS.get(media_type, 'turtle'),
+                )
+            finally:
+                response.close()
             
-            logger.debug(f"DESCRIBE query returned graph with {len(graph)} triples")
+            logger.debug(f"{query_type} query returned graph with {len(graph)} triples")
             return graph
             
         except Exception as e:
-            logger.error(f"Failed to execute DESCRIBE query: {e}")
-            raise SPARQLWrapperException(f"DESCRIBE query failed: {e}") from e
+            logger.error(f"Failed to execute {query_type} query: {e}")
+            raise SPARQLWrapperException(f"{query_type} query failed: {e}") from e
+    
+    def _graph_query_to_stream(self, query_type: str, query: str, destination: BinaryIO,
+                               format: str, timeout: int) -> None:
+        """Execute a graph-returning query, writing the response in format to destination."""
+        logger.debug(f"Executing {query_type} query: {query}")
+        if not self.endpoint_url:
+            raise ValueError("SPARQL query endpoint not configured.")
+        
+        try:
+            response = self._post_query(query, _GRAPH_ACCEPT, timeout, stream=True)
+            try:
+                media_type = response.headers.get('content-type', '').split(';')[0].strip()
+                response_format = _GRAPH_FORMATS.get(media_type, 'turtle')
+                if response_format == 'nt' or response_format == format:
+                    for chunk in response.iter_bytes():
+                        destination.write(chunk)
+                    return
+                graph = _parse_graph(io.BufferedReader(_ByteStream(response.iter_bytes())), response_format)
+            finally:
+                response.close()
+            graph.serialize(destination=destination, format=format, encoding='utf-8')
+            
+        except Exception as e:
+            logger.error(f"Failed to execute {query_type} query: {e}")
+            raise SPARQLWrapperException(f"{query_type} query failed: {e}") from e
+    
+    def _graph_query_raw(self, query_type: str, query: str, timeout: int) -> bytes:
+        """Execute a graph-returning query and return the undecoded response body."""
+        logger.debug(f"Executing {query_type} query: {query}")
+        if not self.endpoint_url:
+            raise ValueError("SPARQL query endpoint not configured.")
+        
+        try:
+            return self._post_query(query, _GRAPH_ACCEPT, timeout).content
+            
+        except Exception as e:
+            logger.error(f"Failed to execute {query_type} query: {e}")
+            raise SPARQLWrapperException(f"{query_type} query failed: {e}") from e
     
     def update(self, query: str, timeout: int = 30) -> None:
         """Execute a SPARQL UPDATE query.
@@ -207,66 +1001,231 @@ class SparqlQueryInterface:
         Raises:
             SPARQLWrapperException: If the update fails
         """
-        if not self._update_wrapper:
-            raise ValueError("SPARQL update endpoint not configured.")
         logger.debug(f"Executing UPDATE query: {query}")
+        self._post_update(query.encode('utf-8'), timeout)
+        logger.debug("UPDATE query executed successfully")
+
+    def update_many(self, queries: List[str], timeout: int = 30) -> None:
+        """Execute several SPARQL UPDATE operations in a single request.
         
-        self._update_wrapper.setQuery(query)
-        self._update_wrapper.setMethod("POST")
-        self._update_wrapper.setTimeout(timeout)
+        SPARQL 1.1 Update allows a request to contain multiple operations
+        separated by ';', which saves one round trip per operation.
         
-        try:
-            self._update_wrapper.query()
-            logger.debug("UPDATE query executed successfully")
+        Args:
+            queries: The SPARQL UPDATE operations to execute, in order
+            timeout: Query timeout in seconds
             
-        except Exception as e:
-            logger.error(f"Failed to execute UPDATE query: {e}")
-            raise SPARQLWrapperException(f"UPDATE query failed: {e}") from e
-    
-    def load_data(self, graph: Graph, graph_uri: Optional[str] = None) -> None:
+        Raises:
+            SPARQLWrapperException: If the update fails
+        """
+        if not queries:
+            return
+        self.update(";\n".join(queries), timeout=timeout)
+
+    def load_data(self, graph: Graph, graph_uri: Optional[str] = None, chunk_size: int = _LOAD_CHUNK_SIZE) -> None:
         """Load RDF data into the SPARQL store.
         
         Args:
             graph: RDFLib Graph containing the data to load
             graph_uri: Optional named graph URI to load data into
+            chunk_size: Maximum number of triples sent per INSERT DATA request;
+                triples sharing blank nodes are sent together
             
         Raises:
             SPARQLWrapperException: If the data loading fails
         """
         logger.info(f"Loading {len(graph)} triples into SPARQL store")
         
-        # Serialize the graph to n-triples format, which is just triples without prefixes.
-        nt_data = graph.serialize(format='nt')
+        if self.graph_store_url:
+            self._post_graph_store(graph, graph_uri)
+            logger.info("Data loaded successfully")
+            return
+        
+        # Send bounded INSERT DATA requests so large graphs stay within endpoint
+        # request limits, streaming each as N-Triples so the full serialization
+        # is never held in memory at once. Triples sharing blank nodes stay in
+        # one request.
+        for batch in _bnode_safe_batches(graph, chunk_size, _triple_bnodes):
+            self._post_update_stream(self._insert_data_chunks(batch, graph_uri))
+        logger.info("Data loaded successfully")
+
+    def _post_graph_store(self, graph: Graph, graph_uri: Optional[str] = None, timeout: int = 30) -> None:
+        """POST a graph as N-Triples to the Graph Store Protocol endpoint.
+        
+        Raises:
+            SPARQLWrapperException: If the upload fails
+        """
+        params = {"graph": graph_uri} if graph_uri else {"default": ""}
+        
+        try:
+            content, headers = self._upload_body(_ntriples_chunks(graph), _N_TRIPLES)
+            response = self._http.post(
+                self.graph_store_url,
+                params=params,
+                content=content,
+                headers=headers,
+                timeout=timeout,
+            )
+            response.raise_for_status()
+            
+        except Exception as e:
+            logger.error(f"Failed to upload data to graph store: {e}")
+            raise SPARQLWrapperException(f"Graph store upload failed: {e}") from e
+        
+        finally:
+            self._invalidate_cache()
+
+    def upload_file(self, file_path: Union[str, Path], graph_uri: Optional[str] = None, format: str = 'turtle',
+                    graph_store_url: Optional[str] = None, timeout: int = 30) -> None:
+        """Upload an RDF file as-is to the Graph Store Protocol endpoint.
+        
+        The file is streamed as the body of a POST, which adds its triples to
+        the graph, without being parsed here; syntax errors are reported by
+        the store.
+        
+        Args:
+            file_path: Path to the RDF file
+            graph_uri: Optional named graph URI to load data into (default graph otherwise)
+            format: RDF format of the file ("turtle", "nt" or "xml")
+            graph_store_url: Graph Store Protocol endpoint URL, overriding the
+                interface's graph_store_url
+            timeout: Request timeout in seconds
+            
+        Raises:
+            ValueError: If no graph store URL is configured or given, or the
+                format cannot be uploaded as-is
+            FileNotFoundError: If the file doesn't exist
+            SPARQLWrapperException: If the upload fails
+        """
+        url = graph_store_url or self.graph_store_url
+        if not url:
+            raise ValueError("SPARQL graph store URL not configured.")
+        content_type = _RDF_MEDIA_TYPES.get(format)
+        if content_type is None:
+            raise ValueError(f"Unsupported RDF format for graph store upload: {format}")
+        params = {"graph": graph_uri} if graph_uri else {"default": ""}
+        
+        with open(file_path, 'rb') as f:
+            try:
+                content, headers = self._upload_body(_file_chunks(f), content_type)
+                response = self._http.post(
+                    url,
+                    params=params,
+                    content=content,
+                    headers=headers,
+                    timeout=timeout,
+                )
+                response.raise_for_status()
+                
+            except Exception as e:
+                logger.error(f"Failed to upload file {file_path} to graph store: {e}")
+                raise SPARQLWrapperException(f"Graph store upload failed: {e}") from e
+            
+            finally:
+                self._invalidate_cache()
+
+    def load_ntriples(self, ntriples: Iterable[str], graph_uri: Optional[str] = None, chunk_size: int = _LOAD_CHUNK_SIZE) -> None:
+        """Load pre-serialized N-Triples into the SPARQL store.
+        
+        This skips building an RDFLib graph when the data is already available
+        as N-Triples, e.g. from RdfConverter.kb_entity_to_ntriples.
+        
+        Args:
+            ntriples: N-Triples text, each item holding one or more complete
+                newline-terminated lines
+            graph_uri: Optional named graph URI to load data into
+            chunk_size: Maximum number of items sent per INSERT DATA request;
+                items sharing blank node labels are sent together
+            
+        Raises:
+            SPARQLWrapperException: If the data loading fails
+        """
+        for batch in _bnode_safe_batches(ntriples, chunk_size, _ntriples_bnodes):
+            self._post_update_stream(self._insert_data_body(_line_chunks(batch), graph_uri))
+        logger.info("N-Triples loaded successfully")
+
+    def _insert_data_chunks(self, graph: Iterable, graph_uri: Optional[str] = None) -> Iterator[bytes]:
+        """Yield an INSERT DATA request for a graph's triples in UTF-8 encoded chunks."""
+        return self._insert_data_body(_ntriples_chunks(graph), graph_uri)
 
-        # Build INSERT DATA query
+    def _insert_data_body(self, data: Iterable[bytes], graph_uri: Optional[str] = None) -> Iterator[bytes]:
+        """Wrap encoded N-Triples chunks in an INSERT DATA request."""
         if graph_uri:
-            query = f"""
-            INSERT DATA {{
-                GRAPH <{graph_uri}> {{
-                    {nt_data}
-                }}
-            }}
-            """
+            prologue = f"INSERT DATA {{\n    GRAPH <{graph_uri}> {{\n"
+            epilogue = "    }\n}\n"
         else:
-            query = f"""
-            INSERT DATA {{
-                {nt_data}
-            }}
-            """
+            prologue = "INSERT DATA {\n"
+            epilogue = "}\n"
         
-        self.update(query)
-        logger.info("Data loaded successfully")
+        yield prologue.encode('utf-8')
+        yield from data
+        yield epilogue.encode('utf-8')
 
-    def upsert_data(self, graph: Graph, graph_uri: Optional[str] = None, document_uris: Optional[List[str]] = None) -> None:
+    def _post_update_stream(self, body: Iterable[bytes], timeout: int = 30) -> None:
+        """POST an UPDATE request body to the update endpoint using chunked transfer encoding.
+        
+        Args:
+            body: Iterable of encoded chunks making up the SPARQL UPDATE request
+            timeout: Request timeout in seconds
+            
+        Raises:
+            SPARQLWrapperException: If the update fails
+        """
+        self._post_update(body, timeout)
+        logger.debug("Streamed UPDATE query executed successfully")
+
+    def _upload_body(self, content: Union[bytes, Iterable[bytes]], content_type: str) -> Tuple[Union[bytes, Iterable[bytes]], Dict[str, str]]:
+        """Return the body and headers of an upload, compressed if enabled and large enough."""
+        headers = {"Content-Type": content_type}
+        if self.compress_uploads:
+            content, compressed = _compress_body(content)
+            if compressed:
+                headers["Content-Encoding"] = "gzip"
+        return content, headers
+
+    def _post_update(self, content: Union[bytes, Iterable[bytes]], timeout: int = 30) -> None:
+        """POST an UPDATE request body to the update endpoint.
+        
+        Raises:
+            ValueError: If no update endpoint is configured
+            SPARQLWrapperException: If the update fails
+        """
+        if not self.update_endpoint_url:
+            raise ValueError("SPARQL update endpoint not configured.")
+        
+        try:
+            content, headers = self._upload_body(content, _SPARQL_UPDATE)
+            response = self._http.post(
+                self.update_endpoint_url,
+                content=content,
+                headers=headers,
+                timeout=timeout,
+            )
+            response.raise_for_status()
+            
+        except Exception as e:
+            logger.error(f"Failed to execute UPDATE query: {e}")
+            raise SPARQLWrapperException(f"UPDATE query failed: {e}") from e
+        
+        finally:
+            # Even a failed request may have been partially applied
+            self._invalidate_cache()
+
+    def upsert_data(self, graph: Graph, graph_uri: Optional[str] = None, document_uris: Optional[List[str]] = None,
+                    chunk_size: int = _LOAD_CHUNK_SIZE) -> None:
         """Upsert RDF data into the SPARQL store, avoiding duplicates.
         
         This method performs document-level upserts by first deleting all triples
         associated with the specified documents, then inserting the new data.
+        A graph of at most chunk_size triples is sent together with the deletes
+        in one request; larger graphs are inserted through load_data after the
+        deletes, so no request exceeds chunk_size triples.
         
         Args:
             graph: RDFLib Graph containing the data to upsert
             graph_uri: Optional named graph URI to upsert data into
             document_uris: List of document URIs to replace. If None, extracts from graph.
+            chunk_size: Maximum number of triples sent per INSERT DATA request
             
         Raises:
             SPARQLWrapperException: If the upsert operation fails
@@ -277,14 +1236,29 @@ class SparqlQueryInterface:
         if document_uris is None:
             document_uris = self._extract_document_uris(graph)
         
-        if document_uris:
-            logger.info(f"Found {len(document_uris)} documents to upsert: {document_uris}")
-            
-            # Step 1: Delete existing data for these documents
-            self._delete_document_data(document_uris, graph_uri)
+        if not document_uris:
+            self.load_data(graph, graph_uri, chunk_size=chunk_size)
+            logger.info("Data upserted successfully")
+            return
         
-        # Step 2: Insert new data
-        self.load_data(graph, graph_uri)
+        logger.info(f"Found {len(document_uris)} documents to upsert: {document_uris}")
+        
+        if self.delete_workers > 1 or self.graph_store_url or len(graph) > chunk_size:
+            # Step 1: Delete existing data for these documents (concurrently
+            # with several delete workers)
+            self._delete_document_data(document_uris, graph_uri)
+            # Step 2: Insert new data in bounded requests or to the graph store
+            self.load_data(graph, graph_uri, chunk_size=chunk_size)
+        else:
+            # Send the deletes and the insert as one request so the upsert is
+            # applied in a single round trip (and atomically on stores that
+            # execute an update request as one transaction).
+            deletes = ";\n".join(self._build_delete_query(uri, graph_uri) for uri in document_uris)
+            body = itertools.chain(
+                [(deletes + ";\n").encode('utf-8')],
+                self._insert_data_chunks(graph, graph_uri),
+            )
+            self._post_update_stream(body)
         logger.info("Data upserted successfully")
 
     def _extract_document_uris(self, graph: Graph) -> List[str]:
@@ -329,42 +1303,44 @@ class SparqlQueryInterface:
         
         logger.info(f"Deleting existing data for {len(document_uris)} documents")
         
-        # Delete each document individually to avoid VALUES clause issues
-        for document_uri in document_uris:
-            if graph_uri:
-                query = f"""
-                PREFIX kb: <http://example.org/kb/>
-                
-                DELETE {{
-                    GRAPH <{graph_uri}> {{
-                        ?entity ?predicate ?object .
-                        <{document_uri}> ?docPredicate ?docObject .
-                    }}
-                }}
-                WHERE {{
-                    GRAPH <{graph_uri}> {{
-                        {{
-                            # Delete all entities that reference this document as source
-                            ?entity kb:sourceDocument <{document_uri}> .
-                            ?entity ?predicate ?object .
-                        }}
-                        UNION
-                        {{
-                            # Delete the document entity itself
-                            <{document_uri}> ?docPredicate ?docObject .
-                        }}
-                    }}
-                }}
-                """
-            else:
-                query = f"""
-                PREFIX kb: <http://example.org/kb/>
-                
-                DELETE {{
+        # One DELETE operation per document to avoid VALUES clause issues
+        queries = [self._build_delete_query(document_uri, graph_uri) for document_uri in document_uris]
+        
+        if self.delete_workers > 1 and len(queries) > 1:
+            # Documents own disjoint sets of triples, so the deletes can run concurrently
+            if not self.update_endpoint_url:
+                raise ValueError("SPARQL update endpoint not configured.")
+            with ThreadPoolExecutor(max_workers=self.delete_workers) as executor:
+                list(executor.map(self.update, queries))
+            for document_uri in document_uris[:_DELETE_LOG_LIMIT]:
+                logger.debug(f"Deleted existing data for document: {document_uri}")
+        else:
+            self.update_many(queries)
+        
+        logger.info(f"Deleted existing data for all {len(document_uris)} documents")
+
+    def _build_delete_query(self, document_uri: str, graph_uri: Optional[str] = None) -> str:
+        """Build the UPDATE query deleting all data associated with a document.
+        
+        Args:
+            document_uri: URI of the document to delete data for
+            graph_uri: Optional named graph URI to delete from
+            
+        Returns:
+            SPARQL UPDATE query string
+        """
+        if graph_uri:
+            query = f"""
+            PREFIX kb: <http://example.org/kb/>
+
+            DELETE {{
+                GRAPH <{graph_uri}> {{
                     ?entity ?predicate ?object .
                     <{document_uri}> ?docPredicate ?docObject .
                 }}
-                WHERE {{
+            }}
+            WHERE {{
+                GRAPH <{graph_uri}> {{
                     {{
                         # Delete all entities that reference this document as source
                         ?entity kb:sourceDocument <{document_uri}> .
@@ -376,12 +1352,30 @@ class SparqlQueryInterface:
                         <{document_uri}> ?docPredicate ?docObject .
                     }}
                 }}
-                """
-            
-            self.update(query)
-            logger.debug(f"Deleted existing data for document: {document_uri}")
-        
-        logger.info(f"Deleted existing data for all {len(document_uris)} documents")
+            }}
+            """
+        else:
+            query = f"""
+            PREFIX kb: <http://example.org/kb/>
+
+            DELETE {{
+                ?entity ?predicate ?object .
+                <{document_uri}> ?docPredicate ?docObject .
+            }}
+            WHERE {{
+                {{
+                    # Delete all entities that reference this document as source
+                    ?entity kb:sourceDocument <{document_uri}> .
+                    ?entity ?predicate ?object .
+                }}
+                UNION
+                {{
+                    # Delete the document entity itself
+                    <{document_uri}> ?docPredicate ?docObject .
+                }}
+            }}
+            """
+        return query
     
     def load_file(self, file_path: str, graph_uri: Optional[str] = None, format: str = 'turtle', upsert: bool = False) -> None:
         """Load RDF data from a file into the SPARQL store.
@@ -399,8 +1393,7 @@ class SparqlQueryInterface:
         
         try:
             # Parse the file into a graph
-            graph = Graph()
-            graph.parse(file_path, format=format)
+            graph = _parse_graph(str(file_path), format)
             
             # Load or upsert the graph data
             if upsert:
@@ -412,6 +1405,63 @@ class SparqlQueryInterface:
             logger.error(f"Failed to {'upsert' if upsert else 'load'} file {file_path}: {e}")
             raise SPARQLWrapperException(f"File {'upserting' if upsert else 'loading'} failed: {e}") from e
     
+    def load_files(self, file_paths: Iterable[Union[str, Path]], graph_uri: Optional[str] = None,
+                   format: str = 'turtle', upsert: bool = False,
+                   batch_triples: int = _LOAD_CHUNK_SIZE, parse_workers: int = 1) -> List[Tuple[str, str]]:
+        """Load several RDF files, sending their triples together in batches.
+        
+        Files are parsed into a shared graph that is loaded (or upserted)
+        whenever it holds at least batch_triples triples, so many small files
+        cost one update request per batch instead of one per file.
+        
+        Args:
+            file_paths: Paths of the RDF files
+            graph_uri: Optional named graph URI to load data into
+            format: RDF format of the files (default: turtle)
+            upsert: If True, performs upsert to avoid duplicates (default: False)
+            batch_triples: Number of triples collected before a batch is sent
+            parse_workers: Number of threads parsing files ahead of the one
+                being batched (default: 1, parsed on the calling thread)
+            
+        Returns:
+            (file path, error message) for each file that could not be parsed
+            or whose batch failed to load
+        """
+        failures: List[Tuple[str, str]] = []
+        batch: Optional[Graph] = None
+        batch_files: List[str] = []
+        for file_path, graph in _parse_files(map(str, file_paths), format, parse_workers):
+            if isinstance(graph, Exception):
+                logger.error(f"Failed to parse RDF file {file_path}: {graph}")
+                failures.append((file_path, str(graph)))
+                continue
+            
+            if batch is None:
+                batch = graph
+            else:
+                batch.addN((s, p, o, batch) for s, p, o in graph)
+            batch_files.append(file_path)
+            if len(batch) >= batch_triples:
+                self._load_file_batch(batch, batch_files, graph_uri, upsert, batch_triples, failures)
+                batch, batch_files = None, []
+        
+        if batch is not None:
+            self._load_file_batch(batch, batch_files, graph_uri, upsert, batch_triples, failures)
+        return failures
+    
+    def _load_file_batch(self, graph: Graph, file_paths: List[str], graph_uri: Optional[str], upsert: bool,
+                         batch_triples: int, failures: List[Tuple[str, str]]) -> None:
+        """Load the combined graph of a batch of files, recording a failure for each file."""
+        logger.info(f"{'Upserting' if upsert else 'Loading'} {len(file_paths)} RDF files ({len(graph)} triples)")
+        try:
+            if upsert:
+                self.upsert_data(graph, graph_uri, chunk_size=batch_triples)
+            else:
+                self.load_data(graph, graph_uri, chunk_size=batch_triples)
+        except Exception as e:
+            logger.error(f"Failed to {'upsert' if upsert else 'load'} batch of {len(file_paths)} RDF files: {e}")
+            failures.extend((file_path, str(e)) for file_path in file_paths)
+    
     def clear_graph(self, graph_uri: Optional[str] = None) -> None:
         """Clear all data from a graph.
         
@@ -440,25 +1490,21 @@ class SparqlQueryInterface:
         Raises:
             SPARQLWrapperException: If the query fails
         """
-        query = """
-        SELECT DISTINCT ?graph
-        WHERE {
-            GRAPH ?graph { ?s ?p ?o }
-        }
-        ORDER BY ?graph
-        """
-        
-        results = self.select(query)
+        results = self.select(_LIST_GRAPHS_QUERY)
         graphs = [result['graph'] for result in results]
         
         logger.debug(f"Found {len(graphs)} named graphs")
         return graphs
     
-    def count_triples(self, graph_uri: Optional[str] = None) -> int:
+    def count_triples(self, graph_uri: Optional[str] = None, prefer_metadata: bool = False) -> int:
         """Count the number of triples in a graph.
         
         Args:
             graph_uri: URI of the named graph to count (if None, counts default graph)
+            prefer_metadata: If True, first look for a void:triples statistic published
+                by the store for the graph (the named graph's IRI, or the service
+                description's default graph) and only fall back to a full COUNT
+                when none is found. Store statistics can lag behind recent updates.
             
         Returns:
             Number of triples in the graph
@@ -466,25 +1512,80 @@ class SparqlQueryInterface:
         Raises:
             SPARQLWrapperException: If the query fails
         """
+        if prefer_metadata:
+            count = self._count_triples_from_metadata(graph_uri)
+            if count is not None:
+                logger.debug(f"Graph contains {count} triples (from void:triples)")
+                return count
+        
         if graph_uri:
-            query = f"""
-            SELECT (COUNT(*) as ?count)
-            WHERE {{
-                GRAPH <{graph_uri}> {{ ?s ?p ?o }}
-            }}
-            """
+            query = _COUNT_TRIPLES_GRAPH_QUERY.format(graph_uri=graph_uri)
         else:
-            query = """
-            SELECT (COUNT(*) as ?count)
-            WHERE { ?s ?p ?o }
-            """
+            query = _COUNT_TRIPLES_DEFAULT_QUERY
         
-        results = self.select(query)
-        count = int(results[0]['count']) if results else 0
+        bindings = self._select_bindings(query)
+        count = int(bindings[0]['count']['value']) if bindings else 0
         
         logger.debug(f"Graph contains {count} triples")
         return count
     
+    def _count_triples_from_metadata(self, graph_uri: Optional[str] = None) -> Optional[int]:
+        """Read a graph's triple count from void:triples dataset statistics.
+        
+        Args:
+            graph_uri: URI of the named graph (if None, reads the default graph)
+            
+        Returns:
+            The published triple count, or None if the store does not publish one
+        """
+        if graph_uri:
+            query = _VOID_TRIPLES_GRAPH_QUERY.format(graph_uri=graph_uri)
+        else:
+            query = _VOID_TRIPLES_DEFAULT_QUERY
+        
+        try:
+            bindings = self._select_bindings(query)
+        except SPARQLWrapperException as e:
+            logger.debug(f"void:triples lookup failed, falling back to COUNT: {e}")
+            return None
+        
+        if not bindings:
+            return None
+        try:
+            return int(bindings[0]['count']['value'])
+        except (KeyError, TypeError, ValueError):
+            return None
+    
+    def _select_bindings(self, query: str, timeout: int = 30) -> List[Dict[str, Any]]:
+        """Execute a SELECT query and return its raw JSON result bindings.
+        
+        Skips the per-value conversion done by select(), for internal queries
+        that read a single known value.
+        
+        Raises:
+            SPARQLWrapperException: If the query fails
+        """
+        logger.debug(f"Executing SELECT query: {query}")
+        if not self.endpoint_url:
+            raise ValueError("SPARQL query endpoint not configured.")
+        
+        if self.cache_enabled:
+            cache_key, cached = self._cache_get("BINDINGS", query)
+            if cached is not None:
+                return cached
+        
+        try:
+            results = _json_loads(self._post_query(query, _SPARQL_RESULTS_JSON, timeout).content)
+            bindings = results.get('results', {}).get('bindings', [])
+            
+        except Exception as e:
+            logger.error(f"Failed to execute SELECT query: {e}")
+            raise SPARQLWrapperException(f"SELECT query failed: {e}") from e
+        
+        if self.cache_enabled:
+            self._cache_put(cache_key, bindings)
+        return bindings
+    
     def _extract_value(self, value_info: Dict[str, Any]) -> Union[str, int, float, bool]:
         """Extract and convert a value from SPARQL result binding.
         
@@ -494,17 +1595,178 @@ class SparqlQueryInterface:
         Returns:
             Converted value with appropriate Python type
         """
-        value = value_info.get('value', '')
-        datatype = value_info.get('datatype', '')
-        
-        # Handle different datatypes
-        if datatype == 'http://www.w3.org/2001/XMLSchema#integer':
-            return int(value)
-        elif datatype == 'http://www.w3.org/2001/XMLSchema#decimal' or \
-             datatype == 'http://www.w3.org/2001/XMLSchema#double' or \
-             datatype == 'http://www.w3.org/2001/XMLSchema#float':
-            return float(value)
-        elif datatype == 'http://www.w3.org/2001/XMLSchema#boolean':
-            return value.lower() in ('true', '1')
-        else:
-            return value
\ No newline at end of file
+        kind = _DATATYPE_KINDS.get(value_info.get('datatype'), _KIND_PLAIN)
+        return _CONVERTERS[kind](value_info.get('value', ''))
+
+
+class AsyncSparqlQueryInterface:
+    """Asynchronous counterpart of SparqlQueryInterface.
+    
+    Lets callers overlap the latency of independent queries, e.g. one query per
+    document, instead of waiting for each round trip in turn.
+    """
+    
+    def __init__(self, endpoint_url: Optional[str] = None, update_endpoint_url: Optional[str] = None, username: Optional[str] = None, password: Optional[str] = None, query_retries: int = _QUERY_RETRIES, server_kind: Optional[str] = None):
+        """Initialize the asynchronous SPARQL Query Interface.
+        
+        Args:
+            endpoint_url: The SPARQL query endpoint URL
+            update_endpoint_url: The SPARQL update endpoint URL (optional, defaults to endpoint_url + '/update')
+            username: The username for authentication
+            password: The password for authentication
+            query_retries: Number of times a read-only query is retried, with
+                exponential backoff, when the endpoint answers 502, 503 or 504.
+                Updates are never retried.
+            server_kind: Kind of store behind the endpoint, whose query
+                timeout parameter is sent (see SparqlQueryInterface)
+        """
+        self.endpoint_url = endpoint_url
+        self.update_endpoint_url = update_endpoint_url
+        self.query_retries = max(0, query_retries)
+        self.server_kind = server_kind
+        
+        if endpoint_url and not update_endpoint_url:
+            self.update_endpoint_url = urljoin(endpoint_url.rstrip('/') + '/', 'update')
+        
+        self._http = httpx.AsyncClient(
+            http2=_HTTP2_AVAILABLE,
+            timeout=30.0,
+            limits=httpx.Limits(
+                max_connections=_MAX_ASYNC_CONNECTIONS,
+                max_keepalive_connections=_MAX_KEEPALIVE_CONNECTIONS,
+                keepalive_expiry=_KEEPALIVE_EXPIRY,
+            ),
+            auth=(username, password) if username and password else None,
+        )
+    
+    async def aclose(self) -> None:
+        """Close the pooled HTTP connections."""
+        await self._http.aclose()
+    
+    async def __aenter__(self) -> "AsyncSparqlQueryInterface":
+        return self
+    
+    async def __aexit__(self, exc_type, exc_value, traceback) -> None:
+        await self.aclose()
+    
+    async def _post_query(self, query: str, accept: str, timeout: int) -> httpx.Response:
+        """POST a query to the query endpoint and return the successful response.
+        
+        Transient 502/503/504 responses are retried like in SparqlQueryInterface.
+        """
+        request = self._http.build_request(
+            "POST",
+            self.endpoint_url,
+            params=_server_timeout_params(self.server_kind, timeout),
+            content=query.encode('utf-8'),
+            headers={"Content-Type": _SPARQL_QUERY, "Accept": accept},
+            timeout=timeout,
+        )
+        for attempt in range(self.query_retries + 1):
+            response = await self._http.send(request)
+            if response.status_code not in _RETRY_STATUS_CODES or attempt == self.query_retries:
+                break
+            delay = _retry_delay(attempt)
+            logger.warning(f"Query endpoint returned {response.status_code}, retrying in {delay:.2f}s")
+            await asyncio.sleep(delay)
+        response.raise_for_status()
+        return response
+    
+    async def select(self, query: str, timeout: int = 30) -> List[Dict[str, Any]]:
+        """Execute a SPARQL SELECT query.
+        
+        Args:
+            query: The SPARQL SELECT query string
+            timeout: Query timeout in seconds
+            
+        Returns:
+            List of dictionaries representing the query results
+            
+        Raises:
+            SPARQLWrapperException: If the query fails
+        """
+        logger.debug(f"Executing SELECT query: {query}")
+        if not self.endpoint_url:
+            raise ValueError("SPARQL query endpoint not configured.")
+        
+        try:
+            response = await self._post_query(query, _SPARQL_RESULTS_JSON, timeout)
+            converted_results = _convert_bindings(_json_loads(response.content))
+            
+            logger.debug(f"SELECT query returned {len(converted_results)} results")
+            return converted_results
+            
+        except Exception as e:
+            logger.error(f"Failed to execute SELECT query: {e}")
+            raise SPARQLWrapperException(f"SELECT query failed: {e}") from e
+    
+    async def select_many(self, queries: List[str], timeout: int = 30) -> List[List[Dict[str, Any]]]:
+        """Execute several SELECT queries concurrently.
+        
+        Args:
+            queries: The SPARQL SELECT query strings
+            timeout: Query timeout in seconds
+            
+        Returns:
+            One result list per query, in the order the queries were given
+            
+        Raises:
+            SPARQLWrapperException: If any query fails
+        """
+        return await asyncio.gather(*(self.select(query, timeout=timeout) for query in queries))
+    
+    async def ask(self, query: str, timeout: int = 30) -> bool:
+        """Execute a SPARQL ASK query.
+        
+        Args:
+            query: The SPARQL ASK query string
+            timeout: Query timeout in seconds
+            
+        Returns:
+            Boolean result of the ASK query
+            
+        Raises:
+            SPARQLWrapperException: If the query fails
+        """
+        logger.debug(f"Executing ASK query: {query}")
+        if not self.endpoint_url:
+            raise ValueError("SPARQL query endpoint not configured.")
+        
+        try:
+            response = await self._post_query(query, _SPARQL_RESULTS_JSON, timeout)
+            result = _json_loads(response.content).get('boolean', False)
+            
+            logger.debug(f"ASK query returned: {result}")
+            return result
+            
+        except Exception as e:
+            logger.error(f"Failed to execute ASK query: {e}")
+            raise SPARQLWrapperException(f"ASK query failed: {e}") from e
+    
+    async def update(self, query: str, timeout: int = 30) -> None:
+        """Execute a SPARQL UPDATE query.
+        
+        Args:
+            query: The SPARQL UPDATE query string
+            timeout: Query timeout in seconds
+            
+        Raises:
+            SPARQLWrapperException: If the update fails
+        """
+        logger.debug(f"Executing UPDATE query: {query}")
+        if not self.update_endpoint_url:
+            raise ValueError("SPARQL update endpoint not configured.")
+        
+        try:
+            response = await self._http.post(
+                self.update_endpoint_url,
+                content=query.encode('utf-8'),
+                headers={"Content-Type": _SPARQL_UPDATE},
+                timeout=timeout,
+            )
+            response.raise_for_status()
+            logger.debug("UPDATE query executed successfully")
+            
+        except Exception as e:
+            logger.error(f"Failed to execute UPDATE query: {e}")
+            raise SPARQLWrapperException(f"UPDATE query failed: {e}") from e
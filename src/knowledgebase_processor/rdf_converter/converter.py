@@ -1,14 +1,411 @@
+from dataclasses import dataclass
 from datetime import date, datetime
-from typing import Any, Union, List, Optional
+from functools import lru_cache
+from typing import Any, Callable, Dict, Iterable, Tuple, Union, List, Optional
 
 from pydantic import BaseModel
 from rdflib import Graph, Literal, Namespace, URIRef
-from rdflib.namespace import RDF, RDFS, XSD, SDO as SCHEMA
+from rdflib.namespace import NamespaceManager, RDF, RDFS, XSD, SDO as SCHEMA
+from rdflib.plugins.serializers.nt import _quoteLiteral
 
 from knowledgebase_processor.models.kb_entities import KbBaseEntity
 from knowledgebase_processor.config.vocabulary import KB
 
 
+@dataclass(frozen=True, slots=True)
+class _FieldPlan:
+    """RDF mapping of a single model field."""
+    field_name: str
+    properties: Tuple[URIRef, ...]
+    is_object_prop: bool
+    datatype: Optional[URIRef]
+
+
+@dataclass(frozen=True, slots=True)
+class _RdfPlan:
+    """Class-invariant RDF metadata of an entity class."""
+    rdf_types: Tuple[URIRef, ...]
+    fallback_fields: Tuple[str, ...]
+    field_plans: Tuple[_FieldPlan, ...]
+
+
+# RDF plans by entity class, built on first conversion of each class
+_CLASS_RDF_CACHE: Dict[type, _RdfPlan] = {}
+
+# N-Triples writers by entity class, built on first serialization of each class
+_WRITERS: Dict[type, Callable[[KbBaseEntity, str], str]] = {}
+
+# Generated graph converters by entity class, compiled on first conversion of each class
+_COMPILED: Dict[type, Callable[[Graph, KbBaseEntity, str], None]] = {}
+
+
+def _prefix_map() -> Tuple[Tuple[str, URIRef], ...]:
+    """Return the prefix bindings of a converted graph, including rdflib's defaults."""
+    manager = NamespaceManager(Graph())
+    manager.bind("kb", KB)
+    manager.bind("schema", SCHEMA)
+    manager.bind("rdf", RDF)
+    manager.bind("rdfs", RDFS)
+    manager.bind("xsd", XSD)
+    return tuple(manager.namespaces())
+
+
+# Prefix bindings of every converted graph, resolved once instead of binding
+# (and checking) each prefix on every conversion
+_PREFIX_MAP = _prefix_map()
+
+
+def _new_graph() -> Graph:
+    """Create an empty graph with its own copy of the converter's prefix bindings."""
+    graph = Graph(bind_namespaces="none")
+    bind = graph.store.bind
+    for prefix, namespace in _PREFIX_MAP:
+        bind(prefix, namespace)
+    return graph
+
+
+# Terms used for every entity, resolved once instead of per triple
+_RDF_TYPE = RDF.type
+_RDFS_LABEL = RDFS.label
+_XSD_STRING = XSD.string
+
+# Normalized base URI prefixes ("<base>/") by base URI string
+_BASE_CACHE: Dict[str, str] = {}
+
+
+# Natural XSD datatype of the Python types written directly as N-Triples literals
+_NT_LITERAL_TYPES: Dict[type, URIRef] = {
+    bool: XSD.boolean,
+    int: XSD.integer,
+    datetime: XSD.dateTime,
+    date: XSD.date,
+}
+
+
+def _escape_nt(text: str) -> str:
+    """Escape a string for use inside an N-Triples quoted literal."""
+    return text.replace("\\", "\\\\").replace("\n", "\\n").replace('"', '\\"').replace("\r", "\\r")
+
+
+def _literal_nt(value: Any, datatype: Optional[URIRef]) -> str:
+    """Serialize a field value as an N-Triples literal term.
+
+    Produces the same lexical form as rdflib.Literal for plain strings,
+    booleans, integers, datetimes and dates in their natural datatype; other
+    values are serialized through rdflib.
+    """
+    value_type = type(value)
+    if value_type is str and (datatype is None or datatype == _XSD_STRING):
+        return f'"{_escape_nt(value)}"^^<{_XSD_STRING}>'
+    natural_datatype = _NT_LITERAL_TYPES.get(value_type)
+    if natural_datatype is not None and (datatype is None or datatype == natural_datatype):
+        if value_type is bool:
+            lexical = "true" if value else "false"
+        elif value_type is int:
+            lexical = str(value)
+        else:
+            lexical = value.isoformat()
+        return f'"{lexical}"^^<{natural_datatype}>'
+    return _quoteLiteral(Literal(value, datatype=datatype))
+
+
+# Marks a field missing from an instance __dict__
+_MISSING = object()
+
+
+def _base_prefix(base_uri_str: str) -> str:
+    """Return the base URI with exactly one trailing slash."""
+    prefix = _BASE_CACHE.get(base_uri_str)
+    if prefix is None:
+        prefix = _BASE_CACHE[base_uri_str] = base_uri_str.rstrip('/') + "/"
+    return prefix
+
+
+@lru_cache(maxsize=8192)
+def _resolve_uri(base_prefix: str, value: str) -> URIRef:
+    """Return the URIRef of an entity id, resolved against the base prefix unless it is a full URI.
+
+    Memoized because the same ids recur across entities (e.g. assignees and
+    projects), and constructing a URIRef is far more expensive than the lookup.
+    """
+    if "://" in value:
+        return URIRef(value)
+    return URIRef(base_prefix + value.lstrip('/'))
+
+
+def _class_config_data(cls: type) -> Optional[dict]:
+    """Return the json_schema_extra class configuration of a model class."""
+    if hasattr(cls, 'model_config') and isinstance(getattr(cls, 'model_config', None), dict): # Pydantic v2
+        return cls.model_config.get('json_schema_extra')
+    elif hasattr(cls, 'Config') and hasattr(cls.Config, 'json_schema_extra'): # Pydantic v1
+        return getattr(cls.Config, 'json_schema_extra', None)
+    return None
+
+
+def _build_plan(entity_cls: type) -> _RdfPlan:
+    """Collect the RDF metadata defined on an entity class and its bases."""
+    model_classes = [cls for cls in entity_cls.mro() if issubclass(cls, BaseModel)]
+
+    # rdf_types are cumulative.
+    # rdfs_label_fallback_fields are taken from the most specific class defining them.
+    fallback_fields: Tuple[str, ...] = ()
+    for cls in model_classes:
+        class_config_data = _class_config_data(cls)
+        if isinstance(class_config_data, dict) and 'rdfs_label_fallback_fields' in class_config_data:
+            potential_fallback_fields = class_config_data.get('rdfs_label_fallback_fields')
+            if isinstance(potential_fallback_fields, list):
+                # Defensive check: only string field names can be looked up
+                fallback_fields = tuple(f for f in potential_fallback_fields if isinstance(f, str))
+                break # Found the most specific, stop.
+
+    rdf_types: List[URIRef] = []
+    for cls in model_classes:
+        class_config_data = _class_config_data(cls)
+        if isinstance(class_config_data, dict):
+            rdf_types_for_class = class_config_data.get('rdf_types', [])
+            if isinstance(rdf_types_for_class, list):
+                for type_uri_val in rdf_types_for_class:
+                    type_uri = URIRef(type_uri_val) if isinstance(type_uri_val, str) else type_uri_val
+                    if isinstance(type_uri, URIRef) and type_uri not in rdf_types:
+                        rdf_types.append(type_uri)
+
+    # Determine how to access model fields based on Pydantic version
+    model_fields_accessor: dict = {}
+    is_pydantic_v2 = False
+    if hasattr(entity_cls, 'model_fields'):  # Pydantic v2
+        model_fields_accessor = entity_cls.model_fields
+        is_pydantic_v2 = True
+    elif hasattr(entity_cls, '__fields__'):  # Pydantic v1
+        model_fields_accessor = entity_cls.__fields__
+
+    field_plans: List[_FieldPlan] = []
+    for field_name, field_obj in model_fields_accessor.items():
+        rdf_meta: Optional[dict] = None
+        if is_pydantic_v2: # Pydantic v2: field_obj is FieldInfo
+            rdf_meta = getattr(field_obj, 'json_schema_extra', None)
+            if rdf_meta is None and hasattr(field_obj, 'extra'):
+                rdf_meta = field_obj.extra
+        else: # Pydantic v1: field_obj is ModelField
+            if hasattr(field_obj, 'field_info') and hasattr(field_obj.field_info, 'extra'):
+                rdf_meta = field_obj.field_info.extra
+
+        if not isinstance(rdf_meta, dict):
+            continue
+
+        properties: List[URIRef] = []
+        raw_props = rdf_meta.get('rdf_properties', [])
+        if isinstance(raw_props, list):
+            for p in raw_props:
+                properties.append(URIRef(p) if isinstance(p, str) else p)
+
+        raw_prop = rdf_meta.get('rdf_property')
+        if raw_prop:
+            properties.append(URIRef(raw_prop) if isinstance(raw_prop, str) else raw_prop)
+
+        properties = [p for p in properties if isinstance(p, URIRef)]
+        if not properties:
+            continue
+
+        rdf_datatype_uri_str = rdf_meta.get('rdf_datatype')
+        field_plans.append(_FieldPlan(
+            field_name=field_name,
+            properties=tuple(properties),
+            is_object_prop=bool(rdf_meta.get('is_object_property', False)),
+            datatype=URIRef(rdf_datatype_uri_str) if rdf_datatype_uri_str else None,
+        ))
+
+    return _RdfPlan(
+        rdf_types=tuple(rdf_types),
+        fallback_fields=fallback_fields,
+        field_plans=tuple(field_plans),
+    )
+
+
+def _get_plan(entity_cls: type) -> _RdfPlan:
+    """Return the cached RDF plan for an entity class, building it if needed."""
+    plan = _CLASS_RDF_CACHE.get(entity_cls)
+    if plan is None:
+        plan = _CLASS_RDF_CACHE[entity_cls] = _build_plan(entity_cls)
+    return plan
+
+
+def _build_writer(entity_cls: type) -> Callable[[KbBaseEntity, str], str]:
+    """Build an N-Triples writer for an entity class from its RDF plan.
+
+    The vocabulary of a class is fixed, so the rdf:type lines and predicate
+    terms are rendered once here and only the subject and field values are
+    formatted per entity.
+    """
+    plan = _get_plan(entity_cls)
+    type_suffixes = tuple(f"<{_RDF_TYPE}> <{type_uri}> .\n" for type_uri in plan.rdf_types)
+    field_writers = tuple(
+        (
+            field_plan.field_name,
+            tuple(f"<{p_uri}> " for p_uri in field_plan.properties),
+            field_plan.is_object_prop,
+            field_plan.datatype,
+            _RDFS_LABEL in field_plan.properties,
+        )
+        for field_plan in plan.field_plans
+    )
+    fallback_fields = plan.fallback_fields
+    label_predicate = f"<{_RDFS_LABEL}> "
+
+    def write(entity: KbBaseEntity, base_prefix: str) -> str:
+        kb_id = entity.kb_id
+        if "://" in kb_id:
+            subject = f"<{kb_id}> "
+        else:
+            subject = f"<{base_prefix}{kb_id.lstrip('/')}> "
+
+        # Pydantic keeps field values in the instance __dict__; reading it
+        # directly is cheaper than attribute access. Anything not stored there
+        # (e.g. properties) falls back to getattr.
+        values = getattr(entity, '__dict__', {})
+        lines = [subject + suffix for suffix in type_suffixes]
+
+        label_added_for_entity = False
+        for field_name, predicates, is_object_prop, datatype, is_label in field_writers:
+            value = values.get(field_name, _MISSING)
+            if value is _MISSING:
+                value = getattr(entity, field_name, None)
+
+            if value is None:
+                continue
+
+            current_field_values: List[Any] = value if isinstance(value, list) else [value]
+
+            objects: List[str] = []
+            for item_val in current_field_values:
+                if item_val is None:
+                    continue
+                if is_object_prop:
+                    item_val_str = str(getattr(item_val, 'kb_id', item_val))
+                    if "://" in item_val_str:
+                        objects.append(f"<{item_val_str}>")
+                    else:
+                        objects.append(f"<{base_prefix}{item_val_str.lstrip('/')}>")
+                else:
+                    objects.append(_literal_nt(item_val, datatype))
+
+            for predicate in predicates:
+                for obj in objects:
+                    lines.append(f"{subject}{predicate}{obj} .\n")
+            if is_label and not label_added_for_entity and any(
+                not (isinstance(item_val, str) and item_val.strip() == "")
+                for item_val in current_field_values if item_val is not None
+            ):
+                label_added_for_entity = True
+
+        if not label_added_for_entity:
+            for fallback_field_name in fallback_fields:
+                fallback_value = values.get(fallback_field_name, _MISSING)
+                if fallback_value is _MISSING:
+                    fallback_value = getattr(entity, fallback_field_name, None)
+                if fallback_value is not None:
+                    fallback_value_str = str(fallback_value)
+                    if fallback_value_str.strip():
+                        lines.append(f"{subject}{label_predicate}{_literal_nt(fallback_value_str, None)} .\n")
+                        break
+
+        return "".join(lines)
+
+    return write
+
+
+def _get_writer(entity_cls: type) -> Callable[[KbBaseEntity, str], str]:
+    """Return the cached N-Triples writer for an entity class, building it if needed."""
+    writer = _WRITERS.get(entity_cls)
+    if writer is None:
+        writer = _WRITERS[entity_cls] = _build_writer(entity_cls)
+    return writer
+
+
+def _compile_converter(entity_cls: type) -> Callable[[Graph, KbBaseEntity, str], None]:
+    """Generate and compile a function adding an entity's triples to a graph.
+
+    The RDF plan of a class never changes, so its branches (object property or
+    literal, datatype, whether the field can set rdfs:label) are decided here
+    once. The generated function is straight-line code over pre-resolved terms
+    that only tests the values of the entity being converted.
+    """
+    plan = _get_plan(entity_cls)
+    namespace: Dict[str, Any] = {
+        "_MISSING": _MISSING,
+        "_resolve_uri": _resolve_uri,
+        "_Literal": Literal,
+        "_XSD_STRING": _XSD_STRING,
+        "_RDF_TYPE": _RDF_TYPE,
+        "_RDFS_LABEL": _RDFS_LABEL,
+        "_EMPTY": {},
+    }
+    lines = [
+        "def add_entity(g, entity, base_prefix):",
+        "    values = getattr(entity, '__dict__', _EMPTY)",
+        "    uri = _resolve_uri(base_prefix, entity.kb_id)",
+        "    add = g.add",
+    ]
+    for i, type_uri in enumerate(plan.rdf_types):
+        namespace[f"_T{i}"] = type_uri
+        lines.append(f"    add((uri, _RDF_TYPE, _T{i}))")
+    lines.append("    label_added = False")
+
+    for i, field_plan in enumerate(plan.field_plans):
+        name = field_plan.field_name
+        if field_plan.is_object_prop:
+            rdf_object = "_resolve_uri(base_prefix, str(getattr(item, 'kb_id', item)))"
+        elif field_plan.datatype is None:
+            rdf_object = "_Literal(item, datatype=_XSD_STRING) if isinstance(item, str) else _Literal(item)"
+        else:
+            namespace[f"_D{i}"] = field_plan.datatype
+            rdf_object = f"_Literal(item, datatype=_D{i})"
+        lines += [
+            f"    value = values.get({name!r}, _MISSING)",
+            "    if value is _MISSING:",
+            f"        value = getattr(entity, {name!r}, None)",
+            "    if value is not None:",
+            "        for item in (value if isinstance(value, list) else (value,)):",
+            "            if item is None:",
+            "                continue",
+            f"            rdf_object = {rdf_object}",
+        ]
+        for j, p_uri in enumerate(field_plan.properties):
+            namespace[f"_P{i}_{j}"] = p_uri
+            lines.append(f"            add((uri, _P{i}_{j}, rdf_object))")
+        if _RDFS_LABEL in field_plan.properties:
+            lines += [
+                "            if not (isinstance(item, str) and item.strip() == ''):",
+                "                label_added = True",
+            ]
+
+    if plan.fallback_fields:
+        # Apply the class-defined rdfs:label fallback if no explicit label was added
+        lines.append("    if not label_added:")
+        for name in plan.fallback_fields:
+            lines += [
+                f"        value = values.get({name!r}, _MISSING)",
+                "        if value is _MISSING:",
+                f"            value = getattr(entity, {name!r}, None)",
+                "        if value is not None:",
+                "            label = str(value)",
+                "            if label.strip():",
+                "                add((uri, _RDFS_LABEL, _Literal(label, datatype=_XSD_STRING)))",
+                "                return",
+            ]
+
+    source = "\n".join(lines) + "\n"
+    exec(compile(source, f"<rdf converter for {entity_cls.__qualname__}>", "exec"), namespace)
+    return namespace["add_entity"]
+
+
+def _get_compiled(entity_cls: type) -> Callable[[Graph, KbBaseEntity, str], None]:
+    """Return the compiled graph converter for an entity class, building it if needed."""
+    add_entity = _COMPILED.get(entity_cls)
+    if add_entity is None:
+        add_entity = _COMPILED[entity_cls] = _compile_converter(entity_cls)
+    return add_entity
+
+
 class RdfConverter:
     """
     Converts Knowledge Base entities to RDF graphs.
@@ -27,153 +424,88 @@ class RdfConverter:
         Returns:
             An rdflib.Graph representing the entity.
         """
-        g = Graph()
-        g.bind("kb", KB)
-        g.bind("schema", SCHEMA)
-        g.bind("rdf", RDF)
-        g.bind("rdfs", RDFS)
-        g.bind("xsd", XSD)
-
-        if "://" in entity.kb_id:
-            entity_uri = URIRef(entity.kb_id)
-        else:
-            entity_uri = URIRef(base_uri_str.rstrip('/') + "/" + entity.kb_id.lstrip('/'))
-
-        added_rdf_types = set()
-        rdfs_label_fallback_field_names: List[str] = []
-        
-        # 1. Process class-level configurations by iterating through MRO
-        # rdf_types are cumulative.
-        # rdfs_label_fallback_fields are taken from the most specific class defining them.
-        
-        # First, find the most specific rdfs_label_fallback_fields
-        for cls in type(entity).mro():
-            if not issubclass(cls, BaseModel):
-                continue
+        g = _new_graph()
+        self._add_entity(g, entity, base_uri_str)
+        return g
 
-            class_config_data: Optional[dict] = None
-            if hasattr(cls, 'model_config') and isinstance(getattr(cls, 'model_config', None), dict): # Pydantic v2
-                class_config_data = cls.model_config.get('json_schema_extra')
-            elif hasattr(cls, 'Config') and hasattr(cls.Config, 'json_schema_extra'): # Pydantic v1
-                class_config_data = getattr(cls.Config, 'json_schema_extra', None)
-
-            if isinstance(class_config_data, dict):
-                if 'rdfs_label_fallback_fields' in class_config_data:
-                    potential_fallback_fields = class_config_data.get('rdfs_label_fallback_fields')
-                    if isinstance(potential_fallback_fields, list):
-                        rdfs_label_fallback_field_names = potential_fallback_fields
-                        break # Found the most specific, stop.
-        
-        # Then, accumulate all rdf_types from MRO
-        for cls in type(entity).mro():
-            if not issubclass(cls, BaseModel):
-                continue
+    def kb_entities_to_graph(
+        self,
+        entities: Iterable[KbBaseEntity],
+        graph: Optional[Graph] = None,
+        base_uri_str: str = "http://example.org/kb/",
+    ) -> Graph:
+        """
+        Converts several KB entities into a single rdflib.Graph.
 
-            class_config_data: Optional[dict] = None
-            if hasattr(cls, 'model_config') and isinstance(getattr(cls, 'model_config', None), dict): # Pydantic v2
-                class_config_data = cls.model_config.get('json_schema_extra')
-            elif hasattr(cls, 'Config') and hasattr(cls.Config, 'json_schema_extra'): # Pydantic v1
-                class_config_data = getattr(cls.Config, 'json_schema_extra', None)
-
-            if isinstance(class_config_data, dict):
-                rdf_types_for_class = class_config_data.get('rdf_types', [])
-                if isinstance(rdf_types_for_class, list):
-                    for type_uri_val in rdf_types_for_class:
-                        type_uri = URIRef(type_uri_val) if isinstance(type_uri_val, str) else type_uri_val
-                        if isinstance(type_uri, URIRef) and type_uri not in added_rdf_types:
-                            g.add((entity_uri, RDF.type, type_uri))
-                            added_rdf_types.add(type_uri)
-
-        label_added_for_entity = False # True if an explicit label is added from fields
-
-        # 2. Determine how to access model fields based on Pydantic version
-        model_fields_accessor: dict = {}
-        is_pydantic_v2 = False
-        if hasattr(type(entity), 'model_fields'):  # Pydantic v2
-            model_fields_accessor = type(entity).model_fields
-            is_pydantic_v2 = True
-        elif hasattr(entity, '__fields__'):  # Pydantic v1
-            model_fields_accessor = entity.__fields__
-
-        # 3. Process field-level properties
-        for field_name, field_obj in model_fields_accessor.items():
-            value = getattr(entity, field_name, None)
+        Triples are added straight into one graph instead of building a graph
+        per entity and merging it, so each triple is only hashed once.
 
-            if value is None:
-                continue
+        Args:
+            entities: The KbBaseEntity instances to convert.
+            graph: Graph to add the triples to. A new graph sharing the
+                   converter's prefix bindings is created if not given.
+            base_uri_str: The base URI string to use for constructing entity URIs
+                          if kb_id is not already a full URI.
 
-            rdf_meta: Optional[dict] = None
-            if is_pydantic_v2: # Pydantic v2: field_obj is FieldInfo
-                rdf_meta = getattr(field_obj, 'json_schema_extra', None)
-                if rdf_meta is None and hasattr(field_obj, 'extra'): 
-                    rdf_meta = field_obj.extra
-            else: # Pydantic v1: field_obj is ModelField
-                if hasattr(field_obj, 'field_info') and hasattr(field_obj.field_info, 'extra'):
-                    rdf_meta = field_obj.field_info.extra
-            
-            if not isinstance(rdf_meta, dict): 
-                rdf_meta = {}
-
-            properties_to_process_uris: List[URIRef] = []
-            raw_props = rdf_meta.get('rdf_properties', [])
-            if isinstance(raw_props, list):
-                for p in raw_props:
-                    properties_to_process_uris.append(URIRef(p) if isinstance(p, str) else p)
-            
-            raw_prop = rdf_meta.get('rdf_property')
-            if raw_prop:
-                properties_to_process_uris.append(URIRef(raw_prop) if isinstance(raw_prop, str) else raw_prop)
-
-            is_object_prop = rdf_meta.get('is_object_property', False)
-            rdf_datatype_uri_str = rdf_meta.get('rdf_datatype')
-            rdf_datatype_uri = URIRef(rdf_datatype_uri_str) if rdf_datatype_uri_str else None
-            
-            current_field_values: List[Any] = []
-            if isinstance(value, list):
-                current_field_values.extend(value)
-            else:
-                current_field_values.append(value)
-
-            for p_uri in properties_to_process_uris:
-                if not isinstance(p_uri, URIRef): continue
-
-                for item_val in current_field_values:
-                    if item_val is None:
-                        continue
-
-                    rdf_object: Union[URIRef, Literal]
-                    if is_object_prop:
-                        item_val_str = str(getattr(item_val, 'kb_id', item_val))
-                        
-                        if "://" in item_val_str:
-                            rdf_object = URIRef(item_val_str)
-                        else:
-                            rdf_object = URIRef(base_uri_str.rstrip('/') + "/" + item_val_str.lstrip('/'))
-                    else:
-                        effective_datatype = rdf_datatype_uri
-                        if isinstance(item_val, str) and effective_datatype is None:
-                            effective_datatype = XSD.string
-                        rdf_object = Literal(item_val, datatype=effective_datatype)
-                    
-                    g.add((entity_uri, p_uri, rdf_object))
-                    if p_uri == RDFS.label and item_val is not None: 
-                        if isinstance(item_val, str) and item_val.strip() == "":
-                            pass 
-                        else:
-                            label_added_for_entity = True
-        
-        # 4. Apply class-defined rdfs:label fallback if no explicit label was added
-        if not label_added_for_entity and rdfs_label_fallback_field_names:
-            for fallback_field_name in rdfs_label_fallback_field_names:
-                # Defensive check: ensure fallback_field_name is a string and an attribute
-                if not isinstance(fallback_field_name, str) or not hasattr(entity, fallback_field_name):
-                    continue
-                
-                fallback_value = getattr(entity, fallback_field_name, None)
-                if fallback_value is not None:
-                    fallback_value_str = str(fallback_value)
-                    if fallback_value_str.strip(): 
-                        g.add((entity_uri, RDFS.label, Literal(fallback_value_str, datatype=XSD.string)))
-                        break # Stop after the first successful fallback
+        Returns:
+            The graph containing the triples of all entities.
+        """
+        if graph is None:
+            graph = _new_graph()
+        for entity in entities:
+            self._add_entity(graph, entity, base_uri_str)
+        return graph
+
+    def kb_entity_to_ntriples(self, entity: KbBaseEntity, base_uri_str: str = "http://example.org/kb/") -> str:
+        """
+        Converts a KB entity instance directly to N-Triples text.
+
+        Produces the same triples as kb_entity_to_graph without building an
+        rdflib.Graph, for output that is only serialized or uploaded, e.g. via
+        SparqlQueryInterface.load_ntriples.
+
+        Args:
+            entity: The KbBaseEntity instance to convert.
+            base_uri_str: The base URI string to use for constructing entity URIs
+                          if kb_id is not already a full URI.
 
-        return g
\ No newline at end of file
+        Returns:
+            Newline-terminated N-Triples lines describing the entity.
+        """
+        return _get_writer(type(entity))(entity, _base_prefix(base_uri_str))
+
+    def kb_entities_to_ntriples(
+        self,
+        entities: Iterable[KbBaseEntity],
+        base_uri_str: str = "http://example.org/kb/",
+    ) -> str:
+        """
+        Converts several KB entities directly to N-Triples text.
+
+        Unlike kb_entities_to_graph, triples shared by several entities are not
+        deduplicated; stores and parsers treat repeated triples as one.
+
+        Args:
+            entities: The KbBaseEntity instances to convert.
+            base_uri_str: The base URI string to use for constructing entity URIs
+                          if kb_id is not already a full URI.
+
+        Returns:
+            Newline-terminated N-Triples lines describing all entities.
+        """
+        base_prefix = _base_prefix(base_uri_str)
+        writers = _WRITERS
+        parts = []
+        for entity in entities:
+            entity_cls = type(entity)
+            writer = writers.get(entity_cls) or _get_writer(entity_cls)
+            parts.append(writer(entity, base_prefix))
+        return "".join(parts)
+
+    def _add_entity(self, g: Graph, entity: KbBaseEntity, base_uri_str: str) -> None:
+        """
+        Adds the triples describing a KB entity to a graph.
+        """
+        entity_cls = type(entity)
+        add_entity = _COMPILED.get(entity_cls) or _get_compiled(entity_cls)
+        add_entity(g, entity, _base_prefix(base_uri_str))
@@ -1,17 +1,135 @@
 """Reader implementation for accessing the knowledge base."""
 
+import itertools
+import mmap
 import os
 import re
 import yaml
+from collections import deque
+from concurrent.futures import Future, ThreadPoolExecutor
+from datetime import datetime
 from pathlib import Path
-from typing import List, Optional, Iterator, Dict, Any
+from typing import List, Optional, Iterator, Dict, Any, Tuple, Union
 
 from ..models.content import Document
 from ..models.metadata import DocumentMetadata, Frontmatter
+from ..utils.file_patterns import parse_suffix_pattern
+from ..utils.frontmatter import load_frontmatter_yaml
 from ..utils.logging import get_logger
 
 logger = get_logger(__name__)
 
+# Files at least this large are read through a memory map
+_MMAP_THRESHOLD = 4 * 1024 * 1024
+
+# Number of files whose reads are submitted to the kernel together when
+# iter_documents reads ahead, and whether the platform supports it (Linux and
+# most Unixes)
+_READAHEAD_BATCH = 64
+_HAS_FADVISE = hasattr(os, 'posix_fadvise')
+
+# First level-one heading, used as a fallback title
+_FIRST_HEADING_RE = re.compile(r'^#\s+(.+)$', re.MULTILINE)
+
+# Turns a file name into a title, e.g. "my_first-note" -> "my first note"
+_TITLE_TRANS = str.maketrans({'_': ' ', '-': ' '})
+# File names too generic to serve as a title
+_GENERIC_STEMS = frozenset(('readme', 'index', 'untitled'))
+
+
+def _iter_suffix_files(root: str, suffix: Union[str, Tuple[str, ...]], recursive: bool) -> Iterator[str]:
+    """Yield the paths of the files below root whose names end with suffix.
+    
+    suffix may also be a tuple of suffixes, matching names ending with any of them.
+    
+    Equivalent to Path(root).glob("**/*" + suffix) (or "*" + suffix when not
+    recursive) for files, but walks the tree with os.scandir so directory
+    entries are not stat()ed through Path objects and names are matched with
+    str.endswith instead of fnmatch. Like pathlib's "**", symlinked directories
+    are not followed.
+    """
+    stack = [root]
+    while stack:
+        directory = stack.pop()
+        try:
+            with os.scandir(directory) as entries:
+                for entry in entries:
+                    if entry.is_dir(follow_symlinks=False):
+                        if recursive:
+                            stack.append(entry.path)
+                    elif entry.name.endswith(suffix):
+                        yield entry.path
+        except OSError as e:
+            logger.warning(f"Could not scan directory {directory}: {e}")
+
+
+def _readahead(paths: List[Path]) -> None:
+    """Ask the kernel to start reading a batch of files into the page cache.
+    
+    The reads proceed in the background and in parallel, so the blocking reads
+    that follow are mostly served from memory instead of waiting on one file at
+    a time. This costs an extra open and close per file, so it only pays off
+    when the files are not already cached (e.g. a first run over a large or
+    network-mounted knowledge base). Files that cannot be opened are skipped;
+    reading them reports the error.
+    """
+    for path in paths:
+        try:
+            fd = os.open(path, os.O_RDONLY)
+        except OSError:
+            continue
+        try:
+            os.posix_fadvise(fd, 0, 0, os.POSIX_FADV_WILLNEED)
+        except OSError:
+            pass
+        finally:
+            os.close(fd)
+
+
+def _whitespace_line_end(content: str, start: int) -> int:
+    """Return the index after the last newline in the whitespace run at start, or -1."""
+    end = start
+    length = len(content)
+    while end < length and content[end].isspace():
+        end += 1
+    newline = content.rfind('\n', start, end)
+    return newline + 1 if newline != -1 else -1
+
+
+def _split_frontmatter(content: str) -> Optional[tuple[str, int]]:
+    """Locate a YAML frontmatter block delimited by "---" lines.
+    
+    The block is an opening "---" line, the YAML text and the first closing
+    "---" line; blank lines after either delimiter are skipped. It is found
+    with str.find instead of a DOTALL regex scan, so documents without
+    frontmatter are rejected after looking at their first characters.
+    
+    Returns:
+        Tuple of (yaml_text, body_start), or None if there is no frontmatter
+    """
+    if not content.startswith('---'):
+        return None
+    yaml_start = _whitespace_line_end(content, 3)
+    if yaml_start == -1:
+        return None
+    
+    yaml_end = content.find('\n---', yaml_start)
+    while yaml_end != -1:
+        body_start = _whitespace_line_end(content, yaml_end + 4)
+        if body_start != -1:
+            return content[yaml_start:yaml_end], body_start
+        yaml_end = content.find('\n---', yaml_end + 1)
+    
+    # The closing delimiter may directly follow the opening one ("---\n---\n")
+    # when the block is empty, using the last newline of the opening line.
+    yaml_end = yaml_start - 1
+    previous_newline = content.rfind('\n', 3, yaml_end)
+    if previous_newline != -1 and content.startswith('---', yaml_start):
+        body_start = _whitespace_line_end(content, yaml_end + 4)
+        if body_start != -1:
+            return content[previous_newline + 1:yaml_end], body_start
+    return None
+
 
 class Reader:
     """Reader component for accessing the knowledge base.
@@ -31,6 +149,8 @@ class Reader:
             raise ValueError(f"Base path does not exist: {base_path}")
         if not self.base_path.is_dir():
             raise ValueError(f"Base path is not a directory: {base_path}")
+        # Prefix stripped from absolute file paths to make them relative
+        self._base_prefix = str(self.base_path).rstrip(os.sep) + os.sep
     
     def list_files(self, pattern: str = "**/*.md") -> List[Path]:
         """List all files in the knowledge base matching the pattern.
@@ -44,7 +164,25 @@ class Reader:
         if not pattern:
             logger.warning("Empty pattern provided to list_files, defaulting to '**/*.md'")
             pattern = "**/*.md"
-        return list(self.base_path.glob(pattern))
+        return list(self._iter_files(pattern))
+
+    def _iter_files(self, pattern: str) -> Iterator[Path]:
+        """Lazily yield the files matching a glob pattern.
+        
+        Patterns selecting files by name suffix below a literal directory, such
+        as "**/*.md" or "notes/*.txt", are walked with os.scandir; anything else
+        goes through Path.glob.
+        """
+        suffix_pattern = parse_suffix_pattern(pattern)
+        if suffix_pattern is None:
+            yield from self.base_path.glob(pattern)
+            return
+        directory, recursive, suffix = suffix_pattern
+        root = os.path.join(str(self.base_path), directory) if directory else str(self.base_path)
+        if directory and not os.path.isdir(root):
+            return
+        for path in _iter_suffix_files(root, suffix, recursive):
+            yield Path(path)
 
     def read_all_paths(self, pattern: str = "**/*.md") -> Iterator[Path]:
         """Read all file paths matching the pattern.
@@ -58,8 +196,7 @@ class Reader:
         if not pattern:
             logger.warning("Empty pattern provided to read_all_paths, defaulting to '**/*.md'")
             pattern = "**/*.md"
-        for path in self.list_files(pattern):
-            yield path
+        yield from self._iter_files(pattern)
 
     def read_content(self, path: str) -> str:
         """Reads the content of a file.
@@ -70,8 +207,32 @@ class Reader:
         Returns:
             The content of the file as a string.
         """
-        with open(path, 'r', encoding='utf-8') as f:
-            return f.read()
+        # Read the raw bytes in one go and decode once, instead of going through
+        # a buffered text wrapper that decodes in small chunks.
+        fd = os.open(path, os.O_RDONLY)
+        try:
+            size = os.fstat(fd).st_size
+            if size >= _MMAP_THRESHOLD:
+                # Decode straight from the mapping, so large files are never
+                # held in memory as bytes and str at the same time.
+                with mmap.mmap(fd, 0, access=mmap.ACCESS_READ) as mm:
+                    content = str(mm, 'utf-8')
+            else:
+                chunks = []
+                while True:
+                    chunk = os.read(fd, max(size, 1))
+                    if not chunk:
+                        break
+                    chunks.append(chunk)
+                data = chunks[0] if len(chunks) == 1 else b''.join(chunks)
+                content = data.decode('utf-8')
+        finally:
+            os.close(fd)
+        
+        # Match text-mode universal newlines
+        if '\r' in content:
+            content = content.replace('\r\n', '\n').replace('\r', '\n')
+        return content
 
     def parse_frontmatter(self, content: str) -> tuple[Optional[Dict[str, Any]], str]:
         """Parse YAML frontmatter from markdown content.
@@ -82,26 +243,31 @@ class Reader:
         Returns:
             Tuple of (frontmatter_dict, content_without_frontmatter)
         """
-        # Check for YAML frontmatter pattern
-        frontmatter_pattern = re.compile(r'^---\s*\n(.*?)\n---\s*\n', re.DOTALL | re.MULTILINE)
-        match = frontmatter_pattern.match(content)
+        frontmatter_data, body_start = self._parse_frontmatter(content)
+        return frontmatter_data, content[body_start:] if body_start else content
+    
+    def _parse_frontmatter(self, content: str) -> tuple[Optional[Dict[str, Any]], int]:
+        """Parse YAML frontmatter and return it with the offset where the body starts.
+        
+        Returning the offset lets callers search the body in place instead of
+        copying it out of the document.
+        """
+        # Check for YAML frontmatter
+        frontmatter = _split_frontmatter(content)
         
-        if not match:
-            return None, content
+        if frontmatter is None:
+            return None, 0
             
         try:
             # Parse the YAML frontmatter
-            yaml_content = match.group(1)
-            frontmatter_data = yaml.safe_load(yaml_content) or {}
-            
-            # Remove frontmatter from content
-            content_without_frontmatter = content[match.end():]
+            yaml_content, body_start = frontmatter
+            frontmatter_data = load_frontmatter_yaml(yaml_content) or {}
             
-            return frontmatter_data, content_without_frontmatter
+            return frontmatter_data, body_start
             
         except yaml.YAMLError as e:
             logger.warning(f"Failed to parse YAML frontmatter: {e}")
-            return None, content
+            return None, 0
     
     def read_file(self, path: Path) -> Document:
         """Read a file and return it as a Document.
@@ -111,27 +277,34 @@ class Reader:
             
         Returns:
             Document object containing the file content
+            
+        Raises:
+            FileNotFoundError: If the file does not exist
         """
-        if not path.exists():
-            raise FileNotFoundError(f"File not found: {path}")
-        
-        relative_path = path.relative_to(self.base_path) if path.is_absolute() else path
+        path_str = os.fspath(path)
+        if not os.path.isabs(path_str):
+            relative_path = path_str
+        elif path_str.startswith(self._base_prefix):
+            relative_path = path_str[len(self._base_prefix):]
+        else:
+            relative_path = str(path.relative_to(self.base_path))
         
-        content = self.read_content(str(path))
+        content = self.read_content(path_str)
         
         # Parse frontmatter
-        frontmatter_data, content_without_frontmatter = self.parse_frontmatter(content)
+        frontmatter_data, body_start = self._parse_frontmatter(content)
         
         # Determine title: frontmatter title > processed filename > first heading
         if frontmatter_data and 'title' in frontmatter_data:
             title = frontmatter_data['title']
         else:
             # Fall back to processed filename first (convert underscores/hyphens to spaces)
-            title = path.stem.replace("_", " ").replace("-", " ")
+            title = path.stem.translate(_TITLE_TRANS)
             
             # If filename processing results in something generic, try first heading
-            if not title or title.lower() in ['readme', 'index', 'untitled']:
-                heading_match = re.search(r'^#\s+(.+)$', content_without_frontmatter, re.MULTILINE)
+            if not title or title.lower() in _GENERIC_STEMS:
+                # body_start follows a newline, so "^" matches there
+                heading_match = _FIRST_HEADING_RE.search(content, body_start)
                 if heading_match:
                     title = heading_match.group(1).strip()
         
@@ -149,8 +322,8 @@ class Reader:
             date_val = frontmatter_data.get('date')
             if isinstance(date_val, str):
                 try:
-                    from datetime import datetime
-                    date_val = datetime.fromisoformat(date_val.replace('Z', '+00:00'))
+                    # fromisoformat accepts a trailing "Z" on Python 3.11+
+                    date_val = datetime.fromisoformat(date_val)
                 except ValueError:
                     logger.warning(f"Could not parse date from frontmatter: {date_val}")
                     date_val = None
@@ -165,11 +338,12 @@ class Reader:
         
         # Create metadata
         doc_metadata = DocumentMetadata(
-            document_id=str(relative_path),  # Will be replaced by proper ID generation later
-            path=str(relative_path),
+            document_id=relative_path,  # Will be replaced by proper ID generation later
+            path=relative_path,
             title=title,
             frontmatter=frontmatter_obj,
-            tags=set(frontmatter_obj.tags) if frontmatter_obj else set(),
+            # Validation builds the tag set itself, so pass the list as is
+            tags=frontmatter_obj.tags if frontmatter_obj else (),
             links=[],  # Will be populated by extractors
             wikilinks=[],  # Will be populated by extractors
             entities=[],  # Will be populated by extractors
@@ -178,18 +352,24 @@ class Reader:
         )
         
         return Document(
-            path=str(relative_path),
+            path=relative_path,
             title=title,
             content=content,
             elements=[],  # Elements will be populated by the Processor
             metadata=doc_metadata
         )
     
-    def read_all(self, pattern: str = "**/*.md") -> Iterator[Document]:
+    def read_all(self, pattern: str = "**/*.md", max_workers: int = 1, prefetch: int = 16,
+                 readahead: bool = False) -> Iterator[Document]:
         """Read all files matching the pattern and yield Documents.
         
         Args:
             pattern: Glob pattern to match files (default: "**/*.md")
+            max_workers: Number of threads reading files ahead of the caller
+                (default: 1, files are read one at a time on the calling thread)
+            prefetch: Number of files read ahead when max_workers > 1
+            readahead: Whether serial reads ask the kernel to read files
+                ahead (see iter_documents; default: False)
             
         Yields:
             Document objects for each matching file
@@ -197,5 +377,85 @@ class Reader:
         if not pattern:
             logger.warning("Empty pattern provided to read_all, defaulting to '**/*.md'")
             pattern = "**/*.md"
-        for path in self.list_files(pattern):
-            yield self.read_file(path)
\ No newline at end of file
+        for _, document in self.iter_documents(pattern, max_workers=max_workers, prefetch=prefetch,
+                                               readahead=readahead):
+            yield document
+
+    def read_all_parallel(self, pattern: str = "**/*.md", prefetch: int = 16, max_workers: Optional[int] = None) -> Iterator[Document]:
+        """Read all files matching the pattern, reading ahead on worker threads.
+        
+        Up to `prefetch` files are read concurrently while the caller processes
+        the current document, overlapping file IO with processing. Documents are
+        yielded in the same order as read_all.
+        
+        Args:
+            pattern: Glob pattern to match files (default: "**/*.md")
+            prefetch: Number of files read ahead (e.g. 4 for local SSDs,
+                32 for network filesystems)
+            max_workers: Number of reading threads (default: prefetch)
+            
+        Yields:
+            Document objects for each matching file
+        """
+        if not pattern:
+            logger.warning("Empty pattern provided to read_all_parallel, defaulting to '**/*.md'")
+            pattern = "**/*.md"
+        prefetch = max(1, prefetch)
+        for _, document in self.iter_documents(pattern, max_workers=max_workers or prefetch, prefetch=prefetch):
+            yield document
+
+    def iter_documents(self, pattern: str = "**/*.md", max_workers: int = 1, prefetch: int = 16,
+                       readahead: bool = False) -> Iterator[Tuple[Path, Document]]:
+        """Read all files matching the pattern and yield them with their paths.
+        
+        With max_workers > 1, a sliding window of up to `prefetch` files is read
+        on a thread pool while the caller processes the current document; file
+        reads release the GIL, so IO latency overlaps with processing. Otherwise
+        files are read on the calling thread; with readahead, the kernel is
+        first asked to read each batch of _READAHEAD_BATCH files ahead where
+        posix_fadvise is available. Results are yielded in path order either
+        way.
+        
+        Args:
+            pattern: Glob pattern to match files (default: "**/*.md")
+            max_workers: Number of threads reading files (default: 1, read on
+                the calling thread)
+            prefetch: Maximum number of files read ahead of the caller
+            readahead: Whether serial reads ask the kernel to read files
+                ahead; this speeds up reading files that are not in the page
+                cache but adds syscalls per file when they are (default: False)
+            
+        Yields:
+            Tuples of (path, Document) for each matching file
+        """
+        if not pattern:
+            logger.warning("Empty pattern provided to iter_documents, defaulting to '**/*.md'")
+            pattern = "**/*.md"
+        paths = self._iter_files(pattern)
+        if max_workers <= 1:
+            if not (readahead and _HAS_FADVISE):
+                for path in paths:
+                    yield path, self.read_file(path)
+                return
+            while True:
+                batch = list(itertools.islice(paths, _READAHEAD_BATCH))
+                if not batch:
+                    return
+                _readahead(batch)
+                for path in batch:
+                    yield path, self.read_file(path)
+        
+        prefetch = max(1, prefetch)
+        pending: "deque[Tuple[Path, Future[Document]]]" = deque()
+        executor = ThreadPoolExecutor(max_workers=min(max_workers, prefetch))
+        try:
+            for path in paths:
+                pending.append((path, executor.submit(self.read_file, path)))
+                if len(pending) >= prefetch:
+                    path, future = pending.popleft()
+                    yield path, future.result()
+            while pending:
+                path, future = pending.popleft()
+                yield path, future.result()
+        finally:
+            executor.shutdown(wait=True, cancel_futures=True)
@@ -4,12 +4,26 @@ This module provides service classes that encapsulate business logic
 for different aspects of the knowledge base processor.
 """
 
-from .entity_service import EntityService
-from .sparql_service import SparqlService
-from .processing_service import ProcessingService
+import importlib
+
+# Service classes are imported on first use, so importing one service module
+# (e.g. the orchestrator) doesn't load the dependencies of all the others
+_EXPORTS = {
+    'EntityService': '.entity_service',
+    'SparqlService': '.sparql_service',
+    'ProcessingService': '.processing_service',
+}
 
 __all__ = [
     'EntityService',
     'SparqlService', 
     'ProcessingService'
-]
\ No newline at end of file
+]
+
+
+def __getattr__(name):
+    if name in _EXPORTS:
+        value = getattr(importlib.import_module(_EXPORTS[name], __name__), name)
+        globals()[name] = value
+        return value
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
@@ -1,6 +1,8 @@
 """Entity service for handling entity transformation and KB ID generation."""
 
-from typing import Optional
+from collections import Counter
+from functools import lru_cache
+from typing import List, Optional
 from urllib.parse import quote
 
 from ..models.entities import ExtractedEntity
@@ -9,18 +11,43 @@ from ..utils.id_generator import EntityIdGenerator
 from ..utils.logging import get_logger
 
 
+# Number of (entity type, text) -> KB ID results kept by each EntityService
+_KB_ID_CACHE_SIZE = 100_000
+
+# Number of source path -> document URI results kept by each EntityService
+_DOCUMENT_ID_CACHE_SIZE = 4096
+
+
 class EntityService:
     """Handles entity transformation and KB ID generation."""
     
+    # KB entity type name, class and name field by upper-cased extracted entity label.
+    # GPE (Geopolitical Entity) often maps to Location.
+    _LABEL_MAP = {
+        "PERSON": ("Person", KbPerson, "full_name"),
+        "ORG": ("Organization", KbOrganization, "name"),
+        "LOC": ("Location", KbLocation, "name"),
+        "GPE": ("Location", KbLocation, "name"),
+        "DATE": ("DateEntity", KbDateEntity, "date_value"),
+    }
+    
     def __init__(self, base_uri: str = "http://example.org/kb/"):
         """Initialize the EntityService."""
         self.logger = get_logger("knowledgebase_processor.services.entity")
         self.id_generator = EntityIdGenerator(base_uri)
+        # IDs are deterministic and the same entities recur across documents,
+        # so repeated lookups skip the text normalization.
+        self._cached_kb_id = lru_cache(maxsize=_KB_ID_CACHE_SIZE)(self._generate_kb_id)
+        # Every entity of a document shares its document URI.
+        self._cached_document_id = lru_cache(maxsize=_DOCUMENT_ID_CACHE_SIZE)(
+            self.id_generator.generate_document_id
+        )
     
     def generate_kb_id(self, entity_type_str: str, text: str) -> str:
         """Generates a deterministic knowledge base ID (URI) for an entity.
         
-        Uses the new deterministic ID generation from ADR-0013.
+        Uses the new deterministic ID generation from ADR-0013. Results are
+        cached per (entity type, text).
         
         Args:
             entity_type_str: The type of entity (e.g., "Person", "Organization")
@@ -29,6 +56,10 @@ class EntityService:
         Returns:
             A deterministic URI for the entity
         """
+        return self._cached_kb_id(entity_type_str, text)
+    
+    def _generate_kb_id(self, entity_type_str: str, text: str) -> str:
+        """Generates the KB ID for an entity without consulting the cache."""
         if entity_type_str.lower() == "person":
             return self.id_generator.generate_person_id(text)
         elif entity_type_str.lower() == "organization":
@@ -58,10 +89,16 @@ class EntityService:
         """
         kb_id_text = extracted_entity.text
         entity_label_upper = extracted_entity.label.upper()
-        self.logger.info(f"Processing entity: {kb_id_text} of type {entity_label_upper}")
+        # Called per entity: log at debug level and let logging format lazily.
+        self.logger.debug("Processing entity: %s of type %s", kb_id_text, entity_label_upper)
+
+        mapping = self._LABEL_MAP.get(entity_label_upper)
+        if mapping is None:
+            self.logger.debug("Unhandled entity type: %s for text: '%s'", extracted_entity.label, extracted_entity.text)
+            return None
 
         # Create a full URI for the source document using deterministic ID generation
-        full_document_uri = self.id_generator.generate_document_id(source_doc_relative_path)
+        full_document_uri = self._cached_document_id(source_doc_relative_path)
 
         common_args = {
             "label": extracted_entity.text,
@@ -69,18 +106,51 @@ class EntityService:
             "extracted_from_text_span": (extracted_entity.start_char, extracted_entity.end_char),
         }
 
-        if entity_label_upper == "PERSON":
-            kb_id = self.generate_kb_id("Person", kb_id_text)
-            return KbPerson(kb_id=kb_id, full_name=extracted_entity.text, **common_args)
-        elif entity_label_upper == "ORG":
-            kb_id = self.generate_kb_id("Organization", kb_id_text)
-            return KbOrganization(kb_id=kb_id, name=extracted_entity.text, **common_args)
-        elif entity_label_upper in ["LOC", "GPE"]:  # GPE (Geopolitical Entity) often maps to Location
-            kb_id = self.generate_kb_id("Location", kb_id_text)
-            return KbLocation(kb_id=kb_id, name=extracted_entity.text, **common_args)
-        elif entity_label_upper == "DATE":
-            kb_id = self.generate_kb_id("DateEntity", kb_id_text)
-            return KbDateEntity(kb_id=kb_id, date_value=extracted_entity.text, **common_args)
-        else:
-            self.logger.debug(f"Unhandled entity type: {extracted_entity.label} for text: '{extracted_entity.text}'")
-            return None
\ No newline at end of file
+        entity_type_str, kb_class, name_field = mapping
+        kb_id = self.generate_kb_id(entity_type_str, kb_id_text)
+        return kb_class(kb_id=kb_id, **{name_field: extracted_entity.text}, **common_args)
+
+    def transform_batch(self,
+                        extracted_entities: List[ExtractedEntity],
+                        source_doc_relative_path: str) -> List[KbBaseEntity]:
+        """Transforms all ExtractedEntities of one document to KbBaseEntity instances.
+        
+        Equivalent to calling transform_to_kb_entity for each entity and
+        dropping the unhandled ones, but the document URI and lookups are
+        resolved once and a single summary is logged for the batch.
+        
+        Args:
+            extracted_entities: The extracted entities to transform
+            source_doc_relative_path: Relative path to the source document
+            
+        Returns:
+            The KbBaseEntity instances for the handled entities, in input order
+        """
+        label_map = self._LABEL_MAP
+        generate_kb_id = self._cached_kb_id
+        full_document_uri = self._cached_document_id(source_doc_relative_path)
+        label_counts = Counter()
+        kb_entities = []
+        append = kb_entities.append
+
+        for extracted_entity in extracted_entities:
+            text = extracted_entity.text
+            label = extracted_entity.label.upper()
+            label_counts[label] += 1
+            mapping = label_map.get(label)
+            if mapping is None:
+                continue
+            entity_type_str, kb_class, name_field = mapping
+            append(kb_class(
+                kb_id=generate_kb_id(entity_type_str, text),
+                label=text,
+                source_document_uri=full_document_uri,
+                extracted_from_text_span=(extracted_entity.start_char, extracted_entity.end_char),
+                **{name_field: text},
+            ))
+
+        self.logger.debug(
+            f"Transformed {len(kb_entities)} of {len(extracted_entities)} entities "
+            f"from {source_doc_relative_path}: {dict(label_counts)}"
+        )
+        return kb_entities
@@ -1,19 +1,241 @@
 """Orchestrator service - Main service layer for CLI and other UIs."""
 
+import fnmatch
+import itertools
+import json
+import os
+import re
 import time
+from concurrent.futures import ThreadPoolExecutor
 from dataclasses import dataclass
 from pathlib import Path
-from typing import List, Dict, Any, Optional, Union
+from typing import TYPE_CHECKING, Callable, List, Dict, Any, Iterator, Optional, Tuple, Union
 from datetime import datetime
+from functools import cached_property, lru_cache
 import yaml
 
+try:
+    # libyaml-backed loader and dumper, several times faster than the pure-Python ones
+    from yaml import CSafeLoader as _YamlLoader, CSafeDumper as _YamlDumper
+except ImportError:
+    from yaml import SafeLoader as _YamlLoader, SafeDumper as _YamlDumper
+
 from ..config import load_config
-from ..api import KnowledgeBaseAPI
+from ..utils.file_patterns import GLOB_CHARS, parse_suffix_pattern
 from ..utils.logging import get_logger
 
+if TYPE_CHECKING:
+    from ..api import KnowledgeBaseAPI
+
 
 logger = get_logger(__name__)
 
+# Seconds a file listing is reused, so the steps of one command share a walk
+_FILE_LIST_TTL = 2.0
+
+# Threads walking the top-level directories of a project
+_WALK_WORKERS = 8
+
+
+def _in_pattern_directory(parent_parts: List[str], name: str,
+                          scoped_patterns: List[Tuple[Tuple[str, ...], bool, str]]) -> bool:
+    """Check a file against directory-scoped suffix patterns with Path.rglob semantics.
+    
+    rglob matches "docs/*.md" as "**/docs/*.md", so a file matches when its
+    parent directories end with the pattern's directories, or for
+    "docs/**/*.md" contain them anywhere.
+    """
+    for directories, recursive, suffix in scoped_patterns:
+        if not name.endswith(suffix):
+            continue
+        count = len(directories)
+        if not recursive:
+            if tuple(parent_parts[-count:]) == directories:
+                return True
+        elif any(
+            tuple(parent_parts[start:start + count]) == directories
+            for start in range(len(parent_parts) - count + 1)
+        ):
+            return True
+    return False
+
+
+# JSON copy of config.yaml, next to it, that new processes load instead of
+# parsing the YAML while config.yaml is unchanged
+_CONFIG_SIDECAR_NAME = "config.cache.json"
+
+# Marks a config key that is not set
+_MISSING = object()
+
+
+def _same_config_value(old: Any, new: Any) -> bool:
+    """Check whether writing new over old would leave the config file unchanged.
+    
+    Unlike ==, values of different types (1 and True, 1 and 1.0) differ,
+    since YAML writes them differently.
+    """
+    if type(old) is not type(new):
+        return False
+    if isinstance(old, dict):
+        return old.keys() == new.keys() and all(_same_config_value(value, new[key]) for key, value in old.items())
+    if isinstance(old, (list, tuple)):
+        return len(old) == len(new) and all(map(_same_config_value, old, new))
+    return old == new
+
+
+@lru_cache(maxsize=256)
+def _compile_glob(pattern: str) -> Callable[[str], Optional[re.Match]]:
+    """Compile a single-segment glob pattern into a file name matcher."""
+    return re.compile(fnmatch.translate(pattern)).match
+
+
+def _iter_files_below(root: str) -> Iterator[Tuple[str, str]]:
+    """Yield (path, name) for every non-directory entry below root.
+    
+    Walks with os.scandir, taking file types from the directory entries.
+    Like pathlib's "**", symlinked directories are not followed.
+    """
+    stack = [root]
+    while stack:
+        directory = stack.pop()
+        try:
+            with os.scandir(directory) as entries:
+                for entry in entries:
+                    if entry.is_dir(follow_symlinks=False):
+                        stack.append(entry.path)
+                    else:
+                        yield entry.path, entry.name
+        except OSError as e:
+            logger.warning(f"Could not scan directory {directory}: {e}")
+
+
+def _iter_files_below_parallel(root: str, max_workers: int = _WALK_WORKERS) -> Iterator[Tuple[str, str]]:
+    """Yield (path, name) for every non-directory entry below root, walking subtrees in threads.
+    
+    The top-level directories are walked concurrently, each into a list,
+    since os.scandir releases the GIL while it waits on the file system.
+    This pays off where directory reads are slow, such as network file
+    systems. Entries are yielded in the same order as _iter_files_below.
+    """
+    directories = []
+    files = []
+    try:
+        with os.scandir(root) as entries:
+            for entry in entries:
+                if entry.is_dir(follow_symlinks=False):
+                    directories.append(entry.path)
+                else:
+                    files.append((entry.path, entry.name))
+    except OSError as e:
+        logger.warning(f"Could not scan directory {root}: {e}")
+    
+    yield from files
+    if len(directories) < 2 or max_workers <= 1:
+        for directory in reversed(directories):
+            yield from _iter_files_below(directory)
+        return
+    
+    with ThreadPoolExecutor(max_workers=min(max_workers, len(directories))) as executor:
+        futures = [executor.submit(list, _iter_files_below(directory)) for directory in reversed(directories)]
+        for future in futures:
+            yield from future.result()
+
+
+def _iter_project_files(root: Path, patterns: List[str]) -> Iterator[str]:
+    """Yield each file below root that Path.rglob matches for any of the patterns.
+    
+    Patterns matching file names, such as "**/*.md", "README.md" or
+    "doc?.md", and suffix patterns below literal directories, such as
+    "docs/**/*.md", are matched together in a single os.scandir walk that
+    reuses the file type from each directory entry instead of stat()ing
+    every path. Other patterns go through Path.rglob. Files matched by
+    several patterns are yielded once.
+    """
+    suffixes = []
+    names = set()
+    name_matchers = []
+    scoped_patterns = []
+    other_patterns = []
+    for pattern in patterns:
+        suffix_pattern = parse_suffix_pattern(pattern)
+        if suffix_pattern is not None:
+            directory, recursive, suffix = suffix_pattern
+            if directory:
+                scoped_patterns.append((tuple(directory.split(os.sep)), recursive, suffix))
+            else:
+                suffixes.append(suffix)
+        elif pattern in ('', '.', '..') or '/' in pattern or '**' in pattern:
+            other_patterns.append(pattern)
+        elif GLOB_CHARS.intersection(pattern):
+            name_matchers.append(_compile_glob(pattern))
+        else:
+            # rglob matches a literal name in every directory
+            names.add(pattern)
+    
+    seen = set()
+    if suffixes or names or name_matchers or scoped_patterns:
+        suffixes = tuple(suffixes)
+        root_str = str(root)
+        prefix_length = len(root_str.rstrip(os.sep)) + 1
+        for path, name in _iter_files_below_parallel(root_str):
+            if not (
+                name.endswith(suffixes)
+                or name in names
+                or any(match(name) for match in name_matchers)
+            ):
+                if not scoped_patterns:
+                    continue
+                parent_parts = path[prefix_length:].split(os.sep)[:-1]
+                if not _in_pattern_directory(parent_parts, name, scoped_patterns):
+                    continue
+            if other_patterns:
+                seen.add(path)
+            yield path
+    for pattern in other_patterns:
+        for path in root.rglob(pattern):
+            path_str = str(path)
+            if path_str not in seen and path.is_file():
+                seen.add(path_str)
+                yield path_str
+
+
+def _directory_usage(path: Path, tracked_name: str) -> Tuple[int, Optional[float]]:
+    """Return the total size of the files below path and the mtime of one of them.
+    
+    Walks with os.scandir, so file types come from the directory entries
+    and each file is stat()ed once for both values. File symlinks are
+    followed, symlinked directories are not. A missing directory has no
+    usage.
+    
+    Args:
+        path: Directory to measure
+        tracked_name: Name of a file directly in path whose mtime is returned
+        
+    Returns:
+        Tuple of (total size in bytes, mtime of tracked_name or None)
+    """
+    total = 0
+    tracked_mtime = None
+    root = str(path)
+    stack = [root]
+    while stack:
+        directory = stack.pop()
+        try:
+            with os.scandir(directory) as entries:
+                for entry in entries:
+                    if entry.is_dir(follow_symlinks=False):
+                        stack.append(entry.path)
+                    elif entry.is_file():
+                        stat = entry.stat()
+                        total += stat.st_size
+                        if directory is root and entry.name == tracked_name:
+                            tracked_mtime = stat.st_mtime
+        except FileNotFoundError:
+            continue
+        except OSError as e:
+            logger.warning(f"Could not scan directory {directory}: {e}")
+    return total, tracked_mtime
+
 
 @dataclass
 class ProcessingResult:
@@ -75,42 +297,191 @@ class OrchestratorService:
             working_directory: Working directory to operate in
         """
         self.working_directory = working_directory or Path.cwd()
-        self._api: Optional[KnowledgeBaseAPI] = None
         self._config_cache: Optional[ProjectConfig] = None
+        # (working directory, .kbp directory found from it) of the last lookup
+        self._kbp_dir_cache: Optional[Tuple[Path, Optional[Path]]] = None
+        # (monotonic time, working directory, patterns, files) of the last file listing
+        self._file_list_cache: Optional[Tuple[float, Path, Tuple[str, ...], List[str]]] = None
+        # (config file, (mtime_ns, size), parsed data) of the last config read or write
+        self._config_data: Optional[Tuple[Path, Tuple[int, int], Any]] = None
     
-    @property
-    def api(self) -> KnowledgeBaseAPI:
-        """Get or create KnowledgeBaseAPI instance."""
-        if self._api is None:
-            config = load_config()
-            # Set paths based on current working directory
-            config.knowledge_base_path = str(self.working_directory)
-            
-            # Find .kbp directory for metadata store
-            kbp_dir = self._find_kbp_directory()
-            if kbp_dir:
-                metadata_dir = kbp_dir / "cache"
-                metadata_dir.mkdir(exist_ok=True)
-                config.metadata_store_path = str(metadata_dir / "knowledgebase.db")
-            
-            self._api = KnowledgeBaseAPI(config)
-        
-        return self._api
+    @cached_property
+    def api(self) -> 'KnowledgeBaseAPI':
+        """Get or create KnowledgeBaseAPI instance.
+        
+        The instance is kept in the object's __dict__ after the first access;
+        initialize_project discards it.
+        """
+        # Imported here so commands that never touch the API (init, config,
+        # status) don't load the parsing, RDF and SPARQL stack at startup
+        from ..api import KnowledgeBaseAPI
+        
+        config = load_config()
+        # Set paths based on current working directory
+        config.knowledge_base_path = str(self.working_directory)
+        
+        # Find .kbp directory for metadata store
+        kbp_dir = self._find_kbp_directory()
+        if kbp_dir:
+            metadata_dir = kbp_dir / "cache"
+            metadata_dir.mkdir(exist_ok=True)
+            config.metadata_store_path = str(metadata_dir / "knowledgebase.db")
+        
+        return KnowledgeBaseAPI(config)
     
     def _find_kbp_directory(self) -> Optional[Path]:
-        """Find the .kbp configuration directory."""
-        current = self.working_directory
-        while current != current.parent:
-            kbp_dir = current / ".kbp"
-            if kbp_dir.exists():
-                return kbp_dir
-            current = current.parent
-        return None
+        """Find the .kbp configuration directory.
+        
+        The result is remembered per working directory, so the upward search
+        runs once instead of on every operation.
+        """
+        cached = self._kbp_dir_cache
+        if cached is not None and cached[0] == self.working_directory:
+            return cached[1]
+        
+        # Walk up with string operations: one stat per level and no Path
+        # objects until a match is found
+        result = None
+        current = os.fspath(self.working_directory)
+        while True:
+            candidate = os.path.join(current, ".kbp")
+            if os.path.isdir(candidate):
+                result = Path(candidate)
+                break
+            parent = os.path.dirname(current)
+            if parent == current:
+                break
+            current = parent
+        
+        self._kbp_dir_cache = (self.working_directory, result)
+        return result
     
     def is_initialized(self) -> bool:
         """Check if project is initialized."""
         return self._find_kbp_directory() is not None
     
+    def _find_config_file(self) -> Optional[Path]:
+        """Find the project's config.yaml, or None if there is none."""
+        kbp_dir = self._find_kbp_directory()
+        if not kbp_dir:
+            return None
+        
+        config_file = kbp_dir / "config.yaml"
+        if not config_file.exists():
+            return None
+        return config_file
+    
+    def _enumerate_files(self, patterns: List[str]) -> List[str]:
+        """List the project files matching patterns.
+        
+        A listing is reused for _FILE_LIST_TTL seconds, so counting and then
+        processing documents within one command walks the tree once.
+        
+        Args:
+            patterns: File patterns to match
+            
+        Returns:
+            Paths of the matching files
+        """
+        now = time.monotonic()
+        patterns_key = tuple(patterns)
+        cached = self._file_list_cache
+        if (
+            cached is not None
+            and now - cached[0] < _FILE_LIST_TTL
+            and cached[1] == self.working_directory
+            and cached[2] == patterns_key
+        ):
+            return cached[3]
+        
+        files = list(_iter_project_files(self.working_directory, patterns))
+        self._file_list_cache = (now, self.working_directory, patterns_key, files)
+        return files
+    
+    @staticmethod
+    def _config_file_key(config_file: Path) -> Tuple[int, int]:
+        """Return the modification time and size identifying a config file version."""
+        stat = os.stat(config_file)
+        return stat.st_mtime_ns, stat.st_size
+    
+    def _load_config_dict(self, config_file: Path) -> Any:
+        """Load the parsed contents of a config file.
+        
+        The last parse is reused while the file's modification time and size
+        are unchanged, so repeated config lookups do not re-read the YAML.
+        Callers must not modify the returned data.
+        
+        Args:
+            config_file: Path to the config file
+            
+        Returns:
+            The parsed YAML data
+        """
+        key = self._config_file_key(config_file)
+        cached = self._config_data
+        if cached is not None and cached[0] == config_file and cached[1] == key:
+            return cached[2]
+        
+        config_data = self._read_config_sidecar(config_file, key)
+        if config_data is _MISSING:
+            with open(config_file, 'r') as f:
+                config_data = yaml.load(f, Loader=_YamlLoader)
+            self._write_config_sidecar(config_file, key, config_data)
+        
+        self._config_data = (config_file, key, config_data)
+        self._config_cache = None
+        return config_data
+    
+    def _write_config_dict(self, config_file: Path, config_data: Dict[str, Any]) -> None:
+        """Write config data to a config file and remember it as the current version."""
+        with open(config_file, 'w') as f:
+            yaml.dump(config_data, f, Dumper=_YamlDumper, default_flow_style=False, sort_keys=True, indent=2)
+        
+        key = self._config_file_key(config_file)
+        self._write_config_sidecar(config_file, key, config_data)
+        self._config_data = (config_file, key, config_data)
+        self._config_cache = None
+    
+    @staticmethod
+    def _read_config_sidecar(config_file: Path, key: Tuple[int, int]) -> Any:
+        """Load the JSON copy of a config file if it was made from this version of it.
+        
+        Returns:
+            The config data, or _MISSING if there is no up-to-date copy
+        """
+        try:
+            with open(config_file.with_name(_CONFIG_SIDECAR_NAME), 'rb') as f:
+                sidecar = json.load(f)
+        except (OSError, ValueError):
+            return _MISSING
+        if not isinstance(sidecar, dict) or sidecar.get("source") != list(key):
+            return _MISSING
+        return sidecar.get("data", _MISSING)
+    
+    @staticmethod
+    def _write_config_sidecar(config_file: Path, key: Tuple[int, int], config_data: Any) -> None:
+        """Save a JSON copy of config data, tagged with the config file version it came from.
+        
+        Data that JSON cannot represent exactly (dates, non-string keys) is not
+        copied; the YAML is parsed instead. Failing to write the copy is not an
+        error.
+        """
+        try:
+            payload = json.dumps({"source": list(key), "data": config_data})
+        except (TypeError, ValueError):
+            return
+        if json.loads(payload)["data"] != config_data:
+            return
+        
+        sidecar_file = config_file.with_name(_CONFIG_SIDECAR_NAME)
+        temp_file = sidecar_file.with_name(f".{_CONFIG_SIDECAR_NAME}.{os.getpid()}.tmp")
+        try:
+            temp_file.write_text(payload, encoding='utf-8')
+            # Replace atomically so concurrent readers never see a partial copy
+            os.replace(temp_file, sidecar_file)
+        except OSError as e:
+            logger.debug(f"Could not write config cache {sidecar_file}: {e}")
+    
     def initialize_project(
         self, 
         path: Path, 
@@ -167,35 +538,32 @@ class OrchestratorService:
         kbp_dir.mkdir(parents=True, exist_ok=True)
         (kbp_dir / "cache").mkdir(exist_ok=True)
         (kbp_dir / "logs").mkdir(exist_ok=True)
+        self._kbp_dir_cache = None
+        self._file_list_cache = None
         
         # Write config
         config_file = kbp_dir / "config.yaml"
-        with open(config_file, 'w') as f:
-            yaml.dump(config_data, f, default_flow_style=False, sort_keys=True, indent=2)
+        self._write_config_dict(config_file, config_data)
         
         # Update working directory and clear cache
         self.working_directory = path
-        self._api = None
-        self._config_cache = None
+        self.__dict__.pop('api', None)
         
         return self.get_project_config()
     
     def get_project_config(self) -> Optional[ProjectConfig]:
-        """Get current project configuration."""
-        if self._config_cache:
-            return self._config_cache
-            
-        kbp_dir = self._find_kbp_directory()
-        if not kbp_dir:
-            return None
+        """Get current project configuration.
         
-        config_file = kbp_dir / "config.yaml"
-        if not config_file.exists():
+        The returned object is cached until the config file changes.
+        """
+        config_file = self._find_config_file()
+        if not config_file:
             return None
         
         try:
-            with open(config_file, 'r') as f:
-                config_data = yaml.safe_load(f)
+            config_data = self._load_config_dict(config_file)
+            if self._config_cache:
+                return self._config_cache
             
             self._config_cache = ProjectConfig(
                 project_name=config_data.get("project_name", "Unknown"),
@@ -226,12 +594,8 @@ class OrchestratorService:
             return 0
         
         patterns = patterns or config.file_patterns
-        all_files = []
         
-        for pattern in patterns:
-            all_files.extend(self.working_directory.rglob(pattern))
-        
-        return len([f for f in all_files if f.is_file()])
+        return len(self._enumerate_files(patterns))
     
     def process_documents(
         self,
@@ -258,11 +622,7 @@ class OrchestratorService:
         patterns = patterns or config.file_patterns
         
         # Find files to process
-        all_files = []
-        for pattern in patterns:
-            all_files.extend(self.working_directory.rglob(pattern))
-        
-        files_to_process = [f for f in all_files if f.is_file()]
+        files_to_process = self._enumerate_files(patterns)
         
         if not files_to_process:
             return ProcessingResult(
@@ -348,9 +708,10 @@ class OrchestratorService:
             # Use the API query method
             results = self.api.query(query, search_type)
             
-            # Convert to SearchResult objects
+            # Convert to SearchResult objects, taking only the first `limit`
+            # results so a lazily produced result set is not consumed in full
             search_results = []
-            for i, result in enumerate(results[:limit]):
+            for i, result in enumerate(itertools.islice(results, limit)):
                 # Extract information from result string
                 # This is a simplified conversion - real implementation would parse structured data
                 search_results.append(SearchResult(
@@ -374,7 +735,8 @@ class OrchestratorService:
         Returns:
             Project statistics or None if not initialized
         """
-        if not self.is_initialized():
+        kbp_dir = self._find_kbp_directory()
+        if not kbp_dir:
             return None
         
         config = self.get_project_config()
@@ -384,24 +746,9 @@ class OrchestratorService:
         # Count documents
         total_docs = self.count_documents()
         
-        # Get last scan time from config directory
-        kbp_dir = self._find_kbp_directory()
-        last_scan = None
-        if kbp_dir:
-            cache_dir = kbp_dir / "cache"
-            if cache_dir.exists():
-                db_file = cache_dir / "knowledgebase.db"
-                if db_file.exists():
-                    last_scan = datetime.fromtimestamp(db_file.stat().st_mtime)
-        
-        # Calculate database size
-        db_size = 0
-        if kbp_dir:
-            cache_dir = kbp_dir / "cache"
-            if cache_dir.exists():
-                for file in cache_dir.rglob("*"):
-                    if file.is_file():
-                        db_size += file.stat().st_size
+        # Database size and last scan time from one sweep of the cache directory
+        db_size, db_mtime = _directory_usage(kbp_dir / "cache", "knowledgebase.db")
+        last_scan = datetime.fromtimestamp(db_mtime) if db_mtime is not None else None
         
         # Estimates based on document count (would be real data from database)
         entities = total_docs * 8
@@ -518,26 +865,27 @@ class OrchestratorService:
         Returns:
             True if successful
         """
-        kbp_dir = self._find_kbp_directory()
-        if not kbp_dir:
-            return False
-        
-        config_file = kbp_dir / "config.yaml"
-        if not config_file.exists():
+        config_file = self._find_config_file()
+        if not config_file:
             return False
         
         try:
-            with open(config_file, 'r') as f:
-                config_data = yaml.safe_load(f)
+            current_data = self._load_config_dict(config_file)
+            if isinstance(current_data, dict) and all(
+                _same_config_value(current_data.get(key, _MISSING), value)
+                for key, value in kwargs.items()
+            ):
+                # Nothing changes, so leave the file alone
+                return True
+            
+            # Top-level keys are replaced, so a shallow copy keeps the cached
+            # data intact if writing fails
+            config_data = dict(current_data) if current_data else {}
             
             # Update with provided values
             config_data.update(kwargs)
             
-            with open(config_file, 'w') as f:
-                yaml.dump(config_data, f, default_flow_style=False, sort_keys=True, indent=2)
-            
-            # Clear cache
-            self._config_cache = None
+            self._write_config_dict(config_file, config_data)
             
             return True
             
@@ -555,17 +903,12 @@ class OrchestratorService:
         Returns:
             Configuration value
         """
-        kbp_dir = self._find_kbp_directory()
-        if not kbp_dir:
-            return default
-        
-        config_file = kbp_dir / "config.yaml"
-        if not config_file.exists():
+        config_file = self._find_config_file()
+        if not config_file:
             return default
         
         try:
-            with open(config_file, 'r') as f:
-                config_data = yaml.safe_load(f)
+            config_data = self._load_config_dict(config_file)
             
             # Navigate nested keys
             keys = key.split('.')
@@ -592,20 +935,29 @@ class OrchestratorService:
         Returns:
             True if successful
         """
-        kbp_dir = self._find_kbp_directory()
-        if not kbp_dir:
-            return False
-        
-        config_file = kbp_dir / "config.yaml"
-        if not config_file.exists():
+        config_file = self._find_config_file()
+        if not config_file:
             return False
         
         try:
-            with open(config_file, 'r') as f:
-                config_data = yaml.safe_load(f) or {}
+            keys = key.split('.')
+            current_data = self._load_config_dict(config_file)
+            current_value = current_data
+            for k in keys:
+                if isinstance(current_value, dict) and k in current_value:
+                    current_value = current_value[k]
+                else:
+                    current_value = _MISSING
+                    break
+            if _same_config_value(current_value, value):
+                # Nothing changes, so leave the file alone
+                return True
+            
+            # Copy only the mappings along the key path; the rest is shared
+            # with the cached data, which stays intact if the key cannot be set
+            config_data = dict(current_data) if current_data else {}
             
             # Navigate to parent of target key
-            keys = key.split('.')
             target = config_data
             
             for k in keys[:-1]:
@@ -613,16 +965,14 @@ class OrchestratorService:
                     target[k] = {}
                 elif not isinstance(target[k], dict):
                     return False
+                else:
+                    target[k] = dict(target[k])
                 target = target[k]
             
             # Set the value
             target[keys[-1]] = value
             
-            with open(config_file, 'w') as f:
-                yaml.dump(config_data, f, default_flow_style=False, sort_keys=True, indent=2)
-            
-            # Clear cache
-            self._config_cache = None
+            self._write_config_dict(config_file, config_data)
             
             return True
             
@@ -1,7 +1,9 @@
 """Processing service for orchestrating document processing operations."""
 
+import os
+from concurrent.futures import ThreadPoolExecutor, as_completed
 from pathlib import Path
-from typing import Any, List, Optional
+from typing import Any, Callable, List, Optional
 
 from ..processor.processor import Processor
 from ..reader.reader import Reader
@@ -12,6 +14,27 @@ from .sparql_service import SparqlService
 import tempfile
 import shutil
 
+try:
+    from tqdm import tqdm
+except ImportError:
+    tqdm = None
+
+
+# Most RDF files handed to a load worker at a time
+_LOAD_TASK_FILES = 50
+
+# Loading progress is logged at info level each time this many more files are done
+_LOAD_LOG_INTERVAL = 100
+
+
+def _default_load_workers() -> int:
+    """Number of RDF files loaded concurrently when the config does not set it.
+
+    Loading is bound by SPARQL endpoint round trips rather than CPU, so this
+    allows several requests per core, capped to spare the endpoint.
+    """
+    return min(16, (os.cpu_count() or 1) * 4)
+
 
 class ProcessingService:
     """Orchestrates document processing operations."""
@@ -35,8 +58,16 @@ class ProcessingService:
         pattern: str,
         knowledge_base_path: Path,
         rdf_output_dir: Optional[Path] = None,
+        rdf_serialization: Optional[str] = None,
+        on_rdf_file: Optional[Callable[[Path], None]] = None,
     ) -> int:
-        """Process documents matching pattern with optional RDF generation."""
+        """Process documents matching pattern with optional RDF generation.
+        
+        RDF files are written in rdf_serialization format ("turtle", "nt" or
+        "xml") if given, otherwise in the processor's format (Turtle by default).
+        If given, on_rdf_file is called with the path of each RDF file as soon
+        as it is written.
+        """
         rdf_output_dir_str = str(rdf_output_dir) if rdf_output_dir else None
 
         self.logger.info(
@@ -51,15 +82,25 @@ class ProcessingService:
                     "Automatically enabling entity analysis for this run to generate meaningful RDF output."
                 )
                 self.config.analyze_entities = True
-                # The processor should be re-initialized by the caller if config changes
-                # This service will not re-initialize the processor itself.
+                # Add only the entity recognizer; the registered extractors
+                # and analyzers don't depend on the flag and are kept
+                try:
+                    self.processor.enable_entity_analysis()
+                except OSError as e:
+                    self.logger.warning(f"Entity analysis could not be enabled: {e}")
 
+        optional_args: dict[str, Any] = {}
+        if rdf_serialization:
+            optional_args["rdf_serialization"] = rdf_serialization
+        if on_rdf_file is not None:
+            optional_args["on_rdf_file"] = on_rdf_file
         return self.processor.process_and_generate_rdf(
             reader=self.reader,
             metadata_store=self.metadata_store,
             pattern=pattern,
             knowledge_base_path=knowledge_base_path,
             rdf_output_dir_str=rdf_output_dir_str,
+            **optional_args,
         )
 
     def process_and_load(
@@ -87,56 +128,127 @@ class ProcessingService:
             logger.info(f"Using temporary directory for RDF output: {output_dir}")
 
         try:
-            code = self.process_documents(
-                pattern=pattern,
-                knowledge_base_path=knowledge_base_path,
-                rdf_output_dir=output_dir,
-            )
-            if code != 0:
-                logger.error("Document processing failed.")
-                return code
-
             if not output_dir:
+                code = self.process_documents(pattern=pattern, knowledge_base_path=knowledge_base_path)
+                if code != 0:
+                    logger.error("Document processing failed.")
+                    return code
                 logger.error("RDF output directory is not specified for loading.")
                 return 1
 
             sparql_service = SparqlService(config=self.config)
-            rdf_files = list(Path(output_dir).glob("*.ttl"))
-            if not rdf_files:
-                logger.error(f"No RDF files found in {output_dir}")
-                return 1
-
-            try:
-                from tqdm import tqdm
-                use_progress = True
-            except ImportError:
-                use_progress = False
-
             errors = []
             successes = 0
-            iterator = (
-                tqdm(rdf_files, desc="Loading RDF files")
-                if use_progress
-                else rdf_files
+            workers = getattr(self.config, "sparql_load_workers", None) or _default_load_workers()
+            server_load = getattr(self.config, "sparql_server_load", False) is True
+            progress = (
+                tqdm(total=None, desc="Loading RDF files")
+                if tqdm is not None
+                else None
             )
 
-            for rdf_file in iterator:
+            # Loading overlaps with processing: RDF files are collected as the
+            # pipeline writes them and handed to the load workers in groups of
+            # _LOAD_TASK_FILES, each sent in batched update requests. The
+            # worker threads share the service's HTTP client, which keeps a
+            # connection alive per thread. Results are collected on the
+            # calling thread once processing is done.
+            executor = ThreadPoolExecutor(max_workers=workers)
+            futures = {}
+            submitted = set()
+            pending: List[Path] = []
+
+            def submit(group: List[Path]) -> None:
+                future = executor.submit(
+                    sparql_service.load_rdf_files_batched,
+                    file_paths=group,
+                    graph_uri=graph_uri,
+                    update_endpoint_url=endpoint_url,
+                    username=username,
+                    password=password,
+                    upsert=upsert,
+                    prefer_server_load=server_load,
+                    graph_store_url=sparql_service.graph_store_url,
+                )
+                futures[future] = group
+
+            def on_rdf_file(rdf_file: Path) -> None:
+                submitted.add(rdf_file.name)
+                pending.append(rdf_file)
+                if len(pending) >= _LOAD_TASK_FILES:
+                    submit(pending[:])
+                    pending.clear()
+
+            try:
+                code = self.process_documents(
+                    pattern=pattern,
+                    knowledge_base_path=knowledge_base_path,
+                    rdf_output_dir=output_dir,
+                    # The files are only read back by the loader, and N-Triples
+                    # parses several times faster than Turtle
+                    rdf_serialization="nt",
+                    on_rdf_file=on_rdf_file,
+                )
+                if code != 0:
+                    # Groups already handed out finish loading before returning
+                    logger.error("Document processing failed.")
+                    return code
+
+                # One scandir pass over the flat output directory picks up
+                # files not reported while processing. Only N-Triples files
+                # are taken: a Turtle file left by an earlier run may be an
+                # outdated version of a document's .nt file
                 try:
-                    sparql_service.load_rdf_file(
-                        file_path=rdf_file,
-                        graph_uri=graph_uri,
-                        update_endpoint_url=endpoint_url,
-                        username=username,
-                        password=password,
-                        upsert=upsert,
+                    with os.scandir(output_dir) as entries:
+                        pending.extend(
+                            Path(entry.path) for entry in entries
+                            if entry.name.endswith(".nt")
+                            and entry.name not in submitted
+                            and entry.is_file()
+                        )
+                except FileNotFoundError:
+                    pass
+                if not pending and not futures:
+                    logger.error(f"No RDF files found in {output_dir}")
+                    return 1
+
+                # The remaining files are split so all load workers get a share
+                if pending:
+                    group_size = min(_LOAD_TASK_FILES, -(-len(pending) // workers))
+                    for i in range(0, len(pending), group_size):
+                        submit(pending[i:i + group_size])
+                total = sum(len(group) for group in futures.values())
+                if progress is not None:
+                    progress.total = total
+                    progress.refresh()
+
+                for future in as_completed(futures):
+                    group = futures[future]
+                    try:
+                        failures = future.result()
+                    except Exception as e:
+                        failures = [(str(rdf_file), str(e)) for rdf_file in group]
+                    logger.debug(
+                        f"{'Upserted' if upsert else 'Loaded'} {len(group) - len(failures)} of {len(group)} RDF files"
                     )
-                    operation = "Upserted" if upsert else "Loaded"
-                    logger.info(f"{operation} RDF file: {rdf_file}")
-                    successes += 1
-                except Exception as e:
-                    operation = "upsert" if upsert else "load"
-                    logger.error(f"Failed to {operation} {rdf_file}: {e}")
-                    errors.append((str(rdf_file), str(e)))
+                    for fname, err in failures:
+                        operation = "upsert" if upsert else "load"
+                        logger.error(f"Failed to {operation} {fname}: {err}")
+                    done = successes + len(errors)
+                    successes += len(group) - len(failures)
+                    errors.extend(failures)
+                    # One summary line per _LOAD_LOG_INTERVAL files instead
+                    # of one per group keeps logging off the load path
+                    if (done + len(group)) // _LOAD_LOG_INTERVAL > done // _LOAD_LOG_INTERVAL:
+                        logger.info(f"Processed {done + len(group)}/{total} RDF files")
+                    if progress is not None:
+                        progress.update(len(group))
+            finally:
+                executor.shutdown(wait=True)
+                # Close the HTTP connections the loads kept open
+                sparql_service.close()
+                if progress is not None:
+                    progress.close()
 
             logger.info(
                 f"RDF load complete: {successes} succeeded, {len(errors)} failed."
@@ -1,16 +1,82 @@
 """SPARQL service for high-level SPARQL operations."""
 
-import json
+import re
+import threading
+import time
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor, as_completed
 from pathlib import Path
-from typing import Any, Optional
+from typing import Any, BinaryIO, Dict, Optional, Tuple
 
 from rdflib import Graph
 from SPARQLWrapper.SPARQLExceptions import SPARQLWrapperException
 
+try:
+    import orjson
+except ImportError:
+    orjson = None
+    import json
+
 from ..query_interface.sparql_interface import SparqlQueryInterface
 from ..utils.logging import get_logger
 
 
+# Triples sent per update request when loading files in batches
+_LOAD_BATCH_TRIPLES = 10_000
+
+# Files loaded concurrently by load_rdf_files_batch unless configured otherwise
+_LOAD_WORKERS = 4
+
+# Read-only query results kept for reuse, and for how many seconds by
+# default; caching is off unless configured, since changes made by other
+# clients are not seen while a result is cached
+_QUERY_CACHE_SIZE = 256
+_QUERY_CACHE_TTL = 0.0
+_CACHEABLE_QUERY_TYPES = frozenset(("SELECT", "ASK", "CONSTRUCT", "DESCRIBE"))
+
+# RDF format of a file to load, by file suffix; other files are read as Turtle
+_RDF_FORMATS_BY_SUFFIX = {".nt": "nt", ".ttl": "turtle", ".xml": "xml", ".rdf": "xml"}
+
+# The first keyword of a query or update, after any comments and PREFIX/BASE declarations
+_QUERY_TYPE_RE = re.compile(
+    r'(?:\s|#[^\n]*|PREFIX\s+[^\s<]*\s*<[^>]*>|BASE\s*<[^>]*>)*'
+    r'(SELECT|ASK|CONSTRUCT|DESCRIBE|INSERT|DELETE|WITH|LOAD|CLEAR|CREATE|DROP|ADD|MOVE|COPY)\b',
+    re.IGNORECASE
+)
+
+
+def _dumps_indented(value: Any) -> str:
+    """Serialize query results as JSON indented by two spaces.
+
+    Uses orjson when it is installed, which is several times faster than
+    the json module on large SELECT results.
+    """
+    if orjson is not None:
+        return orjson.dumps(value, option=orjson.OPT_INDENT_2).decode('utf-8')
+    return json.dumps(value, indent=2)
+
+
+def _rdf_format_for(file_path: Path) -> str:
+    """Guess the RDF format of a file from its suffix."""
+    return _RDF_FORMATS_BY_SUFFIX.get(Path(file_path).suffix.lower(), "turtle")
+
+
+def _server_load_operation(file_path: Path, graph_uri: Optional[str] = None) -> str:
+    """Build a SPARQL LOAD operation that has the store read a local file itself.
+
+    Args:
+        file_path: Path to the RDF file, which must be readable by the store
+        graph_uri: Named graph URI to load data into
+
+    Returns:
+        The LOAD operation, targeting the default graph if no graph URI is given
+    """
+    operation = f"LOAD <{Path(file_path).absolute().as_uri()}>"
+    if graph_uri:
+        operation += f" INTO GRAPH <{graph_uri}>"
+    return operation
+
+
 class SparqlService:
     """High-level SPARQL operations service."""
     
@@ -29,23 +95,147 @@ class SparqlService:
         if not endpoint_url and update_endpoint_url and '/update' in update_endpoint_url:
             endpoint_url = update_endpoint_url.replace('/update', '/query')
 
+        # Kind of store behind the endpoints, so query timeouts can be
+        # enforced on the store as well as on the HTTP request
+        server_kind = getattr(config, 'sparql_server_kind', None)
+        self._interface_options: Dict[str, Any] = {}
+        if isinstance(server_kind, str) and server_kind:
+            self._interface_options['server_kind'] = server_kind
+
         self.sparql_interface = SparqlQueryInterface(
             endpoint_url=endpoint_url,
-            update_endpoint_url=update_endpoint_url
+            update_endpoint_url=update_endpoint_url,
+            **self._interface_options
         )
+        
+        # Interfaces for endpoint/credential overrides, keyed by (query endpoint,
+        # update endpoint, username, password), so repeated calls reuse one
+        # HTTP client and its open connections
+        self._interfaces: Dict[Tuple[Optional[str], ...], SparqlQueryInterface] = {}
+        self._interfaces_lock = threading.Lock()
+
+        # Graph Store Protocol endpoint that RDF files are uploaded to as-is
+        graph_store_url = getattr(config, 'sparql_graph_store_url', None)
+        self.graph_store_url = graph_store_url if isinstance(graph_store_url, str) else None
+
+        # Formatted results of read-only queries, keyed by (query endpoint,
+        # query, format) and mapped to (expiry time, result); least recently
+        # used entries are dropped first. Updates and loads through this
+        # service clear it.
+        cache_ttl = getattr(config, 'sparql_cache_ttl', None)
+        self._query_cache_ttl = cache_ttl if isinstance(cache_ttl, (int, float)) else _QUERY_CACHE_TTL
+        self._query_cache: "OrderedDict[Tuple[str, str, str], Tuple[float, Any]]" = OrderedDict()
+        self._query_cache_lock = threading.Lock()
+    
+    def _cached_result(self, key: Tuple[str, str, str]) -> Optional[Any]:
+        """Get an unexpired cached query result, or None."""
+        with self._query_cache_lock:
+            entry = self._query_cache.get(key)
+            if entry is None:
+                return None
+            if entry[0] <= time.monotonic():
+                del self._query_cache[key]
+                return None
+            self._query_cache.move_to_end(key)
+            return entry[1]
+    
+    def _cache_result(self, key: Tuple[str, str, str], result: Any) -> None:
+        """Store a query result, evicting the least recently used one if full."""
+        with self._query_cache_lock:
+            self._query_cache[key] = (time.monotonic() + self._query_cache_ttl, result)
+            self._query_cache.move_to_end(key)
+            if len(self._query_cache) > _QUERY_CACHE_SIZE:
+                self._query_cache.popitem(last=False)
+    
+    def clear_query_cache(self) -> None:
+        """Forget all cached query results."""
+        with self._query_cache_lock:
+            self._query_cache.clear()
+    
+    def _graph_format(self, query_type: str, format: str) -> str:
+        """Pick the RDF serialization for a CONSTRUCT or DESCRIBE result in the requested format.
+        
+        N-Triples is written line by line without the prefix and grouping pass
+        Turtle needs, so it is the faster choice for large results.
+        """
+        if format == "ntriples":
+            return "nt"
+        if format == "json":
+            self.logger.info(f"Direct JSON output for {query_type} queries is not standard. Showing Turtle format.")
+        elif format == "table":
+            self.logger.info(f"Table format is not directly applicable for {query_type} queries. Showing Turtle format.")
+        return "turtle"
+    
+    def _format_graph(self, graph_result: Graph, query_type: str, format: str) -> str:
+        """Serialize a CONSTRUCT or DESCRIBE result."""
+        return graph_result.serialize(format=self._graph_format(query_type, format))
+    
+    def _interface_for(self, endpoint_url: Optional[str], update_endpoint_url: Optional[str],
+                       username: Optional[str] = None, password: Optional[str] = None) -> SparqlQueryInterface:
+        """Get the cached SPARQL interface for the given endpoints and credentials, creating it once.
+        
+        The configured endpoints without credentials map to the service's own interface.
+        """
+        if (endpoint_url == self.sparql_interface.endpoint_url
+                and update_endpoint_url == self.sparql_interface.update_endpoint_url
+                and not (username and password)):
+            return self.sparql_interface
+        key = (endpoint_url, update_endpoint_url, username, password)
+        with self._interfaces_lock:
+            sparql_interface = self._interfaces.get(key)
+            if sparql_interface is None:
+                if username or password:
+                    sparql_interface = SparqlQueryInterface(
+                        endpoint_url=endpoint_url,
+                        update_endpoint_url=update_endpoint_url,
+                        username=username,
+                        password=password,
+                        **self._interface_options
+                    )
+                else:
+                    sparql_interface = SparqlQueryInterface(
+                        endpoint_url=endpoint_url, update_endpoint_url=update_endpoint_url, **self._interface_options
+                    )
+                self._interfaces[key] = sparql_interface
+        return sparql_interface
+    
+    def close(self) -> None:
+        """Close the HTTP clients of this service's SPARQL interfaces."""
+        with self._interfaces_lock:
+            interfaces = list(self._interfaces.values())
+            self._interfaces.clear()
+        for sparql_interface in interfaces:
+            sparql_interface.close()
+        self.sparql_interface.close()
     
     def execute_query(self, query: str, endpoint_url: Optional[str] = None, 
-                     timeout: int = 30, format: str = "json") -> Any:
+                     timeout: int = 30, format: str = "json", stream: Optional[BinaryIO] = None,
+                     use_cache: bool = True) -> Any:
         """Execute a SPARQL query and return formatted results.
         
+        If config.sparql_cache_ttl is set (it is 0, disabled, by default),
+        results of SELECT, ASK, CONSTRUCT and DESCRIBE queries are cached per
+        endpoint, query and format for that many seconds, so repeating a query
+        within a session does not hit the endpoint again. Results may then be
+        stale by up to that long if other clients update the store. Update
+        queries are never cached and clear the cache.
+        
         Args:
             query: SPARQL query string
             endpoint_url: SPARQL endpoint URL (overrides config if provided)
             timeout: Query timeout in seconds
-            format: Output format ("json", "table", "turtle")
+            format: Output format ("json", "table", "turtle"; "ntriples" for
+                CONSTRUCT and DESCRIBE results)
+            stream: Binary file to write CONSTRUCT and DESCRIBE results to
+                instead of returning them as a string; the endpoint's response
+                is copied to it as it arrives, without being parsed, when
+                already in the requested format. Bypasses the cache
+            use_cache: Whether a cached result may be returned (and the
+                result cached)
             
         Returns:
-            Query results in the requested format
+            Query results in the requested format, or None for graph results
+            written to stream
             
         Raises:
             SPARQLWrapperException: If the SPARQL query fails
@@ -57,80 +247,25 @@ class SparqlService:
         if not sparql_query_endpoint:
             raise ValueError("SPARQL query endpoint not specified via parameter or configuration.")
         
-        # Instantiate SPARQL interface if endpoint is different from config
-        sparql_interface = self.sparql_interface
-        if endpoint_url and endpoint_url != self.sparql_interface.endpoint_url:
-            sparql_interface = SparqlQueryInterface(endpoint_url=endpoint_url, update_endpoint_url=self.sparql_interface.update_endpoint_url)
+        sparql_interface = self._interface_for(sparql_query_endpoint, self.sparql_interface.update_endpoint_url)
         
         try:
             # Determine query type and execute accordingly
-            query_upper = query.upper().strip()
+            match = _QUERY_TYPE_RE.match(query)
+            query_type = match.group(1).upper() if match else None
             
-            if query_upper.startswith("SELECT") and "UPDATE" not in query_upper:
-                # SELECT query
-                results = sparql_interface.select(query, timeout=timeout)
-                
-                if format == "json":
-                    return json.dumps(results, indent=2)
-                elif format == "table":
-                    if results:
-                        # Format as table
-                        headers = list(results[0].keys())
-                        table_output = " | ".join(headers) + "\n"
-                        table_output += "-" * (len(" | ".join(headers))) + "\n"
-                        
-                        for row in results:
-                            values = [str(row.get(header, "")) for header in headers]
-                            table_output += " | ".join(values) + "\n"
-                        return table_output
-                    else:
-                        return "No results found."
-                elif format == "turtle":
-                    self.logger.info("Turtle format is not applicable for SELECT queries.")
-                    return str(results)
-                    
-            elif query_upper.startswith("ASK"):
-                # ASK query
-                result = sparql_interface.ask(query, timeout=timeout)
-                
-                if format == "json":
-                    return json.dumps({"boolean": result}, indent=2)
-                else:  # table or turtle
-                    return str(result)
-                    
-            elif query_upper.startswith("CONSTRUCT"):
-                # CONSTRUCT query
-                graph_result = sparql_interface.construct(query, timeout=timeout)
-                
-                if format == "turtle":
-                    return graph_result.serialize(format="turtle")
-                elif format == "json":
-                    self.logger.info("Direct JSON output for CONSTRUCT queries is not standard. Showing Turtle format.")
-                    return graph_result.serialize(format="turtle")
-                elif format == "table":
-                    self.logger.info("Table format is not directly applicable for CONSTRUCT queries. Showing Turtle format.")
-                    return graph_result.serialize(format="turtle")
-                    
-            elif query_upper.startswith("DESCRIBE"):
-                # DESCRIBE query
-                graph_result = sparql_interface.describe(query, timeout=timeout)
-                
-                if format == "turtle":
-                    return graph_result.serialize(format="turtle")
-                elif format == "json":
-                    self.logger.info("Direct JSON output for DESCRIBE queries is not standard. Showing Turtle format.")
-                    return graph_result.serialize(format="turtle")
-                elif format == "table":
-                    self.logger.info("Table format is not directly applicable for DESCRIBE queries. Showing Turtle format.")
-                    return graph_result.serialize(format="turtle")
-                    
-            elif any(keyword in query_upper for keyword in ["INSERT", "DELETE", "LOAD", "CLEAR", "CREATE", "DROP"]):
-                # UPDATE query
-                sparql_interface.update(query, timeout=timeout)
-                return "Update query executed successfully."
-                
-            else:
-                raise ValueError(f"Could not determine query type or query type not supported: {query[:50]}...")
+            cache_key = None
+            if (use_cache and stream is None and self._query_cache_ttl > 0
+                    and query_type in _CACHEABLE_QUERY_TYPES):
+                cache_key = (sparql_query_endpoint, query, format)
+                result = self._cached_result(cache_key)
+                if result is not None:
+                    return result
+            
+            result = self._dispatch_query(sparql_interface, query, query_type, timeout, format, stream)
+            if cache_key is not None and result is not None:
+                self._cache_result(cache_key, result)
+            return result
                 
         except SPARQLWrapperException as e:
             self.logger.error(f"SPARQL query failed: {e}")
@@ -139,12 +274,113 @@ class SparqlService:
             self.logger.error(f"Unexpected error during SPARQL query execution: {e}")
             raise
     
+    def _dispatch_query(self, sparql_interface: SparqlQueryInterface, query: str,
+                        query_type: Optional[str], timeout: int, format: str,
+                        stream: Optional[BinaryIO]) -> Any:
+        """Run a query of the given type and format its results (see execute_query)."""
+        if query_type is None:
+            raise ValueError(f"Could not determine query type or query type not supported: {query[:50]}...")
+        handler = self._query_handlers.get(query_type, SparqlService._handle_update)
+        return handler(self, sparql_interface, query, query_type, timeout, format, stream)
+    
+    def _handle_select(self, sparql_interface: SparqlQueryInterface, query: str, query_type: str,
+                       timeout: int, format: str, stream: Optional[BinaryIO]) -> Any:
+        """Run a SELECT query and format its bindings."""
+        results = sparql_interface.select(query, timeout=timeout)
+        
+        if format == "json":
+            return _dumps_indented(results)
+        elif format == "table":
+            if results:
+                # Format as table, collecting lines and joining once
+                # instead of growing a string row by row
+                headers = list(results[0].keys())
+                header_line = " | ".join(headers)
+                lines = [header_line, "-" * len(header_line)]
+                lines.extend(
+                    " | ".join([str(row.get(header, "")) for header in headers])
+                    for row in results
+                )
+                lines.append("")
+                return "\n".join(lines)
+            else:
+                return "No results found."
+        elif format == "turtle":
+            self.logger.info("Turtle format is not applicable for SELECT queries.")
+            return str(results)
+    
+    def _handle_ask(self, sparql_interface: SparqlQueryInterface, query: str, query_type: str,
+                    timeout: int, format: str, stream: Optional[BinaryIO]) -> Any:
+        """Run an ASK query and format its boolean result."""
+        result = sparql_interface.ask(query, timeout=timeout)
+        
+        if format == "json":
+            return _dumps_indented({"boolean": result})
+        else:  # table or turtle
+            return str(result)
+    
+    def _handle_construct(self, sparql_interface: SparqlQueryInterface, query: str, query_type: str,
+                          timeout: int, format: str, stream: Optional[BinaryIO]) -> Optional[str]:
+        """Run a CONSTRUCT query and serialize its graph."""
+        if stream is not None:
+            sparql_interface.construct_to_stream(query, stream, format=self._graph_format(query_type, format), timeout=timeout)
+            return None
+        graph_result = sparql_interface.construct(query, timeout=timeout)
+        return self._format_graph(graph_result, query_type, format)
+    
+    def _handle_describe(self, sparql_interface: SparqlQueryInterface, query: str, query_type: str,
+                         timeout: int, format: str, stream: Optional[BinaryIO]) -> Optional[str]:
+        """Run a DESCRIBE query and serialize its graph."""
+        if stream is not None:
+            sparql_interface.describe_to_stream(query, stream, format=self._graph_format(query_type, format), timeout=timeout)
+            return None
+        graph_result = sparql_interface.describe(query, timeout=timeout)
+        return self._format_graph(graph_result, query_type, format)
+    
+    def _handle_update(self, sparql_interface: SparqlQueryInterface, query: str, query_type: str,
+                       timeout: int, format: str, stream: Optional[BinaryIO]) -> str:
+        """Run an update, which invalidates cached query results."""
+        self.clear_query_cache()
+        sparql_interface.update(query, timeout=timeout)
+        return "Update query executed successfully."
+    
+    # Handler per query type; every other recognized keyword starts an update
+    _query_handlers = {
+        "SELECT": _handle_select,
+        "ASK": _handle_ask,
+        "CONSTRUCT": _handle_construct,
+        "DESCRIBE": _handle_describe,
+    }
+    
+    def _load_interface(self, endpoint_url: Optional[str], update_endpoint_url: Optional[str],
+                        username: Optional[str], password: Optional[str]) -> SparqlQueryInterface:
+        """Get the SPARQL interface for loading data, given endpoint and credential overrides.
+        
+        Raises:
+            ValueError: If no update endpoint is configured or given
+        """
+        # Determine SPARQL endpoints
+        sparql_update_endpoint_url = update_endpoint_url if update_endpoint_url else self.sparql_interface.update_endpoint_url
+        sparql_query_endpoint = endpoint_url if endpoint_url else self.sparql_interface.endpoint_url
+
+        if not sparql_update_endpoint_url:
+            raise ValueError("SPARQL update endpoint not specified via parameter or configuration.")
+
+        return self._interface_for(sparql_query_endpoint, sparql_update_endpoint_url, username, password)
+    
     def load_rdf_file(self, file_path: Path, graph_uri: Optional[str] = None,
                      endpoint_url: Optional[str] = None, update_endpoint_url: Optional[str] = None,
                      username: Optional[str] = None, password: Optional[str] = None,
-                     rdf_format: str = "turtle", upsert: bool = False) -> None:
+                     rdf_format: Optional[str] = None, upsert: bool = False,
+                     prefer_server_load: bool = False) -> None:
         """Load an RDF file into the SPARQL store.
         
+        By default the file is parsed here and its triples are sent to the
+        store. With prefer_server_load, the store is instead asked to read
+        the file itself with LOAD <file://...>, which saves parsing and
+        re-serializing it; this only works when the store runs on the same
+        host (or shares the file system) and may read the file.
+        
         Args:
             file_path: Path to the RDF file to load
             graph_uri: Named graph URI to load data into
@@ -152,8 +388,12 @@ class SparqlService:
             update_endpoint_url: SPARQL update endpoint URL (overrides config if provided)
             username: Username for authentication
             password: Password for authentication
-            rdf_format: Format of the RDF file
+            rdf_format: Format of the RDF file ("turtle", or "nt" for N-Triples,
+                which parses fastest); guessed from the file suffix if not given
             upsert: If True, performs upsert to avoid duplicates (default: False)
+            prefer_server_load: If True, has the store load the file with a
+                LOAD <file://...> update; ignored when upserting, which needs
+                the file's triples (default: False)
             
         Raises:
             ValueError: If required endpoints are not configured
@@ -161,27 +401,17 @@ class SparqlService:
             FileNotFoundError: If the RDF file doesn't exist
             Exception: For other unexpected errors
         """
-        # Determine SPARQL endpoints
-        sparql_update_endpoint_url = update_endpoint_url if update_endpoint_url else self.sparql_interface.update_endpoint_url
-        sparql_query_endpoint = endpoint_url if endpoint_url else self.sparql_interface.endpoint_url
-
-        if not sparql_update_endpoint_url:
-            raise ValueError("SPARQL update endpoint not specified via parameter or configuration.")
-
-        # Instantiate SPARQL interface
-        sparql_interface = self.sparql_interface
-        if (endpoint_url and endpoint_url != self.sparql_interface.endpoint_url) or \
-           (update_endpoint_url and update_endpoint_url != self.sparql_interface.update_endpoint_url) or \
-           (username and password):
-            sparql_interface = SparqlQueryInterface(
-                endpoint_url=sparql_query_endpoint,
-                update_endpoint_url=sparql_update_endpoint_url,
-                username=username,
-                password=password
-            )
+        sparql_interface = self._load_interface(endpoint_url, update_endpoint_url, username, password)
+        self.clear_query_cache()
         
         try:
-            sparql_interface.load_file(file_path=str(file_path), graph_uri=graph_uri, format=rdf_format, upsert=upsert)
+            if prefer_server_load and not upsert:
+                sparql_interface.update(_server_load_operation(file_path, graph_uri))
+            else:
+                sparql_interface.load_file(
+                    file_path=str(file_path), graph_uri=graph_uri,
+                    format=rdf_format or _rdf_format_for(file_path), upsert=upsert
+                )
             operation = "upserted" if upsert else "loaded"
             self.logger.info(f"Successfully {operation} RDF file '{file_path}' into graph '{graph_uri}'.")
             
@@ -189,6 +419,137 @@ class SparqlService:
             operation = "upsert" if upsert else "load"
             self.logger.error(f"Failed to {operation} RDF file '{file_path}': {e}")
             raise
+    
+    def load_rdf_file_gsp(self, file_path: Path, graph_uri: Optional[str] = None,
+                          graph_store_url: Optional[str] = None,
+                          username: Optional[str] = None, password: Optional[str] = None,
+                          rdf_format: Optional[str] = None) -> None:
+        """Upload an RDF file unparsed through the SPARQL 1.1 Graph Store Protocol.
+        
+        The file is streamed to the store, which parses it, so nothing is
+        parsed or re-serialized here. The triples are added to the graph
+        (POST), not replacing it.
+        
+        Args:
+            file_path: Path to the RDF file to load
+            graph_uri: Named graph URI to load data into
+            graph_store_url: Graph Store Protocol endpoint URL (overrides config if provided)
+            username: Username for authentication
+            password: Password for authentication
+            rdf_format: Format of the RDF file; guessed from the file suffix if not given
+            
+        Raises:
+            ValueError: If no graph store URL is configured or given
+            SPARQLWrapperException: If the upload fails
+            FileNotFoundError: If the RDF file doesn't exist
+        """
+        sparql_graph_store_url = graph_store_url or self.graph_store_url
+        if not sparql_graph_store_url:
+            raise ValueError("SPARQL graph store URL not specified via parameter or configuration.")
+        
+        sparql_interface = self._interface_for(
+            self.sparql_interface.endpoint_url, self.sparql_interface.update_endpoint_url, username, password
+        )
+        self.clear_query_cache()
+        
+        try:
+            sparql_interface.upload_file(
+                file_path, graph_uri=graph_uri, format=rdf_format or _rdf_format_for(file_path),
+                graph_store_url=sparql_graph_store_url
+            )
+            self.logger.info(f"Successfully uploaded RDF file '{file_path}' into graph '{graph_uri}'.")
+        except Exception as e:
+            self.logger.error(f"Failed to upload RDF file '{file_path}': {e}")
+            raise
+    
+    def load_rdf_files_batched(
+        self,
+        file_paths: list[Path],
+        graph_uri: Optional[str] = None,
+        endpoint_url: Optional[str] = None,
+        update_endpoint_url: Optional[str] = None,
+        username: Optional[str] = None,
+        password: Optional[str] = None,
+        rdf_format: Optional[str] = None,
+        batch_triples: int = _LOAD_BATCH_TRIPLES,
+        upsert: bool = False,
+        prefer_server_load: bool = False,
+        graph_store_url: Optional[str] = None,
+        parse_workers: int = 1,
+    ) -> list[tuple[str, str]]:
+        """Load RDF files with their triples combined into shared update requests.
+        
+        Unlike load_rdf_file, which sends at least one request per file, the
+        files' triples are collected until a batch holds batch_triples of
+        them, and each batch is sent as one INSERT DATA (or upsert) request.
+        
+        Args:
+            file_paths: List of RDF file paths to load
+            graph_uri: Named graph URI to load data into
+            endpoint_url: SPARQL endpoint URL (overrides config if provided)
+            update_endpoint_url: SPARQL update endpoint URL (overrides config if provided)
+            username: Username for authentication
+            password: Password for authentication
+            rdf_format: Format of the RDF files; guessed from each file's
+                suffix if not given
+            batch_triples: Number of triples sent per request
+            upsert: If True, performs upsert to avoid duplicates (default: False)
+            prefer_server_load: If True, sends one LOAD <file://...> operation
+                per file in a single update request instead of the files'
+                triples (see load_rdf_file); ignored when upserting
+            graph_store_url: If given (and not upserting or loading on the
+                server), each file is uploaded unparsed to this Graph Store
+                Protocol endpoint instead (see load_rdf_file_gsp)
+            parse_workers: Number of threads parsing files ahead of the one
+                being batched (default: 1)
+            
+        Returns:
+            (file path, error message) for each file that failed to parse or load
+            
+        Raises:
+            ValueError: If required endpoints are not configured
+        """
+        sparql_interface = self._load_interface(endpoint_url, update_endpoint_url, username, password)
+        self.clear_query_cache()
+        if prefer_server_load and not upsert:
+            try:
+                sparql_interface.update_many(
+                    [_server_load_operation(file_path, graph_uri) for file_path in file_paths]
+                )
+                failures = []
+            except Exception as e:
+                # The operations share one request, so a failure cannot be
+                # attributed to a single file
+                failures = [(str(file_path), str(e)) for file_path in file_paths]
+        elif graph_store_url and not upsert:
+            # Files are uploaded one per request: blank node labels are
+            # scoped to a file, so files cannot be concatenated
+            failures = []
+            for file_path in file_paths:
+                try:
+                    sparql_interface.upload_file(
+                        file_path, graph_uri=graph_uri, format=rdf_format or _rdf_format_for(file_path),
+                        graph_store_url=graph_store_url
+                    )
+                except Exception as e:
+                    failures.append((str(file_path), str(e)))
+        else:
+            # Files of each format are batched together
+            files_by_format: Dict[str, list[Path]] = {}
+            for file_path in file_paths:
+                files_by_format.setdefault(rdf_format or _rdf_format_for(file_path), []).append(file_path)
+            failures = []
+            for file_format, format_files in files_by_format.items():
+                failures.extend(sparql_interface.load_files(
+                    format_files, graph_uri=graph_uri, format=file_format, upsert=upsert,
+                    batch_triples=batch_triples, parse_workers=parse_workers
+                ))
+        operation = "upserted" if upsert else "loaded"
+        self.logger.info(
+            f"Batched {operation} {len(file_paths) - len(failures)} of {len(file_paths)} RDF files into graph '{graph_uri}'."
+        )
+        return failures
+    
     def load_rdf_files_batch(
         self,
         file_paths: list[Path],
@@ -197,13 +558,18 @@ class SparqlService:
         update_endpoint_url: Optional[str] = None,
         username: Optional[str] = None,
         password: Optional[str] = None,
-        rdf_format: str = "turtle",
+        rdf_format: Optional[str] = None,
         batch_size: int = 10,
         upsert: bool = False,
+        workers: Optional[int] = None,
     ) -> None:
         """
         Efficiently load a large number of RDF files into the SPARQL store in batches.
 
+        The files of a batch are loaded concurrently, since each load mostly
+        waits on the endpoint. All loads share one SPARQL interface, whose
+        HTTP client keeps its connections open between files.
+
         Args:
             file_paths: List of RDF file paths to load
             graph_uri: Named graph URI to load data into
@@ -214,41 +580,55 @@ class SparqlService:
             rdf_format: Format of the RDF files
             batch_size: Number of files to load per batch
             upsert: If True, performs upsert to avoid duplicates (default: False)
+            workers: Number of files loaded at once (default:
+                config.sparql_load_workers, or 4)
+
+        Files that fail to load do not stop the others; their errors are
+        logged once all batches have been sent.
 
         Raises:
-            Exception: If any batch fails to load
+            ValueError: If no SPARQL update endpoint is configured
         """
         from time import time
 
+        if workers is None:
+            configured = getattr(self.config, 'sparql_load_workers', None)
+            workers = configured if isinstance(configured, int) else _LOAD_WORKERS
+        workers = max(1, workers)
+
+        # Resolve the interface once, so every load reuses its connections
+        sparql_interface = self._load_interface(endpoint_url, update_endpoint_url, username, password)
+        self.clear_query_cache()
+
+        def load(file_path: Path) -> None:
+            sparql_interface.load_file(
+                file_path=str(file_path), graph_uri=graph_uri,
+                format=rdf_format or _rdf_format_for(file_path), upsert=upsert
+            )
+
         total_files = len(file_paths)
         errors = []
         operation = "Upserting" if upsert else "Loading"
         
-        for i in range(0, total_files, batch_size):
-            batch = file_paths[i : i + batch_size]
-            self.logger.info(
-                f"{operation} RDF batch {i // batch_size + 1} ({len(batch)} files: {i + 1}-{min(i + batch_size, total_files)})"
-            )
-            start_time = time()
-            for file_path in batch:
-                try:
-                    self.load_rdf_file(
-                        file_path=file_path,
-                        graph_uri=graph_uri,
-                        endpoint_url=endpoint_url,
-                        update_endpoint_url=update_endpoint_url,
-                        username=username,
-                        password=password,
-                        rdf_format=rdf_format,
-                        upsert=upsert,
-                    )
-                except Exception as e:
-                    errors.append((str(file_path), str(e)))
-            elapsed = time() - start_time
-            operation_past = "upserted" if upsert else "loaded"
-            self.logger.info(
-                f"Batch {i // batch_size + 1} {operation_past} in {elapsed:.2f}s"
-            )
+        with ThreadPoolExecutor(max_workers=workers) as executor:
+            for i in range(0, total_files, batch_size):
+                batch = file_paths[i : i + batch_size]
+                self.logger.info(
+                    f"{operation} RDF batch {i // batch_size + 1} ({len(batch)} files: {i + 1}-{min(i + batch_size, total_files)})"
+                )
+                start_time = time()
+                futures = {executor.submit(load, file_path): file_path for file_path in batch}
+                # Results are collected on this thread, so errors need no lock
+                for future in as_completed(futures):
+                    try:
+                        future.result()
+                    except Exception as e:
+                        errors.append((str(futures[future]), str(e)))
+                elapsed = time() - start_time
+                operation_past = "upserted" if upsert else "loaded"
+                self.logger.info(
+                    f"Batch {i // batch_size + 1} {operation_past} in {elapsed:.2f}s"
+                )
         if errors:
             operation_lower = "upserting" if upsert else "loading"
             self.logger.error(
@@ -0,0 +1,31 @@
+"""Helpers for classifying glob file patterns."""
+
+import os
+from functools import lru_cache
+from typing import Optional, Tuple
+
+
+# Characters that make a glob pattern segment non-literal
+GLOB_CHARS = frozenset('*?[')
+
+
+@lru_cache(maxsize=64)
+def parse_suffix_pattern(pattern: str) -> Optional[Tuple[str, bool, str]]:
+    """Split a glob pattern of the form "[dir/...][**/]*<suffix>".
+    
+    Returns:
+        Tuple of (literal directory, recursive, suffix), or None if the pattern
+        needs full glob matching
+    """
+    *directories, name = pattern.split('/')
+    recursive = bool(directories) and directories[-1] == '**'
+    if recursive:
+        directories.pop()
+    if (
+        not name.startswith('*')
+        or len(name) == 1
+        or GLOB_CHARS.intersection(name[1:])
+        or any(not d or d in ('.', '..') or GLOB_CHARS.intersection(d) for d in directories)
+    ):
+        return None
+    return os.path.join(*directories) if directories else '', recursive, name[1:]
@@ -0,0 +1,140 @@
+"""Fast loading of YAML frontmatter blocks."""
+
+import datetime
+import re
+from typing import Any, Dict, Optional
+
+import yaml
+
+try:
+    # libyaml-backed loader, several times faster than the pure-Python one
+    from yaml import CSafeLoader as _YamlLoader
+except ImportError:
+    from yaml import SafeLoader as _YamlLoader
+
+
+# A top-level "key: value" line with a plain identifier key
+_KEY_VALUE_RE = re.compile(r'([A-Za-z_][A-Za-z0-9_-]*):(?: (.*))?')
+
+# Scalars that YAML resolves to something other than a string when they
+# start with a digit; only these forms are constructed here
+_INT_RE = re.compile(r'(?:0|[1-9][0-9]*)')
+_DATE_RE = re.compile(r'([0-9]{4})-([0-9]{2})-([0-9]{2})')
+
+# Plain words that YAML resolves to booleans or null
+_RESERVED_WORDS = frozenset((
+    'yes', 'no', 'true', 'false', 'on', 'off', 'null',
+))
+
+# Characters that give a plain scalar's first character a special meaning
+_INDICATORS = frozenset('-?:,[]{}#&*!|>\'"%@`~<=+.')
+
+# Characters that end a plain scalar inside a flow sequence, or that the
+# pure-Python YAML loader rejects there ("?")
+_FLOW_CHARS = frozenset(',[]{}?')
+
+# Returned by _scalar when the value needs the full YAML parser
+_UNSUPPORTED = object()
+
+
+def _scalar(text: str, flow: bool = False) -> Any:
+    """Convert a single-line scalar the way YAML's safe loader would.
+
+    Args:
+        text: The scalar text without surrounding whitespace
+        flow: Whether the scalar is an item of a flow sequence
+
+    Returns:
+        The value, or _UNSUPPORTED if the scalar uses any YAML feature
+        beyond plain strings, quoted strings without escapes, decimal
+        integers and dates
+    """
+    if not text:
+        return None if not flow else _UNSUPPORTED
+    first = text[0]
+    if first == '"' or first == "'":
+        inner = text[1:-1]
+        if len(text) < 2 or text[-1] != first or first in inner or '\\' in inner:
+            return _UNSUPPORTED
+        return inner
+    if first.isdigit():
+        if _INT_RE.fullmatch(text):
+            return int(text)
+        date_match = _DATE_RE.fullmatch(text)
+        if date_match:
+            try:
+                return datetime.date(*map(int, date_match.groups()))
+            except ValueError:
+                return _UNSUPPORTED
+        return _UNSUPPORTED
+    if (
+        first in _INDICATORS
+        or text.endswith(':')
+        or ': ' in text
+        or ' #' in text
+        or text.lower() in _RESERVED_WORDS
+        or (flow and _FLOW_CHARS.intersection(text))
+    ):
+        return _UNSUPPORTED
+    return text
+
+
+def _parse_simple_yaml(text: str) -> Optional[Dict[str, Any]]:
+    """Parse frontmatter made only of "key: scalar" and "key: [a, b]" lines.
+
+    Most notes carry a handful of such fields (title, date, tags), which are
+    parsed here without going through a YAML parser. Any line outside that
+    subset - indentation, block sequences, anchors, multi-line or escaped
+    scalars, duplicate keys - makes this return None so the caller falls
+    back to the full parser, which then produces the same result.
+
+    Returns:
+        The parsed mapping, or None if the text needs the full YAML parser
+    """
+    data: Dict[str, Any] = {}
+    for line in text.split('\n'):
+        if not line or line.startswith('#'):
+            continue
+        if not line.isprintable():
+            return None
+        match = _KEY_VALUE_RE.fullmatch(line.rstrip(' '))
+        if match is None:
+            return None
+        key, value = match.groups()
+        if key in data or key.lower() in _RESERVED_WORDS:
+            return None
+        value = value.strip(' ') if value else ''
+        if value.startswith('['):
+            if not value.endswith(']'):
+                return None
+            items = value[1:-1].strip(' ')
+            parsed = [_scalar(item.strip(' '), flow=True) for item in items.split(',')] if items else []
+            if _UNSUPPORTED in parsed:
+                return None
+        else:
+            parsed = _scalar(value)
+            if parsed is _UNSUPPORTED:
+                return None
+        data[key] = parsed
+    return data
+
+
+def load_frontmatter_yaml(text: str) -> Any:
+    """Load a YAML frontmatter block.
+
+    Simple blocks are parsed directly; everything else is loaded with the
+    safe YAML loader.
+
+    Args:
+        text: The YAML text between the frontmatter delimiters
+
+    Returns:
+        The loaded value, as yaml.load with a safe loader would return it
+
+    Raises:
+        yaml.YAMLError: If the text is not valid YAML
+    """
+    data = _parse_simple_yaml(text)
+    if data is not None:
+        return data or None
+    return yaml.load(text, Loader=_YamlLoader)
@@ -1,9 +1,64 @@
 import hashlib
 import base64
+import itertools
+import os
 import re
 import unicodedata
+import uuid
+from functools import lru_cache
 from urllib.parse import urljoin, quote
 
+
+# Runs of characters that are not allowed in a normalized ID segment
+_NON_ID_CHARS_RE = re.compile(r'[^a-z0-9]+')
+
+# Characters dropped from todo text, and runs of separators that become one
+# hyphen, when building todo IDs
+_TODO_DROPPED_CHARS_RE = re.compile(r'[^\w\s-]+')
+_TODO_SEPARATOR_RUN_RE = re.compile(r'[\s-]+')
+
+# Random per-process prefix and sequence behind new_element_id
+_element_id_prefix = uuid.uuid4().hex
+_element_id_counter = itertools.count()
+
+
+def _reset_element_ids() -> None:
+    """Give a forked child process its own element ID prefix."""
+    global _element_id_prefix, _element_id_counter
+    _element_id_prefix = uuid.uuid4().hex
+    _element_id_counter = itertools.count()
+
+
+if hasattr(os, 'register_at_fork'):
+    os.register_at_fork(after_in_child=_reset_element_ids)
+
+
+def new_element_id() -> str:
+    """Return a new process-unique ID for a parsed content element.
+
+    Element IDs only link elements of a parse to each other, so they need to
+    be unique but not random: a random prefix drawn once per process plus a
+    counter avoids reading os.urandom for every element as uuid.uuid4() does.
+    Knowledge base entity IDs are generated deterministically by
+    EntityIdGenerator instead.
+    """
+    return f"{_element_id_prefix}-{next(_element_id_counter):x}"
+
+
+@lru_cache(maxsize=100_000)
+def _deterministic_hash(combined_string: str) -> str:
+    """Hash a string into a short, URL-safe ID, remembering recent results.
+
+    The same (document, link text) pairs come up again on every re-run, so
+    repeated inputs are served from the cache instead of hashed again.
+    """
+    # The first 12 bytes of the SHA-256 digest encode to exactly the first
+    # 16 characters of the full digest's URL-safe base64 form, without
+    # padding, so IDs stay the same as when the full digest was encoded
+    digest = hashlib.sha256(combined_string.encode('utf-8'), usedforsecurity=False).digest()[:12]
+    return base64.urlsafe_b64encode(digest).decode('ascii')
+
+
 class EntityIdGenerator:
     """
     Generates deterministic, unique identifiers for knowledge base entities.
@@ -46,11 +101,9 @@ class EntityIdGenerator:
         # 2. Convert to lowercase
         normalized = normalized.lower()
         
-        # 3. Replace non-alphanumeric with hyphens
-        normalized = re.sub(r'[^a-z0-9]', '-', normalized)
-        
-        # 4. Remove consecutive hyphens
-        normalized = re.sub(r'-+', '-', normalized)
+        # 3. Replace non-alphanumeric with hyphens and
+        # 4. remove consecutive hyphens, in a single pass over runs
+        normalized = _NON_ID_CHARS_RE.sub('-', normalized)
         
         # 5. Trim hyphens from start/end
         normalized = normalized.strip('-')
@@ -61,11 +114,7 @@ class EntityIdGenerator:
         """
         Creates a short, URL-safe hash from a set of input strings.
         """
-        combined_string = "".join(parts)
-        # Use SHA-256 for a strong hash
-        sha256_hash = hashlib.sha256(combined_string.encode('utf-8')).digest()
-        # Use URL-safe base64 encoding and take the first 16 characters for a reasonable length
-        return base64.urlsafe_b64encode(sha256_hash).decode('utf-8').rstrip('=')[:16]
+        return _deterministic_hash("".join(parts))
 
     def generate_document_id(self, file_path: str) -> str:
         """
@@ -212,21 +261,12 @@ class EntityIdGenerator:
             A full URI for the TodoItem entity.
         """
         # Normalize the todo text for use in URI
-        # - Strip whitespace
-        # - Replace spaces with hyphens
-        # - Remove special characters but keep alphanumeric and hyphens
         # - Convert to lowercase for consistency
-        normalized_text = todo_text.strip().lower()
-        # Remove special characters except alphanumeric, spaces, and hyphens
-        normalized_text = re.sub(r'[^\w\s-]', '', normalized_text)
-        # Replace multiple spaces with single space
-        normalized_text = re.sub(r'\s+', ' ', normalized_text)
-        # Replace spaces with hyphens for URI-friendly format
-        normalized_text = normalized_text.replace(' ', '-')
-        # Remove multiple consecutive hyphens
-        normalized_text = re.sub(r'-+', '-', normalized_text)
-        # Remove leading/trailing hyphens
-        normalized_text = normalized_text.strip('-')
+        # - Remove special characters but keep alphanumeric and hyphens
+        # - Replace each run of whitespace and hyphens with a single hyphen
+        # - Remove leading/trailing hyphens
+        normalized_text = _TODO_DROPPED_CHARS_RE.sub('', todo_text.lower())
+        normalized_text = _TODO_SEPARATOR_RUN_RE.sub('-', normalized_text).strip('-')
 
         # Ensure the text is not empty after normalization
         if not normalized_text:
@@ -1,9 +1,16 @@
 """Tests for the Processor component."""
 
+import re
+import shutil
+import tempfile
 import unittest
+from pathlib import Path
 from unittest.mock import MagicMock, patch
 
+from knowledgebase_processor.config.config import Config
+from knowledgebase_processor.processor.pipeline_orchestrator import ProcessingPipeline
 from knowledgebase_processor.processor.processor import Processor
+from knowledgebase_processor.reader.reader import Reader
 from knowledgebase_processor.models.content import Document, ContentElement
 from knowledgebase_processor.utils.document_registry import DocumentRegistry
 from knowledgebase_processor.utils.id_generator import EntityIdGenerator
@@ -123,6 +130,143 @@ class TestProcessor(unittest.TestCase):
         # Check that the title was updated from filename with hyphens/underscores converted to spaces
         self.assertEqual(document.title, "test file with special chars")
 
+    def test_enable_entity_analysis_keeps_registered_components(self):
+        """Test that enabling entity analysis adds the recognizer once and keeps other analyzers."""
+        from knowledgebase_processor.analyzer.entity_recognizer import EntityRecognizer
+
+        analyzers = self.processor.entity_processor.named_entity_processor.analyzers
+        existing = MagicMock()
+        self.processor.register_analyzer(existing)
+        extractors = list(self.processor.entity_processor.element_processor.extractors)
+
+        with patch.object(EntityRecognizer, "__init__", autospec=True,
+                          side_effect=lambda recognizer, enabled=False: setattr(recognizer, "enabled", enabled)):
+            self.processor.enable_entity_analysis()
+            self.processor.enable_entity_analysis()
+
+        self.assertIs(analyzers[0], existing)
+        self.assertEqual([type(a) for a in analyzers[1:]], [EntityRecognizer])
+        self.assertEqual(self.processor.entity_processor.element_processor.extractors, extractors)
+
+    def test_rdf_serialization_applies_to_one_call(self):
+        """Test that a per-call RDF serialization does not change the processor's format."""
+        seen = []
+        with patch.object(self.processor.pipeline, "process_documents_batch",
+                          side_effect=lambda **kwargs: seen.append(self.processor.rdf_processor.serialization_format)
+                          or MagicMock(processing_errors=0)):
+            self.processor.process_and_generate_rdf(
+                reader=MagicMock(), metadata_store=MagicMock(), pattern="**/*.md",
+                knowledge_base_path=Path("/kb"), rdf_serialization="nt",
+            )
+
+        self.assertEqual(seen, ["nt"])
+        self.assertEqual(self.processor.rdf_processor.serialization_format, "turtle")
+
+
+class TestProcessorWorkerProcesses(unittest.TestCase):
+    """Test processing documents in worker processes."""
+
+    def setUp(self):
+        """Create a knowledge base large enough to be processed in parallel."""
+        self.temp_dir = tempfile.mkdtemp()
+        self.addCleanup(shutil.rmtree, self.temp_dir)
+        self.kb_dir = Path(self.temp_dir) / "kb"
+        self.kb_dir.mkdir()
+        count = 40
+        for i in range(count):
+            (self.kb_dir / f"note{i}.md").write_text(
+                f"---\ntitle: Note {i}\ntags: [a, b]\n---\n# Note {i}\n\n"
+                f"See [[note{(i + 1) % count}]].\n\n- [ ] task {i}\n- [x] done\n"
+            )
+
+    def _process(self, workers):
+        config = Config(
+            knowledge_base_path=str(self.kb_dir),
+            metadata_store_path=str(Path(self.temp_dir) / "metadata"),
+            processing_workers=workers,
+        )
+        processor = Processor(
+            document_registry=DocumentRegistry(),
+            id_generator=EntityIdGenerator(base_url="http://example.org/kb/"),
+            config=config,
+        )
+        output_dir = Path(self.temp_dir) / f"rdf_{workers}"
+        metadata_store = MagicMock()
+        result = processor.process_and_generate_rdf(
+            reader=Reader(str(self.kb_dir)),
+            metadata_store=metadata_store,
+            pattern="**/*.md",
+            knowledge_base_path=self.kb_dir,
+            rdf_output_dir_str=str(output_dir),
+        )
+        self.assertEqual(result, 0)
+        self.assertEqual(metadata_store.save.call_count, 40)
+        # Creation timestamps differ between runs
+        return {
+            path.name: re.sub(r'"[0-9T:.+-]+"\^\^xsd:dateTime', "", path.read_text())
+            for path in output_dir.glob("*.ttl")
+        }
+
+    def test_workers_generate_same_rdf_as_single_process(self):
+        """Test that worker processes produce the same RDF files and metadata saves."""
+        expected = self._process(workers=1)
+
+        with patch.object(
+            ProcessingPipeline, "_process_documents_in_workers", autospec=True,
+            side_effect=ProcessingPipeline._process_documents_in_workers,
+        ) as in_workers:
+            actual = self._process(workers=2)
+            self.assertEqual(in_workers.call_count, 1)
+
+        self.assertEqual(len(expected), 40)
+        self.assertEqual(actual, expected)
+
+    def test_rerun_skips_documents_with_current_rdf(self):
+        """Test that only changed documents are processed again into an existing output directory."""
+        output_dir = Path(self.temp_dir) / "rdf_incremental"
+
+        def run(incremental=True, analyzer=None):
+            processor = Processor(
+                document_registry=DocumentRegistry(),
+                id_generator=EntityIdGenerator(base_url="http://example.org/kb/"),
+                config=Config(
+                    knowledge_base_path=str(self.kb_dir),
+                    metadata_store_path=str(Path(self.temp_dir) / "metadata"),
+                    processing_workers=1,
+                    incremental_rdf=incremental,
+                ),
+            )
+            if analyzer is not None:
+                processor.register_analyzer(analyzer)
+            metadata_store = MagicMock()
+            processor.process_and_generate_rdf(
+                reader=Reader(str(self.kb_dir)),
+                metadata_store=metadata_store,
+                pattern="**/*.md",
+                knowledge_base_path=self.kb_dir,
+                rdf_output_dir_str=str(output_dir),
+            )
+            return sorted(call.args[0].path for call in metadata_store.save.call_args_list)
+
+        self.assertEqual(len(run()), 40)
+        self.assertEqual(run(), [])
+
+        note = self.kb_dir / "note3.md"
+        note.write_text(note.read_text() + "\nAlso [[note20]].\n")
+        self.assertEqual(run(), ["note3.md"])
+        self.assertIn("[[note20]]", (output_dir / "note3.ttl").read_text())
+
+        (self.kb_dir / "note40.md").write_text("# Note 40\n")
+        self.assertEqual(len(run()), 41)
+
+        # Incremental runs are opt-in
+        self.assertEqual(len(run(incremental=False)), 41)
+
+        # Registering another analyzer invalidates every entry
+        analyzer = MagicMock()
+        analyzer.analyze_text_for_entities.return_value = []
+        self.assertEqual(len(run(analyzer=analyzer)), 41)
+        self.assertEqual(run(analyzer=analyzer), [])
 
 if __name__ == "__main__":
     unittest.main()
\ No newline at end of file
@@ -0,0 +1,553 @@
+"""Unit tests for SparqlQueryInterface."""
+
+import gzip
+import io
+import json
+import unittest
+from unittest.mock import patch
+
+import httpx
+from rdflib import Graph, Literal, URIRef
+from rdflib.namespace import XSD
+from rdflib.compare import isomorphic
+from SPARQLWrapper.SPARQLExceptions import SPARQLWrapperException
+
+from knowledgebase_processor.query_interface import sparql_interface
+from knowledgebase_processor.query_interface.sparql_interface import (
+    AsyncSparqlQueryInterface,
+    SparqlQueryInterface,
+)
+
+
+class TestSparqlQueryInterface(unittest.TestCase):
+    """Test cases for SparqlQueryInterface."""
+
+    def setUp(self):
+        """Set up an interface whose HTTP client records requests."""
+        self.requests = []
+        self.responses = []
+        self.interface = SparqlQueryInterface(endpoint_url="http://localhost:3030/test/query")
+        self.interface._http.close()
+        self.interface._http = httpx.Client(transport=httpx.MockTransport(self._handle))
+
+    def tearDown(self):
+        self.interface.close()
+
+    def _handle(self, request):
+        request.read()
+        self.requests.append(request)
+        return self.responses.pop(0) if self.responses else httpx.Response(204)
+
+    def test_select_posts_query_and_converts_bindings(self):
+        """Test that SELECT results are requested as JSON and converted."""
+        self.responses.append(httpx.Response(200, json={
+            "head": {"vars": ["s", "n"]},
+            "results": {"bindings": [{
+                "s": {"type": "uri", "value": "http://example.org/a"},
+                "n": {"type": "literal", "value": "3",
+                      "datatype": "http://www.w3.org/2001/XMLSchema#integer"},
+            }]},
+        }))
+
+        results = self.interface.select("SELECT ?s ?n WHERE { ?s ?p ?n }")
+
+        self.assertEqual(results, [{"s": "http://example.org/a", "n": 3}])
+        request = self.requests[0]
+        self.assertEqual(str(request.url), "http://localhost:3030/test/query")
+        self.assertEqual(request.headers["content-type"], "application/sparql-query")
+        self.assertEqual(request.headers["accept"], "application/sparql-results+json")
+        self.assertEqual(request.content, b"SELECT ?s ?n WHERE { ?s ?p ?n }")
+
+    def test_query_timeout_is_sent_to_known_store(self):
+        """Test that the timeout becomes a query-string parameter in the store's unit."""
+        for server_kind, expected in [
+            ("virtuoso", "?timeout=15000"),
+            ("Fuseki", "?timeout=15"),
+            ("blazegraph", "?maxQueryTimeMillis=15000"),
+        ]:
+            self.interface.server_kind = server_kind
+            self.responses.append(httpx.Response(200, json={"head": {}, "boolean": True}))
+            self.interface.ask("ASK { ?s ?p ?o }", timeout=15)
+            self.assertEqual(str(self.requests[-1].url), "http://localhost:3030/test/query" + expected)
+
+    def test_ask(self):
+        """Test that ASK returns the boolean result."""
+        self.responses.append(httpx.Response(200, json={"head": {}, "boolean": True}))
+
+        self.assertTrue(self.interface.ask("ASK { ?s ?p ?o }"))
+
+    def test_construct_parses_ntriples(self):
+        """Test that CONSTRUCT prefers N-Triples and parses it into a graph."""
+        self.responses.append(httpx.Response(
+            200,
+            headers={"Content-Type": "application/n-triples"},
+            content=b'<http://example.org/a> <http://example.org/p> "x" .\n' * 3,
+        ))
+
+        graph = self.interface.construct("CONSTRUCT { ?s ?p ?o } WHERE { ?s ?p ?o }")
+
+        self.assertTrue(self.requests[0].headers["accept"].startswith("application/n-triples"))
+        self.assertEqual(len(graph), 1)
+        self.assertIn(
+            (URIRef("http://example.org/a"), URIRef("http://example.org/p"), Literal("x")),
+            graph,
+        )
+
+    def test_construct_to_stream_copies_matching_response(self):
+        """Test that an N-Triples response is written as sent and Turtle is converted when N-Triples is wanted."""
+        ntriples = b'<http://example.org/a> <http://example.org/p> "x" .\n'
+        self.responses.append(httpx.Response(200, headers={"Content-Type": "application/n-triples"}, content=ntriples))
+        self.responses.append(httpx.Response(
+            200, headers={"Content-Type": "text/turtle"},
+            content=b'@prefix ex: <http://example.org/> .\nex:a ex:p "x" .\n',
+        ))
+
+        copied, converted = io.BytesIO(), io.BytesIO()
+        self.interface.construct_to_stream("CONSTRUCT WHERE { ?s ?p ?o }", copied, format="turtle")
+        self.interface.construct_to_stream("CONSTRUCT WHERE { ?s ?p ?o }", converted, format="nt")
+
+        self.assertEqual(copied.getvalue(), ntriples)
+        self.assertEqual(converted.getvalue().strip(), ntriples.strip())
+
+    def test_parse_graph_matches_rdflib_parser(self):
+        """Test that the pyoxigraph parse path yields the same graph as rdflib."""
+        import tempfile
+
+        data = (
+            b'@prefix ex: <http://example.org/> .\n'
+            b'@prefix xsd: <http://www.w3.org/2001/XMLSchema#> .\n'
+            b'ex:a ex:p "x", "1"^^xsd:integer, "z"@en ;\n'
+            b'    ex:q [ ex:r ex:b ] .\n'
+        )
+
+        with tempfile.TemporaryDirectory() as temp_dir:
+            path = f"{temp_dir}/data.ttl"
+            with open(path, "wb") as f:
+                f.write(data)
+            graph = sparql_interface._parse_graph(path, "turtle")
+        with patch.object(sparql_interface, "pyoxigraph", None):
+            expected = sparql_interface._parse_graph(io.BytesIO(data), "turtle")
+
+        self.assertTrue(isomorphic(graph, expected))
+
+    def test_parse_graph_streams_ntriples_in_blocks(self):
+        """Test that N-Triples parsed a block at a time match rdflib's graph, blank nodes included."""
+        data = b"".join(
+            b'_:n%d <http://example.org/p> "v%d"^^<http://www.w3.org/2001/XMLSchema#string> .\n'
+            b'_:n%d <http://example.org/q> _:n%d . # next\n'
+            b'\n'
+            b'_:n%d <http://example.org/r> "w%d" .\r\n' % (i, i, i, i + 1, i, i)
+            for i in range(20)
+        )
+
+        with patch.object(sparql_interface, "_PARSE_BLOCK_SIZE", 64):
+            graph = sparql_interface._parse_graph(io.BytesIO(data), "nt")
+        expected = Graph().parse(data=data, format="nt")
+
+        self.assertEqual(len(graph), 60)
+        self.assertTrue(isomorphic(graph, expected))
+
+    def test_parse_graph_keeps_explicit_string_datatype(self):
+        """Test that literals declared as xsd:string keep their datatype, as with rdflib."""
+        for data, format in (
+            (b'@prefix x: <http://www.w3.org/2001/XMLSchema#> .\n'
+             b'<http://example.org/a> <http://example.org/p> "x"^^x:string, "y" .\n', "turtle"),
+            (b'<http://example.org/a> <http://example.org/p> "x"^^<http://www.w3.org/2001/XMLSchema#string> .\n'
+             b'<http://example.org/a> <http://example.org/p> "y" .\n', "nt"),
+        ):
+            graph = sparql_interface._parse_graph(io.BytesIO(data), format)
+
+            self.assertEqual(
+                sorted(graph.objects(), key=str),
+                [Literal("x", datatype=XSD.string), Literal("y")],
+            )
+
+    def test_describe_falls_back_to_turtle(self):
+        """Test that a Turtle response is parsed with the Turtle parser."""
+        self.responses.append(httpx.Response(
+            200,
+            headers={"Content-Type": "text/turtle; charset=utf-8"},
+            content=b'@prefix ex: <http://example.org/> .\nex:a ex:p "x" .\n',
+        ))
+
+        graph = self.interface.describe("DESCRIBE <http://example.org/a>")
+
+        self.assertIn(
+            (URIRef("http://example.org/a"), URIRef("http://example.org/p"), Literal("x")),
+            graph,
+        )
+
+    def test_update_posts_to_update_endpoint(self):
+        """Test that updates are sent to the derived update endpoint."""
+        self.interface.update("CLEAR DEFAULT")
+
+        request = self.requests[0]
+        self.assertEqual(str(request.url), "http://localhost:3030/test/query/update")
+        self.assertEqual(request.headers["content-type"], "application/sparql-update")
+        self.assertEqual(request.content, b"CLEAR DEFAULT")
+
+    def test_load_data_streams_insert_data(self):
+        """Test that load_data sends the graph inside an INSERT DATA request."""
+        graph = Graph()
+        graph.add((URIRef("http://example.org/a"), URIRef("http://example.org/p"), Literal("x")))
+
+        self.interface.load_data(graph, "http://example.org/graph")
+
+        body = self.requests[0].content.decode("utf-8")
+        self.assertTrue(body.startswith("INSERT DATA {\n    GRAPH <http://example.org/graph> {"))
+        self.assertIn('<http://example.org/a> <http://example.org/p> "x" .', body)
+
+    def test_load_data_splits_into_chunks(self):
+        """Test that load_data sends one INSERT DATA request per chunk."""
+        graph = Graph()
+        for i in range(5):
+            graph.add((URIRef(f"http://example.org/{i}"), URIRef("http://example.org/p"), Literal(i)))
+
+        self.interface.load_data(graph, chunk_size=2)
+
+        self.assertEqual(len(self.requests), 3)
+        loaded = Graph()
+        for request in self.requests:
+            body = request.content.decode("utf-8")
+            self.assertTrue(body.startswith("INSERT DATA {"))
+            loaded.parse(data=body[body.index("{") + 1:body.rindex("}")], format="nt")
+        self.assertEqual(set(loaded), set(graph))
+
+    def test_chunked_loads_keep_blank_nodes_in_one_request(self):
+        """Test that triples linked through blank nodes are never split across INSERT DATA requests."""
+        from rdflib import BNode
+
+        graph = Graph()
+        ex = "http://example.org/"
+        outer, inner = BNode(), BNode()
+        graph.add((URIRef(ex + "a"), URIRef(ex + "q"), outer))
+        graph.add((outer, URIRef(ex + "r"), inner))
+        graph.add((inner, URIRef(ex + "s"), Literal("x")))
+        for i in range(4):
+            graph.add((URIRef(f"{ex}{i}"), URIRef(ex + "p"), Literal(i)))
+
+        self.interface.load_data(graph, chunk_size=2)
+        self.interface.load_ntriples([
+            f"<{ex}a> <{ex}q> _:b1 .\n", f"<{ex}c> <{ex}p> \"1\" .\n",
+            f"_:b1 <{ex}r> \"y\" .\n", f"<{ex}d> <{ex}p> \"2\" .\n",
+        ], chunk_size=1)
+
+        bodies = [request.content.decode("utf-8") for request in self.requests]
+        graph_bodies, text_bodies = bodies[:-3], bodies[-3:]
+        # Both blank nodes appear twice, all in the same request
+        self.assertEqual([body.count("_:") for body in graph_bodies if "_:" in body], [4])
+        self.assertEqual(sorted(body.count("_:b1") for body in text_bodies), [0, 0, 2])
+
+    def test_upsert_data_bounds_insert_requests(self):
+        """Test that a small upsert is one request and a large one inserts in bounded chunks after the deletes."""
+        graph = Graph()
+        for i in range(5):
+            graph.add((URIRef(f"http://example.org/{i}"), URIRef("http://example.org/p"), Literal(i)))
+        doc = "http://example.org/kb/Document/a"
+
+        self.interface.upsert_data(graph, document_uris=[doc], chunk_size=5)
+        self.assertEqual(len(self.requests), 1)
+        body = self.requests[0].content.decode("utf-8")
+        self.assertIn(doc, body)
+        self.assertIn("INSERT DATA {", body)
+
+        self.requests.clear()
+        self.interface.upsert_data(graph, document_uris=[doc], chunk_size=2)
+        bodies = [request.content.decode("utf-8") for request in self.requests]
+        self.assertEqual(len(bodies), 4)
+        self.assertIn(doc, bodies[0])
+        self.assertNotIn("INSERT DATA", bodies[0])
+        self.assertTrue(all(body.startswith("INSERT DATA {") for body in bodies[1:]))
+
+    def test_load_files_combines_files_into_batches(self):
+        """Test that load_files sends several files' triples per request and reports bad files."""
+        import os
+        import tempfile
+
+        with tempfile.TemporaryDirectory() as temp_dir:
+            paths = []
+            for i in range(3):
+                path = os.path.join(temp_dir, f"doc{i}.ttl")
+                with open(path, "w") as f:
+                    f.write(f"<http://example.org/{i}> <http://example.org/p> <http://example.org/a> , <http://example.org/b> .\n")
+                paths.append(path)
+            bad_path = os.path.join(temp_dir, "bad.ttl")
+            with open(bad_path, "w") as f:
+                f.write("<http://example.org/broken\n")
+
+            failures = self.interface.load_files(paths[:2] + [bad_path] + paths[2:], "http://example.org/graph", batch_triples=4)
+
+        self.assertEqual([path for path, _ in failures], [bad_path])
+        self.assertEqual(len(self.requests), 2)
+        bodies = [request.content.decode("utf-8") for request in self.requests]
+        self.assertEqual([body.count(" .\n") for body in bodies], [4, 2])
+        for i, body in zip((0, 2), bodies):
+            self.assertIn(f"<http://example.org/{i}>", body)
+            self.assertTrue(body.startswith("INSERT DATA {\n    GRAPH <http://example.org/graph> {"))
+
+    def test_load_files_parses_ahead_in_order(self):
+        """Test that parsing files on worker threads sends the same batches in file order."""
+        import os
+        import tempfile
+
+        with tempfile.TemporaryDirectory() as temp_dir:
+            paths = []
+            for i in range(7):
+                path = os.path.join(temp_dir, f"doc{i}.nt")
+                with open(path, "w") as f:
+                    f.write(f"<http://example.org/{i}> <http://example.org/p> \"{i}\" .\n"
+                            if i != 4 else "<http://example.org/broken\n")
+                paths.append(path)
+
+            failures = self.interface.load_files(paths, format="nt", batch_triples=2)
+            sequential = [request.content for request in self.requests]
+            self.requests.clear()
+            parallel_failures = self.interface.load_files(paths, format="nt", batch_triples=2, parse_workers=3)
+
+        self.assertEqual([path for path, _ in parallel_failures], [paths[4]])
+        self.assertEqual(parallel_failures, failures)
+        self.assertEqual([request.content for request in self.requests], sequential)
+        self.assertEqual(len(sequential), 3)
+
+    def test_load_data_uses_graph_store_when_configured(self):
+        """Test that load_data uploads N-Triples to a Graph Store endpoint."""
+        self.interface.graph_store_url = "http://localhost:3030/test/data"
+        graph = Graph()
+        graph.add((URIRef("http://example.org/a"), URIRef("http://example.org/p"), Literal("x")))
+
+        self.interface.load_data(graph, "http://example.org/graph")
+
+        request = self.requests[0]
+        self.assertEqual(request.url.params["graph"], "http://example.org/graph")
+        self.assertEqual(request.headers["content-type"], "application/n-triples")
+        self.assertEqual(
+            request.content,
+            b'<http://example.org/a> <http://example.org/p> "x" .\n',
+        )
+
+    def test_upload_file_streams_file_to_graph_store(self):
+        """Test that upload_file posts the file's bytes unparsed with the format's media type."""
+        import os
+        import tempfile
+
+        content = b"@prefix ex: <http://example.org/> .\nex:a ex:p ex:b .\n"
+        with tempfile.TemporaryDirectory() as temp_dir:
+            path = os.path.join(temp_dir, "doc.ttl")
+            with open(path, "wb") as f:
+                f.write(content)
+
+            self.interface.upload_file(path, graph_store_url="http://localhost:3030/test/data")
+            self.interface.upload_file(path, "http://example.org/graph", format="nt",
+                                       graph_store_url="http://localhost:3030/test/data")
+            self.responses.append(httpx.Response(400))
+            with self.assertRaises(SPARQLWrapperException):
+                self.interface.upload_file(path, graph_store_url="http://localhost:3030/test/data")
+
+        default, named = self.requests[:2]
+        self.assertEqual(default.method, "POST")
+        self.assertEqual(dict(default.url.params), {"default": ""})
+        self.assertEqual(default.headers["content-type"], "text/turtle")
+        self.assertEqual(default.content, content)
+        self.assertEqual(named.url.params["graph"], "http://example.org/graph")
+        self.assertEqual(named.headers["content-type"], "application/n-triples")
+        with self.assertRaises(ValueError):
+            self.interface.upload_file(path, format="n3", graph_store_url="http://localhost:3030/test/data")
+
+    def test_load_ntriples_sends_lines_in_chunks(self):
+        """Test that pre-serialized N-Triples are sent as INSERT DATA requests."""
+        lines = [f'<http://example.org/{i}> <http://example.org/p> "x" .\n' for i in range(3)]
+
+        self.interface.load_ntriples(lines, "http://example.org/graph", chunk_size=2)
+
+        self.assertEqual(len(self.requests), 2)
+        first = self.requests[0].content.decode("utf-8")
+        self.assertTrue(first.startswith("INSERT DATA {\n    GRAPH <http://example.org/graph> {"))
+        self.assertIn(lines[0] + lines[1], first)
+        self.assertIn(lines[2], self.requests[1].content.decode("utf-8"))
+
+    def test_large_uploads_gzipped_when_enabled(self):
+        """Test that large update bodies are gzip-compressed when enabled."""
+        self.interface.compress_uploads = True
+        graph = Graph()
+        for i in range(2000):
+            graph.add((URIRef(f"http://example.org/s{i}"), URIRef("http://example.org/p"), Literal(f"value {i}")))
+
+        self.interface.load_data(graph)
+        self.interface.update("CLEAR DEFAULT")
+
+        large, small = self.requests
+        self.assertEqual(large.headers["content-encoding"], "gzip")
+        body = gzip.decompress(large.content).decode("utf-8")
+        self.assertTrue(body.startswith("INSERT DATA {"))
+        self.assertEqual(len(Graph().parse(data=body[body.index("{") + 1:body.rindex("}")], format="nt")), 2000)
+        self.assertNotIn("content-encoding", small.headers)
+        self.assertEqual(small.content, b"CLEAR DEFAULT")
+
+    def test_error_status_raises_sparql_exception(self):
+        """Test that HTTP error responses surface as SPARQLWrapperException."""
+        self.responses.append(httpx.Response(500, content=b"boom"))
+
+        with self.assertRaises(SPARQLWrapperException):
+            self.interface.select("SELECT * WHERE { ?s ?p ?o }")
+
+    @patch("knowledgebase_processor.query_interface.sparql_interface.time.sleep")
+    def test_query_retried_on_transient_status(self, sleep):
+        """Test that queries are retried with backoff on 502/503/504."""
+        self.responses.extend([
+            httpx.Response(503),
+            httpx.Response(502),
+            httpx.Response(200, json={"head": {}, "boolean": True}),
+        ])
+
+        self.assertTrue(self.interface.ask("ASK { ?s ?p ?o }"))
+        self.assertEqual(len(self.requests), 3)
+        self.assertEqual(sleep.call_count, 2)
+
+    @patch("knowledgebase_processor.query_interface.sparql_interface.time.sleep")
+    def test_query_retries_exhausted_raise(self, sleep):
+        """Test that a query failing on every attempt raises after the retries."""
+        self.responses.extend([httpx.Response(504)] * 4)
+
+        with self.assertRaises(SPARQLWrapperException):
+            self.interface.select("SELECT * WHERE { ?s ?p ?o }")
+        self.assertEqual(len(self.requests), self.interface.query_retries + 1)
+
+    @patch("knowledgebase_processor.query_interface.sparql_interface.time.sleep")
+    def test_update_is_not_retried(self, sleep):
+        """Test that updates fail on the first transient error status."""
+        self.responses.append(httpx.Response(503))
+
+        with self.assertRaises(SPARQLWrapperException):
+            self.interface.update("CLEAR DEFAULT")
+        self.assertEqual(len(self.requests), 1)
+        sleep.assert_not_called()
+
+    def test_is_available(self):
+        """Test that the health check reports the endpoint status."""
+        self.responses.extend([
+            httpx.Response(200, json={"head": {}, "boolean": True}),
+            httpx.Response(503),
+        ])
+
+        self.assertTrue(self.interface.is_available())
+        self.assertFalse(self.interface.is_available())
+
+    def test_cached_select_skips_request_until_update(self):
+        """Test that cached SELECT results are reused until an update runs."""
+        self.interface.cache_enabled = True
+        bindings = {"results": {"bindings": [{"g": {"type": "uri", "value": "http://example.org/g"}}]}}
+        self.responses.extend([
+            httpx.Response(200, json=bindings),
+            httpx.Response(204),
+            httpx.Response(200, json={"results": {"bindings": []}}),
+        ])
+        query = "SELECT ?g WHERE { GRAPH ?g { } }"
+
+        first = self.interface.select(query)
+        first.append({"g": "mutated"})
+        second = self.interface.select(query)
+        self.interface.update("CLEAR ALL")
+        third = self.interface.select(query)
+
+        self.assertEqual(second, [{"g": "http://example.org/g"}])
+        self.assertEqual(third, [])
+        self.assertEqual(len(self.requests), 3)
+
+    def test_select_is_not_cached_by_default(self):
+        """Test that queries always reach the endpoint unless caching is enabled."""
+        self.responses.append(httpx.Response(200, json={"boolean": True}))
+        self.responses.append(httpx.Response(200, json={"boolean": False}))
+
+        self.assertTrue(self.interface.ask("ASK { ?s ?p ?o }"))
+        self.assertFalse(self.interface.ask("ASK { ?s ?p ?o }"))
+
+    def test_count_triples_reads_count_binding(self):
+        """Test that count_triples reads the COUNT result for a named graph."""
+        self.responses.append(httpx.Response(200, json={"results": {"bindings": [{
+            "count": {"type": "literal", "value": "42",
+                      "datatype": "http://www.w3.org/2001/XMLSchema#integer"},
+        }]}}))
+
+        self.assertEqual(self.interface.count_triples("http://example.org/graph"), 42)
+        self.assertIn(b"GRAPH <http://example.org/graph>", self.requests[0].content)
+
+    def test_count_triples_reads_void_statistics_of_the_counted_graph(self):
+        """Test that the void:triples lookup is bound to the counted graph."""
+        count = {"results": {"bindings": [{"count": {"type": "literal", "value": "7"}}]}}
+        self.responses.append(httpx.Response(200, json=count))
+        self.responses.append(httpx.Response(200, json=count))
+
+        self.assertEqual(self.interface.count_triples("http://example.org/graph", prefer_metadata=True), 7)
+        self.assertEqual(self.interface.count_triples(prefer_metadata=True), 7)
+
+        self.assertIn(b"<http://example.org/graph> void:triples ?count", self.requests[0].content)
+        self.assertNotIn(b"?dataset void:triples", self.requests[0].content)
+        self.assertIn(b"?service sd:defaultDataset ?dataset", self.requests[1].content)
+        self.assertIn(b"?graph void:triples ?count", self.requests[1].content)
+
+    def test_list_graphs(self):
+        """Test that list_graphs returns the graph IRIs."""
+        self.responses.append(httpx.Response(200, json={"results": {"bindings": [
+            {"graph": {"type": "uri", "value": "http://example.org/a"}},
+            {"graph": {"type": "uri", "value": "http://example.org/b"}},
+        ]}}))
+
+        self.assertEqual(self.interface.list_graphs(), ["http://example.org/a", "http://example.org/b"])
+
+    def test_requests_reuse_one_client(self):
+        """Test that consecutive queries go through the same pooled client."""
+        client = self.interface._http
+        self.responses.append(httpx.Response(200, json={"boolean": False}))
+        self.responses.append(httpx.Response(200, json={"boolean": True}))
+
+        self.interface.ask("ASK { ?s ?p ?o }")
+        self.interface.ask("ASK { ?s ?p ?o }")
+
+        self.assertIs(self.interface._http, client)
+        self.assertEqual(len(self.requests), 2)
+
+
+
+class TestAsyncSparqlQueryInterface(unittest.IsolatedAsyncioTestCase):
+    """Test cases for AsyncSparqlQueryInterface."""
+
+    async def asyncSetUp(self):
+        """Set up an interface that answers each query with its own text."""
+        self.interface = AsyncSparqlQueryInterface(endpoint_url="http://localhost:3030/test/query")
+        await self.interface.aclose()
+        self.interface._http = httpx.AsyncClient(transport=httpx.MockTransport(self._handle))
+
+    async def asyncTearDown(self):
+        await self.interface.aclose()
+
+    def _handle(self, request):
+        if request.headers["content-type"] == "application/sparql-update":
+            return httpx.Response(204)
+        return httpx.Response(200, json={"results": {"bindings": [
+            {"q": {"type": "literal", "value": request.read().decode("utf-8")}},
+        ]}})
+
+    async def test_select_many_preserves_query_order(self):
+        """Test that select_many returns one result list per query, in order."""
+        queries = [f"SELECT ?q WHERE {{ }} # {i}" for i in range(5)]
+
+        results = await self.interface.select_many(queries)
+
+        self.assertEqual(results, [[{"q": query}] for query in queries])
+
+    async def test_update(self):
+        """Test that updates complete against the update endpoint."""
+        await self.interface.update("CLEAR DEFAULT")
+
+    async def test_select_without_endpoint_raises(self):
+        """Test that querying without an endpoint raises ValueError."""
+        interface = AsyncSparqlQueryInterface()
+        try:
+            with self.assertRaises(ValueError):
+                await interface.select("SELECT * WHERE { ?s ?p ?o }")
+        finally:
+            await interface.aclose()
+
+
+if __name__ == '__main__':
+    unittest.main()
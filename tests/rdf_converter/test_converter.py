@@ -7,7 +7,7 @@ from rdflib import Graph, Literal, Namespace, URIRef, XSD, RDF, RDFS
 from rdflib.namespace import SDO as SCHEMA
 
 from knowledgebase_processor.models.kb_entities import KbPerson, KbTodoItem, KbBaseEntity
-from knowledgebase_processor.rdf_converter.converter import RdfConverter, KB
+from knowledgebase_processor.rdf_converter.converter import RdfConverter, KB, _get_compiled, _get_plan
 
 
 # Define a dummy entity for testing generic metadata-driven conversion
@@ -282,6 +282,14 @@ class TestRdfConverter(unittest.TestCase):
                                Literal("Appended URI Person", datatype=XSD.string),
                                "Person should have correct full name")
 
+    def test_kb_id_resolved_per_base_uri(self):
+        person = KbPerson(kb_id="/person/789", full_name="Two Bases")
+        graph1 = self.converter.kb_entity_to_graph(person, base_uri_str="http://one.example/kb")
+        graph2 = self.converter.kb_entity_to_graph(person, base_uri_str="http://two.example/kb/")
+
+        self.assertTripleExists(graph1, URIRef("http://one.example/kb/person/789"), RDF.type, KB.Person)
+        self.assertTripleExists(graph2, URIRef("http://two.example/kb/person/789"), RDF.type, KB.Person)
+
     def test_kb_person_serialization_all_fields(self):
         person = KbPerson(
             kb_id="person_001",
@@ -486,5 +494,97 @@ class TestRdfConverter(unittest.TestCase):
                                    msg="RDFS.label should not be present for minimal KbDummyEntity due to its specific fallback config.")
 
 
+    def test_rdf_plan_is_cached_per_class(self):
+        plan = _get_plan(KbDummyEntity)
+        self.assertIs(_get_plan(KbDummyEntity), plan)
+        self.assertEqual(set(plan.rdf_types), {KB.Entity, KB.DummyType})
+        self.assertEqual(plan.fallback_fields, ("dummy_description", "label"))
+
+        # Converting several instances reuses the plan and keeps per-entity values apart
+        graph1 = self.converter.kb_entity_to_graph(KbDummyEntity(kb_id="d1", dummy_count=1), base_uri_str=self.base_uri)
+        graph2 = self.converter.kb_entity_to_graph(KbDummyEntity(kb_id="d2", dummy_count=2), base_uri_str=self.base_uri)
+        self.assertIs(_get_plan(KbDummyEntity), plan)
+        self.assertTripleExists(graph1, URIRef(self.base_uri + "d1"), KB.customValue, Literal(1, datatype=XSD.integer))
+        self.assertTripleExists(graph2, URIRef(self.base_uri + "d2"), KB.customValue, Literal(2, datatype=XSD.integer))
+
+
+    def test_compiled_converter_is_cached_per_class(self):
+        add_entity = _get_compiled(KbDummyEntity)
+        self.assertIs(_get_compiled(KbDummyEntity), add_entity)
+
+        # A blank explicit label does not count, so the fallback label applies
+        entity = KbDummyEntity(kb_id="d_blank", label="  ", dummy_description="Fallback")
+        graph = Graph()
+        add_entity(graph, entity, self.base_uri)
+        entity_uri = URIRef(self.base_uri + "d_blank")
+        self.assertTripleExists(graph, entity_uri, RDFS.label, Literal("Fallback", datatype=XSD.string))
+        self.assertEqual(set(graph), set(self.converter.kb_entity_to_graph(entity, base_uri_str=self.base_uri)))
+
+    def test_converted_graphs_have_own_prefix_bindings(self):
+        graph1 = self.converter.kb_entity_to_graph(KbPerson(kb_id="p1", full_name="A"), base_uri_str=self.base_uri)
+        graph2 = self.converter.kb_entity_to_graph(KbPerson(kb_id="p2", full_name="B"), base_uri_str=self.base_uri)
+        self.assertIsNot(graph1.namespace_manager, graph2.namespace_manager)
+        self.assertEqual(dict(graph1.namespaces())["kb"], URIRef(str(KB)))
+        self.assertIn("kb:Person", graph1.serialize(format="turtle"))
+
+        graph1.bind("ex", "http://example.org/ns#")
+        self.assertIn("ex", dict(graph1.namespaces()))
+        self.assertNotIn("ex", dict(graph2.namespaces()))
+        self.assertNotIn("ex", dict(self.converter.kb_entity_to_graph(
+            KbPerson(kb_id="p3", full_name="C"), base_uri_str=self.base_uri).namespaces()))
+
+
+    def test_kb_entities_to_graph_matches_per_entity_conversion(self):
+        entities = [
+            KbPerson(kb_id="person_bulk_1", full_name="Bulk One", creation_timestamp=self.now, last_modified_timestamp=self.now),
+            KbTodoItem(kb_id="todo_bulk_1", description="Bulk todo", assigned_to_uris=["person_bulk_1"],
+                       creation_timestamp=self.now, last_modified_timestamp=self.now),
+        ]
+        expected = Graph()
+        for entity in entities:
+            expected += self.converter.kb_entity_to_graph(entity, base_uri_str=self.base_uri)
+
+        target = Graph()
+        graph = self.converter.kb_entities_to_graph(entities, graph=target, base_uri_str=self.base_uri)
+
+        self.assertIs(graph, target)
+        self.assertEqual(set(graph), set(expected))
+
+
+    def test_kb_entity_to_ntriples_matches_graph(self):
+        entities = [
+            KbPerson(kb_id="person_nt_1", full_name='Quote " and \\ backslash\nnewline',
+                     aliases=["A", "B"], creation_timestamp=self.now, last_modified_timestamp=self.now),
+            KbTodoItem(kb_id="todo_nt_1", description="Todo", is_completed=True,
+                       due_date=datetime(2024, 12, 31, 23, 59, 59, tzinfo=timezone.utc),
+                       assigned_to_uris=["person_nt_1", "http://example.org/kb/person_nt_2"],
+                       creation_timestamp=self.now, last_modified_timestamp=self.now),
+            KbDummyEntity(kb_id="dummy_nt_1", dummy_count=7, dummy_see_also=["relative_dummy_id"]),
+        ]
+        for entity in entities:
+            ntriples = self.converter.kb_entity_to_ntriples(entity, base_uri_str=self.base_uri)
+            self.assertTrue(ntriples.endswith(" .\n"))
+            parsed = Graph().parse(data=ntriples, format="nt")
+            expected = self.converter.kb_entity_to_graph(entity, base_uri_str=self.base_uri)
+            self.assertEqual(set(parsed), set(expected), f"N-Triples mismatch for {entity.kb_id}")
+
+
+    def test_kb_entities_to_ntriples_matches_graph(self):
+        entities = [
+            KbPerson(kb_id="person_nt_bulk", full_name="Bulk", creation_timestamp=self.now, last_modified_timestamp=self.now),
+            KbTodoItem(kb_id="todo_nt_bulk", description="Bulk todo", assigned_to_uris=["person_nt_bulk"],
+                       creation_timestamp=self.now, last_modified_timestamp=self.now),
+            KbPerson(kb_id="person_nt_bulk_2", full_name="Bulk Two", creation_timestamp=self.now, last_modified_timestamp=self.now),
+        ]
+
+        ntriples = self.converter.kb_entities_to_ntriples(entities, base_uri_str=self.base_uri)
+
+        self.assertEqual(
+            ntriples,
+            "".join(self.converter.kb_entity_to_ntriples(e, base_uri_str=self.base_uri) for e in entities),
+        )
+        expected = self.converter.kb_entities_to_graph(entities, base_uri_str=self.base_uri)
+        self.assertEqual(set(Graph().parse(data=ntriples, format="nt")), set(expected))
+
 if __name__ == '__main__':
     unittest.main()
\ No newline at end of file
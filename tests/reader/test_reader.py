@@ -0,0 +1,221 @@
+"""Unit tests for Reader."""
+
+import mmap
+import os
+import re
+import shutil
+import tempfile
+import unittest
+from datetime import datetime, timezone
+from pathlib import Path
+from unittest.mock import patch
+
+import yaml
+
+from knowledgebase_processor.reader.reader import Reader
+
+
+class TestReader(unittest.TestCase):
+    """Test cases for Reader."""
+
+    def setUp(self):
+        """Create a small knowledge base on disk."""
+        self.temp_dir = tempfile.mkdtemp()
+        self.base_path = Path(self.temp_dir)
+        (self.base_path / "notes" / "deep").mkdir(parents=True)
+        (self.base_path / "root.md").write_text("# Root\n", encoding="utf-8")
+        (self.base_path / "notes" / "first-note.md").write_text(
+            "---\ntitle: First\ntags: [a, b]\n---\nBody\n", encoding="utf-8"
+        )
+        (self.base_path / "notes" / "deep" / "README.md").write_text("# Deep Heading\n", encoding="utf-8")
+        (self.base_path / "notes" / "ignored.txt").write_text("not markdown", encoding="utf-8")
+        self.reader = Reader(self.temp_dir)
+
+    def tearDown(self):
+        shutil.rmtree(self.temp_dir)
+
+    def test_list_files_matches_glob(self):
+        """Test that the default pattern finds the same files as pathlib glob."""
+        expected = sorted(self.base_path.glob("**/*.md"))
+
+        self.assertEqual(sorted(self.reader.list_files()), expected)
+        self.assertEqual(len(expected), 3)
+
+    def test_list_files_does_not_follow_directory_symlinks(self):
+        """Test that symlinked directories are skipped, as with pathlib's '**'."""
+        os.symlink(self.base_path / "notes", self.base_path / "linked")
+
+        self.assertEqual(sorted(self.reader.list_files()), sorted(self.base_path.glob("**/*.md")))
+        self.assertEqual(len(self.reader.list_files()), 3)
+
+    def test_list_files_with_custom_pattern(self):
+        """Test that other patterns are still matched with glob."""
+        self.assertEqual(self.reader.list_files("notes/*.txt"), [self.base_path / "notes" / "ignored.txt"])
+
+    def test_list_files_suffix_patterns_match_glob(self):
+        """Test that suffix patterns walked with scandir find the same files as glob."""
+        for pattern in ("*.md", "notes/**/*.md", "notes/*.md", "**/*.txt", "missing/**/*.md", "**/first-*.md"):
+            expected = sorted(p for p in self.base_path.glob(pattern) if p.is_file())
+            self.assertEqual(sorted(self.reader.list_files(pattern)), expected, pattern)
+
+    def test_read_all_yields_documents(self):
+        """Test that read_all reads every Markdown file with relative paths."""
+        documents = {doc.path: doc for doc in self.reader.read_all()}
+
+        self.assertEqual(
+            set(documents),
+            {"root.md", os.path.join("notes", "first-note.md"), os.path.join("notes", "deep", "README.md")},
+        )
+        first = documents[os.path.join("notes", "first-note.md")]
+        self.assertEqual(first.title, "First")
+        self.assertEqual(first.metadata.frontmatter.tags, ["a", "b"])
+        self.assertEqual(first.metadata.tags, {"a", "b"})
+        self.assertEqual(documents["root.md"].metadata.tags, set())
+        self.assertEqual(documents[os.path.join("notes", "deep", "README.md")].title, "Deep Heading")
+
+    def test_read_content_matches_text_mode_read(self):
+        """Test that read_content returns what a text-mode read would."""
+        samples = {
+            "empty.md": b"",
+            "unicode.md": "caf\u00e9 \u2014 \U0001f600\n".encode("utf-8"),
+            "crlf.md": b"line one\r\nline two\rline three\n",
+        }
+        for name, data in samples.items():
+            path = self.base_path / name
+            path.write_bytes(data)
+            with open(path, "r", encoding="utf-8") as f:
+                expected = f.read()
+            self.assertEqual(self.reader.read_content(str(path)), expected, name)
+
+    def test_read_content_large_file_uses_mmap(self):
+        """Test that files above the threshold are read through mmap."""
+        path = self.base_path / "large.md"
+        path.write_text("x" * 100 + "\n", encoding="utf-8")
+
+        with patch("knowledgebase_processor.reader.reader._MMAP_THRESHOLD", 10), \
+                patch("knowledgebase_processor.reader.reader.mmap.mmap", wraps=mmap.mmap) as mmap_mock:
+            content = self.reader.read_content(str(path))
+
+        self.assertEqual(content, "x" * 100 + "\n")
+        mmap_mock.assert_called_once()
+
+    def test_read_all_parallel_preserves_order(self):
+        """Test that read_all_parallel yields the same documents in the same order as read_all."""
+        for i in range(20):
+            (self.base_path / f"note_{i:02d}.md").write_text(f"# Note {i}\n", encoding="utf-8")
+
+        expected = [(doc.path, doc.content) for doc in self.reader.read_all()]
+        for prefetch in (1, 4, 64):
+            actual = [(doc.path, doc.content) for doc in self.reader.read_all_parallel(prefetch=prefetch)]
+            self.assertEqual(actual, expected)
+
+    def test_read_all_with_workers_matches_serial_read(self):
+        """Test that read_all with worker threads yields the same documents in order."""
+        expected = [(doc.path, doc.content) for doc in self.reader.read_all()]
+
+        actual = [(doc.path, doc.content) for doc in self.reader.read_all(max_workers=4, prefetch=2)]
+
+        self.assertEqual(actual, expected)
+
+    def test_iter_documents_yields_paths_with_documents(self):
+        """Test that iter_documents pairs each listed path with its document."""
+        for max_workers in (1, 4):
+            pairs = list(self.reader.iter_documents(max_workers=max_workers))
+            self.assertEqual([path for path, _ in pairs], self.reader.list_files())
+            for path, document in pairs:
+                self.assertEqual(document.path, str(path.relative_to(self.base_path)))
+
+    @unittest.skipUnless(hasattr(os, "posix_fadvise"), "posix_fadvise not available")
+    def test_serial_read_requests_readahead(self):
+        """Test that serial reads ask the kernel to read each file ahead only when requested."""
+        with patch("knowledgebase_processor.reader.reader.os.posix_fadvise") as fadvise:
+            self.assertEqual(len(list(self.reader.read_all())), len(self.reader.list_files()))
+            fadvise.assert_not_called()
+
+            documents = list(self.reader.read_all(readahead=True))
+
+        self.assertEqual(fadvise.call_count, len(documents))
+        self.assertEqual({call.args[3] for call in fadvise.call_args_list}, {os.POSIX_FADV_WILLNEED})
+
+    def test_read_all_parallel_stops_early(self):
+        """Test that the caller can stop consuming before all files are read."""
+        documents = self.reader.read_all_parallel(prefetch=2)
+        first = next(documents)
+        documents.close()
+
+        self.assertEqual(first.path, next(self.reader.read_all()).path)
+
+    def test_read_file_relative_path_matches_relative_to(self):
+        """Test that document paths are relative to the base path."""
+        for path in self.reader.list_files():
+            document = self.reader.read_file(path)
+            self.assertEqual(document.path, str(path.relative_to(self.base_path)))
+
+        outside = Path(tempfile.mkdtemp())
+        try:
+            (outside / "other.md").write_text("# Other\n", encoding="utf-8")
+            with self.assertRaises(ValueError):
+                self.reader.read_file(outside / "other.md")
+        finally:
+            shutil.rmtree(outside)
+
+    def test_read_file_missing_raises(self):
+        """Test that reading a missing file raises FileNotFoundError."""
+        with self.assertRaises(FileNotFoundError):
+            self.reader.read_file(self.base_path / "missing.md")
+
+    def test_read_all_does_not_stat_listed_paths(self):
+        """Test that bulk reads rely on the directory walk instead of stat()ing each file."""
+        with patch("knowledgebase_processor.reader.reader.os.stat", wraps=os.stat) as stat_mock, \
+                patch.object(Path, "stat", autospec=True, side_effect=Path.stat) as path_stat_mock:
+            documents = list(self.reader.read_all())
+
+        self.assertEqual(len(documents), 3)
+        stat_mock.assert_not_called()
+        path_stat_mock.assert_not_called()
+
+    def test_heading_title_skips_frontmatter(self):
+        """Test that the heading fallback title ignores YAML comments in frontmatter."""
+        path = self.base_path / "index.md"
+        path.write_text("---\n# a YAML comment\ntags: [a]\n---\n# Real Title\n", encoding="utf-8")
+
+        document = self.reader.read_file(path)
+
+        self.assertEqual(document.title, "Real Title")
+        self.assertEqual(document.metadata.tags, {"a"})
+
+    def test_frontmatter_date_with_utc_suffix(self):
+        """Test that frontmatter dates ending in "Z" are parsed as UTC."""
+        path = self.base_path / "dated.md"
+        path.write_text("---\ndate: '2024-01-02T03:04:05Z'\n---\nBody\n", encoding="utf-8")
+
+        document = self.reader.read_file(path)
+
+        self.assertEqual(document.metadata.frontmatter.date, datetime(2024, 1, 2, 3, 4, 5, tzinfo=timezone.utc))
+
+    def test_parse_frontmatter_matches_delimiter_regex(self):
+        """Test that frontmatter splitting matches the "---" delimiter regex."""
+        pattern = re.compile(r'^---\s*\n(.*?)\n---\s*\n', re.DOTALL)
+        contents = [
+            "---\ntitle: A\n---\nBody",
+            "---  \n\ntitle: A\n---\n\n\nBody",
+            "---\n---\nBody",
+            "---\n\n---\nBody",
+            '---\ntitle: "A\n---x"\n---\nBody',
+            "---\ntitle: A\n---",
+            "---title: A\n---\nBody",
+            "# No frontmatter\n---\nx: 1\n---\n",
+            "",
+        ]
+        for content in contents:
+            match = pattern.match(content)
+            frontmatter, body = self.reader.parse_frontmatter(content)
+            if match:
+                self.assertEqual(body, content[match.end():], repr(content))
+                self.assertEqual(frontmatter, yaml.safe_load(match.group(1)) or {}, repr(content))
+            else:
+                self.assertIsNone(frontmatter, repr(content))
+                self.assertEqual(body, content)
+
+if __name__ == '__main__':
+    unittest.main()
@@ -245,10 +245,11 @@ class TestEntityService(unittest.TestCase):
         
         entity_service.transform_to_kb_entity(extracted_entity, "test.md")
         
-        # Should log info about processing the entity
-        mock_logger.info.assert_called_once_with(
-            "Processing entity: Test Person of type PERSON"
+        # Should log debug about processing the entity, formatted lazily
+        mock_logger.debug.assert_called_once_with(
+            "Processing entity: %s of type %s", "Test Person", "PERSON"
         )
+        mock_logger.info.assert_not_called()
 
     @patch('knowledgebase_processor.services.entity_service.get_logger')
     def test_logging_for_unsupported_entity(self, mock_get_logger):
@@ -268,8 +269,8 @@ class TestEntityService(unittest.TestCase):
         
         self.assertIsNone(result)
         # Should log debug about unhandled entity type
-        mock_logger.debug.assert_called_once_with(
-            "Unhandled entity type: MONEY for text: '123.45'"
+        mock_logger.debug.assert_called_with(
+            "Unhandled entity type: %s for text: '%s'", "MONEY", "123.45"
         )
 
     def test_kb_id_uniqueness(self):
@@ -286,5 +287,61 @@ class TestEntityService(unittest.TestCase):
         self.assertIn("john_doe", kb_id2)
 
 
+    def test_generate_kb_id_is_cached(self):
+        """Test that repeated KB ID lookups are served from the cache."""
+        with patch.object(self.entity_service.id_generator, "generate_person_id",
+                          wraps=self.entity_service.id_generator.generate_person_id) as generate:
+            entity_service = self.entity_service
+            kb_id1 = entity_service.generate_kb_id("Person", "Jane Roe")
+            kb_id2 = entity_service.generate_kb_id("Person", "Jane Roe")
+
+        self.assertEqual(kb_id1, kb_id2)
+        generate.assert_called_once_with("Jane Roe")
+        self.assertNotEqual(entity_service.generate_kb_id("Organization", "Jane Roe"), kb_id1)
+
+    def test_document_uri_generated_once_per_document(self):
+        """Test that entities of the same document reuse its document URI."""
+        entities = [
+            ExtractedEntity(text="Jane Roe", label="PERSON", start_char=0, end_char=8),
+            ExtractedEntity(text="Acme", label="ORG", start_char=10, end_char=14),
+        ]
+
+        kb_entities = [
+            self.entity_service.transform_to_kb_entity(entity, "notes/meeting.md")
+            for entity in entities
+        ]
+
+        self.assertEqual(kb_entities[0].source_document_uri, kb_entities[1].source_document_uri)
+        self.assertEqual(
+            kb_entities[0].source_document_uri,
+            self.entity_service.id_generator.generate_document_id("notes/meeting.md"),
+        )
+        self.assertEqual(self.entity_service._cached_document_id.cache_info().misses, 1)
+
+    def test_transform_batch_matches_single_transforms(self):
+        """Test that batch transformation matches transforming entities one by one."""
+        entities = [
+            ExtractedEntity(text="Jane Roe", label="PERSON", start_char=0, end_char=8),
+            ExtractedEntity(text="yesterday", label="TIME", start_char=9, end_char=18),
+            ExtractedEntity(text="Acme", label="org", start_char=20, end_char=24),
+            ExtractedEntity(text="Paris", label="GPE", start_char=30, end_char=35),
+            ExtractedEntity(text="2024-01-01", label="DATE", start_char=40, end_char=50),
+        ]
+
+        batch = self.entity_service.transform_batch(entities, "notes/meeting.md")
+        single = [
+            self.entity_service.transform_to_kb_entity(entity, "notes/meeting.md")
+            for entity in entities
+        ]
+
+        expected = [kb_entity for kb_entity in single if kb_entity is not None]
+        self.assertEqual(len(batch), 4)
+        for batch_entity, single_entity in zip(batch, expected):
+            self.assertIs(type(batch_entity), type(single_entity))
+            self.assertEqual(
+                batch_entity.model_dump(exclude={"creation_timestamp", "last_modified_timestamp"}),
+                single_entity.model_dump(exclude={"creation_timestamp", "last_modified_timestamp"}),
+            )
+
 if __name__ == '__main__':
     unittest.main()
\ No newline at end of file
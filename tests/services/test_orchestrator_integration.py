@@ -1,10 +1,18 @@
 """Integration tests for the orchestrator service."""
 
+import copy
+import os
+import subprocess
+import sys
+
 import pytest
 import tempfile
 import shutil
 from pathlib import Path
 from datetime import datetime
+from unittest.mock import patch
+
+import yaml
 
 from knowledgebase_processor.services.orchestrator import (
     OrchestratorService, 
@@ -178,6 +186,46 @@ Historical project information.
         # Should be able to count documents in subdirectories too
         total_docs = orchestrator.count_documents()
         assert total_docs >= 3  # At least the main directory files
+
+    def test_document_counting_matches_rglob(self, temp_project_dir):
+        """Test that counting matches rglob and counts overlapping patterns once."""
+        orchestrator = OrchestratorService(temp_project_dir)
+        orchestrator.initialize_project(temp_project_dir, "Test Project")
+        (temp_project_dir / "archive" / "deep").mkdir()
+        (temp_project_dir / "archive" / "deep" / "nested.md").write_text("# Nested\n")
+        (temp_project_dir / "folder.md").mkdir()
+        
+        (temp_project_dir / "archive" / "deep" / "doc1.md").write_text("# Copy\n")
+        
+        (temp_project_dir / "other" / "archive").mkdir(parents=True)
+        (temp_project_dir / "other" / "archive" / "moved.md").write_text("# Moved\n")
+        (temp_project_dir / "archive" / "deep" / "archive").mkdir()
+        (temp_project_dir / "archive" / "deep" / "archive" / "twice.md").write_text("# Twice\n")
+        
+        for patterns in (["*.md"], ["**/*.txt"], ["archive/*.md"], ["archive/**/*.md"],
+                         ["archive/deep/*.md"], ["other/archive/*.md"], ["doc?.md"], ["doc1.md"],
+                         ["folder.md"], ["missing.md"], ["**/*.md", "*.md", "doc1.md"],
+                         ["archive/*.md", "**/*.txt", "doc?.md"], ["*.[mt][dx]*"], ["*"],
+                         ["archive/*/*.md"]):
+            expected = {
+                str(path) for pattern in patterns
+                for path in temp_project_dir.rglob(pattern) if path.is_file()
+            }
+            assert orchestrator.count_documents(patterns) == len(expected)
+            assert set(orchestrator._enumerate_files(patterns)) == expected
+    
+    def test_parallel_walk_matches_sequential_walk(self, temp_project_dir):
+        """Test that walking top-level directories in threads lists the same entries in the same order."""
+        from knowledgebase_processor.services.orchestrator import _iter_files_below, _iter_files_below_parallel
+        
+        for directory in ("a/b", "a/c", "d", "e/f/g"):
+            (temp_project_dir / directory).mkdir(parents=True, exist_ok=True)
+            (temp_project_dir / directory / "note.md").write_text("# Note")
+        root = str(temp_project_dir)
+        
+        expected = list(_iter_files_below(root))
+        assert list(_iter_files_below_parallel(root)) == expected
+        assert list(_iter_files_below_parallel(root, max_workers=1)) == expected
     
     def test_document_processing(self, temp_project_dir):
         """Test document processing integration."""
@@ -223,6 +271,37 @@ Historical project information.
             assert hasattr(result, 'snippet')
             assert hasattr(result, 'score')
     
+    def test_api_is_created_once_until_init(self, temp_project_dir):
+        """Test that the API instance is reused and replaced when a project is initialized."""
+        orchestrator = OrchestratorService(temp_project_dir)
+        orchestrator.initialize_project(temp_project_dir, "Test Project")
+        
+        with patch("knowledgebase_processor.api.KnowledgeBaseAPI", side_effect=lambda config: object()) as api_class:
+            api = orchestrator.api
+            assert orchestrator.api is api
+            assert api_class.call_count == 1
+            
+            orchestrator.initialize_project(temp_project_dir, "Test Project", force=True)
+            assert orchestrator.api is not api
+            assert api_class.call_count == 2
+    
+    def test_search_consumes_only_limit_results(self, temp_project_dir):
+        """Test that search stops reading results once the limit is reached."""
+        orchestrator = OrchestratorService(temp_project_dir)
+        orchestrator.initialize_project(temp_project_dir, "Test Project")
+        produced = []
+        
+        def results(query, search_type):
+            for i in range(100):
+                produced.append(i)
+                yield f"match {i}"
+        
+        with patch("knowledgebase_processor.api.KnowledgeBaseAPI.query", side_effect=results):
+            search_results = orchestrator.search("match", limit=3)
+        
+        assert [r.snippet for r in search_results] == ["match 0", "match 1", "match 2"]
+        assert produced == [0, 1, 2]
+    
     def test_project_stats(self, temp_project_dir):
         """Test project statistics gathering."""
         orchestrator = OrchestratorService(temp_project_dir)
@@ -345,4 +424,157 @@ Historical project information.
         config3 = orchestrator.get_project_config()
         
         # Should be different object (cache cleared)
-        assert config1 is not config3
\ No newline at end of file
+        assert config1 is not config3
+    
+    def test_config_reads_reuse_parse_until_file_changes(self, temp_project_dir):
+        """Test that config lookups parse the file once and notice external edits."""
+        orchestrator = OrchestratorService(temp_project_dir)
+        orchestrator.initialize_project(temp_project_dir, "Test Project")
+        config_file = temp_project_dir / ".kbp" / "config.yaml"
+        
+        with patch("knowledgebase_processor.services.orchestrator.yaml.load",
+                   wraps=yaml.load) as yaml_load:
+            assert orchestrator.get_config_value("project_name") == "Test Project"
+            assert orchestrator.get_config_value("version") == "2.0.0"
+            assert orchestrator.get_project_config().project_name == "Test Project"
+            assert yaml_load.call_count == 0
+            
+            config_file.write_text(config_file.read_text().replace("Test Project", "Edited Project!"))
+            
+            assert orchestrator.get_config_value("project_name") == "Edited Project!"
+            assert orchestrator.get_project_config().project_name == "Edited Project!"
+            assert yaml_load.call_count == 1
+
+
+    def test_config_writes_reuse_parse(self, temp_project_dir):
+        """Test that config writes start from the cached parse without altering it."""
+        orchestrator = OrchestratorService(temp_project_dir)
+        orchestrator.initialize_project(temp_project_dir, "Test Project")
+        
+        with patch("knowledgebase_processor.services.orchestrator.yaml.load",
+                   wraps=yaml.load) as yaml_load:
+            for batch_size in (10, 20, 30):
+                assert orchestrator.set_config_value("processing.batch_size", batch_size) is True
+            assert orchestrator.update_config(project_name="Renamed") is True
+            assert yaml_load.call_count == 0
+        
+        before = copy.deepcopy(orchestrator._config_data[2])
+        assert orchestrator.set_config_value("project_name.nested", 1) is False
+        assert orchestrator._config_data[2] == before
+        
+        reloaded = OrchestratorService(temp_project_dir)
+        assert reloaded.get_config_value("processing.batch_size") == 30
+        assert reloaded.get_config_value("project_name") == "Renamed"
+
+    
+    def test_kbp_directory_lookup_is_remembered(self, temp_project_dir):
+        """Test that the .kbp search runs once per working directory and is reset by init."""
+        orchestrator = OrchestratorService(temp_project_dir)
+        assert orchestrator.is_initialized() is False
+        
+        orchestrator.initialize_project(temp_project_dir, "Test Project")
+        assert orchestrator.is_initialized() is True
+        
+        with patch.object(Path, "exists", autospec=True, side_effect=Path.exists) as exists:
+            orchestrator.is_initialized()
+            orchestrator.get_config_value("project_name")
+            assert not any(call.args[0].name == ".kbp" for call in exists.call_args_list)
+        
+        orchestrator.working_directory = temp_project_dir / "archive"
+        assert orchestrator._find_kbp_directory() == temp_project_dir / ".kbp"
+
+    
+    def test_file_listing_is_shared_between_operations(self, temp_project_dir):
+        """Test that operations in quick succession reuse one file listing."""
+        from knowledgebase_processor.services import orchestrator as orchestrator_module
+        
+        orchestrator = OrchestratorService(temp_project_dir)
+        orchestrator.initialize_project(temp_project_dir, "Test Project")
+        
+        with patch.object(orchestrator_module, "_iter_project_files",
+                          wraps=orchestrator_module._iter_project_files) as iter_files:
+            total = orchestrator.count_documents()
+            assert orchestrator.get_project_stats().total_documents == total
+            assert iter_files.call_count == 1
+            
+            orchestrator.count_documents(["**/*.md"])
+            assert iter_files.call_count == 2
+            
+            with patch.object(orchestrator_module, "_FILE_LIST_TTL", 0):
+                (temp_project_dir / "new.md").write_text("# New\n")
+                assert orchestrator.count_documents() == total + 1
+            assert iter_files.call_count == 3
+
+    
+    def test_project_stats_database_size(self, temp_project_dir):
+        """Test that the database size and last scan time come from the cache directory."""
+        orchestrator = OrchestratorService(temp_project_dir)
+        orchestrator.initialize_project(temp_project_dir, "Test Project")
+        cache_dir = temp_project_dir / ".kbp" / "cache"
+        (cache_dir / "knowledgebase.db").write_bytes(b"x" * 100)
+        (cache_dir / "nested").mkdir()
+        (cache_dir / "nested" / "extra.bin").write_bytes(b"y" * 28)
+        
+        stats = orchestrator.get_project_stats()
+        
+        assert stats.database_size == 128
+        assert stats.last_scan == datetime.fromtimestamp((cache_dir / "knowledgebase.db").stat().st_mtime)
+        
+        shutil.rmtree(cache_dir)
+        stats = orchestrator.get_project_stats()
+        
+        assert stats.database_size == 0
+        assert stats.last_scan is None
+
+    
+    def test_unchanged_config_values_are_not_rewritten(self, temp_project_dir):
+        """Test that setting a config value to its current value skips the write."""
+        orchestrator = OrchestratorService(temp_project_dir)
+        orchestrator.initialize_project(temp_project_dir, "Test Project")
+        orchestrator.set_config_value("nested.count", 1)
+        
+        with patch.object(orchestrator, "_write_config_dict",
+                          wraps=orchestrator._write_config_dict) as write:
+            assert orchestrator.set_config_value("project_name", "Test Project") is True
+            assert orchestrator.set_config_value("nested.count", 1) is True
+            assert orchestrator.update_config(project_name="Test Project", watch_enabled=False) is True
+            write.assert_not_called()
+            
+            assert orchestrator.set_config_value("nested.count", True) is True
+            assert orchestrator.update_config(watch_enabled=True) is True
+            assert write.call_count == 2
+        
+        assert orchestrator.get_config_value("nested.count") is True
+        assert orchestrator.get_project_config().watch_enabled is True
+
+    
+    def test_config_json_copy_is_used_by_new_instances(self, temp_project_dir):
+        """Test that a new service loads the JSON copy of an unchanged config.yaml."""
+        orchestrator = OrchestratorService(temp_project_dir)
+        orchestrator.initialize_project(temp_project_dir, "Test Project")
+        config_file = temp_project_dir / ".kbp" / "config.yaml"
+        assert (temp_project_dir / ".kbp" / "config.cache.json").exists()
+        
+        with patch("knowledgebase_processor.services.orchestrator.yaml.load",
+                   wraps=yaml.load) as yaml_load:
+            assert OrchestratorService(temp_project_dir).get_config_value("project_name") == "Test Project"
+            assert yaml_load.call_count == 0
+            
+            config_file.write_text(config_file.read_text().replace("Test Project", "Edited Project!"))
+            
+            assert OrchestratorService(temp_project_dir).get_config_value("project_name") == "Edited Project!"
+            assert OrchestratorService(temp_project_dir).get_config_value("project_name") == "Edited Project!"
+            assert yaml_load.call_count == 1
+
+    
+    def test_orchestrator_import_does_not_load_processing_stack(self):
+        """Test that importing the orchestrator leaves the API and RDF modules unloaded."""
+        code = (
+            "import sys\n"
+            "import knowledgebase_processor.services.orchestrator\n"
+            "print(sorted(m for m in ('knowledgebase_processor.api', 'rdflib') if m in sys.modules))\n"
+        )
+        env = dict(os.environ, PYTHONPATH=os.pathsep.join(sys.path))
+        result = subprocess.run([sys.executable, "-c", code], capture_output=True, text=True, env=env, check=True)
+        
+        assert result.stdout.strip() == "[]"
@@ -133,6 +133,7 @@ class TestProcessingService(unittest.TestCase):
         
         # Verify entity analysis was enabled automatically
         self.assertTrue(mock_config.analyze_entities)
+        self.mock_processor.enable_entity_analysis.assert_called_once_with()
         self.assertEqual(result, 0)
 
     def test_process_documents_entity_analysis_already_enabled(self):
@@ -159,8 +160,142 @@ class TestProcessingService(unittest.TestCase):
         
         # Verify entity analysis remains enabled
         self.assertTrue(mock_config.analyze_entities)
+        self.mock_processor.enable_entity_analysis.assert_not_called()
         self.assertEqual(result, 0)
 
+    @patch('knowledgebase_processor.services.processing_service.SparqlService')
+    def test_process_and_load_loads_file_groups_concurrently(self, mock_sparql_service_class):
+        """Test that RDF files are loaded in batched groups through a worker pool and failures are reported."""
+        import threading
+
+        mock_sparql_service = mock_sparql_service_class.return_value
+        barrier = threading.Barrier(2, timeout=5)
+
+        def load_rdf_files_batched(file_paths, **kwargs):
+            # Passes only when both groups are loading at the same time
+            barrier.wait()
+            return [(str(path), "endpoint rejected update") for path in file_paths if path.name == "bad.nt"]
+
+        mock_sparql_service.load_rdf_files_batched.side_effect = load_rdf_files_batched
+        self.processing_service.config = Mock(sparql_load_workers=2)
+
+        with tempfile.TemporaryDirectory() as temp_dir:
+            for name in ("a.nt", "b.nt", "bad.nt"):
+                Path(temp_dir, name).write_text("")
+
+            with patch.object(self.processing_service, 'process_documents', return_value=0):
+                result = self.processing_service.process_and_load(
+                    pattern="**/*.md",
+                    knowledge_base_path=Path(temp_dir),
+                    rdf_output_dir=Path(temp_dir),
+                    graph_uri="http://example.org/graph",
+                    endpoint_url="http://localhost:3030/ds/update",
+                )
+
+        self.assertEqual(result, 1)
+        calls = mock_sparql_service.load_rdf_files_batched.call_args_list
+        self.assertEqual(len(calls), 2)
+        loaded = sorted(path.name for call in calls for path in call.kwargs['file_paths'])
+        self.assertEqual(loaded, ["a.nt", "b.nt", "bad.nt"])
+        for call in calls:
+            self.assertEqual(call.kwargs['graph_uri'], "http://example.org/graph")
+            self.assertEqual(call.kwargs['update_endpoint_url'], "http://localhost:3030/ds/update")
+
+    @patch('knowledgebase_processor.services.processing_service.SparqlService')
+    def test_process_and_load_hands_out_bounded_file_groups(self, mock_sparql_service_class):
+        """Test that workers take N-Triples files in groups of at most 50 and share one service."""
+        mock_sparql_service = mock_sparql_service_class.return_value
+        mock_sparql_service.load_rdf_files_batched.return_value = []
+        self.processing_service.config = Mock(sparql_load_workers=2)
+
+        with tempfile.TemporaryDirectory() as temp_dir:
+            for i in range(120):
+                Path(temp_dir, f"doc{i}.nt").write_text("")
+            # Left over from an earlier run writing Turtle
+            Path(temp_dir, "doc0.ttl").write_text("")
+
+            with patch.object(self.processing_service, 'process_documents', return_value=0):
+                result = self.processing_service.process_and_load(
+                    pattern="**/*.md",
+                    knowledge_base_path=Path(temp_dir),
+                    rdf_output_dir=Path(temp_dir),
+                )
+
+        self.assertEqual(result, 0)
+        self.assertEqual(mock_sparql_service_class.call_count, 1)
+        group_sizes = sorted(
+            len(call.kwargs['file_paths']) for call in mock_sparql_service.load_rdf_files_batched.call_args_list
+        )
+        self.assertEqual(group_sizes, [20, 50, 50])
+        loaded = {path.name for call in mock_sparql_service.load_rdf_files_batched.call_args_list
+                  for path in call.kwargs['file_paths']}
+        self.assertNotIn("doc0.ttl", loaded)
+        mock_sparql_service.close.assert_called_once()
+
+    @patch('knowledgebase_processor.services.processing_service.SparqlService')
+    def test_process_and_load_loads_files_while_processing(self, mock_sparql_service_class):
+        """Test that RDF files reported during processing are loaded before processing finishes."""
+        import threading
+
+        mock_sparql_service = mock_sparql_service_class.return_value
+        first_group_loaded = threading.Event()
+
+        def load_rdf_files_batched(file_paths, **kwargs):
+            first_group_loaded.set()
+            return []
+
+        mock_sparql_service.load_rdf_files_batched.side_effect = load_rdf_files_batched
+        self.processing_service.config = Mock(sparql_load_workers=2)
+
+        with tempfile.TemporaryDirectory() as temp_dir:
+            def process_documents(rdf_output_dir, on_rdf_file, **kwargs):
+                for i in range(60):
+                    rdf_file = Path(rdf_output_dir, f"doc{i}.nt")
+                    rdf_file.write_text("")
+                    on_rdf_file(rdf_file)
+                    if i == 49:
+                        # The first full group is loading while documents remain
+                        self.assertTrue(first_group_loaded.wait(timeout=5))
+                return 0
+
+            with patch.object(self.processing_service, 'process_documents', side_effect=process_documents):
+                result = self.processing_service.process_and_load(
+                    pattern="**/*.md",
+                    knowledge_base_path=Path(temp_dir),
+                    rdf_output_dir=Path(temp_dir),
+                )
+
+        self.assertEqual(result, 0)
+        groups = [call.kwargs['file_paths'] for call in mock_sparql_service.load_rdf_files_batched.call_args_list]
+        self.assertEqual([len(group) for group in groups], [50, 5, 5])
+        self.assertEqual(sorted(path.name for group in groups for path in group),
+                         sorted(f"doc{i}.nt" for i in range(60)))
+
+    @patch('knowledgebase_processor.services.processing_service.SparqlService')
+    def test_process_and_load_logs_progress_per_hundred_files(self, mock_sparql_service_class):
+        """Test that loading progress is summarized every 100 files rather than per group."""
+        mock_sparql_service_class.return_value.load_rdf_files_batched.return_value = []
+        self.processing_service.config = Mock(sparql_load_workers=1)
+
+        with tempfile.TemporaryDirectory() as temp_dir:
+            for i in range(250):
+                Path(temp_dir, f"doc{i}.nt").write_text("")
+
+            with patch.object(self.processing_service, 'process_documents', return_value=0), \
+                    self.assertLogs("knowledgebase_processor.services.processing", level="INFO") as logs:
+                result = self.processing_service.process_and_load(
+                    pattern="**/*.md",
+                    knowledge_base_path=Path(temp_dir),
+                    rdf_output_dir=Path(temp_dir),
+                )
+
+        self.assertEqual(result, 0)
+        progress = [record.getMessage() for record in logs.records if "RDF files" in record.getMessage()]
+        self.assertEqual(progress, [
+            "Processed 100/250 RDF files",
+            "Processed 200/250 RDF files",
+        ])
+
     def test_process_single_document_success(self):
         """Test single document processing - method not implemented in actual service."""
         # This test needs to be updated based on actual ProcessingService methods
@@ -82,6 +82,7 @@ class TestSparqlService(unittest.TestCase):
         self.assertIn("name | age", result)
         self.assertIn("John | 30", result)
         self.assertIn("Jane | 25", result)
+        self.assertEqual(result, "name | age\n----------\nJohn | 30\nJane | 25\n")
 
     @patch('knowledgebase_processor.services.sparql_service.SparqlQueryInterface')
     def test_execute_query_select_empty_results(self, mock_sparql_interface_class):
@@ -127,6 +128,35 @@ class TestSparqlService(unittest.TestCase):
         mock_interface.construct.assert_called_once_with(query, timeout=30)
         self.assertIn("John", result)
 
+    @patch('knowledgebase_processor.services.sparql_service.SparqlQueryInterface')
+    def test_execute_query_construct_ntriples_to_stream(self, mock_sparql_interface_class):
+        """Test writing a CONSTRUCT result to a stream as N-Triples."""
+        import io
+        from rdflib import Literal, URIRef
+
+        graph = Graph()
+        graph.add((URIRef("http://example.org/person1"), URIRef("http://example.org/name"), Literal("John")))
+        mock_interface = mock_sparql_interface_class.return_value
+        mock_interface.construct.return_value = graph
+        mock_interface.construct_to_stream.side_effect = (
+            lambda query, destination, format, timeout: graph.serialize(destination=destination, format=format, encoding="utf-8")
+        )
+        sparql_service = SparqlService(self.mock_config)
+        query = "CONSTRUCT { ?person :name ?name } WHERE { ?person :name ?name }"
+
+        self.assertEqual(
+            sparql_service.execute_query(query, format="ntriples"),
+            '<http://example.org/person1> <http://example.org/name> "John" .\n'
+        )
+
+        stream = io.BytesIO()
+        result = sparql_service.execute_query(query, format="ntriples", stream=stream)
+
+        self.assertIsNone(result)
+        self.assertEqual(stream.getvalue(), b'<http://example.org/person1> <http://example.org/name> "John" .\n')
+        mock_interface.construct_to_stream.assert_called_once_with(query, stream, format="nt", timeout=30)
+        mock_interface.construct.assert_called_once_with(query, timeout=30)
+
     @patch('knowledgebase_processor.services.sparql_service.SparqlQueryInterface')
     def test_execute_query_describe(self, mock_sparql_interface_class):
         """Test executing a DESCRIBE query."""
@@ -155,6 +185,56 @@ class TestSparqlService(unittest.TestCase):
         mock_interface.update.assert_called_once_with(query, timeout=30)
         self.assertEqual(result, "Update query executed successfully.")
 
+    @patch('knowledgebase_processor.services.sparql_service.SparqlQueryInterface')
+    def test_execute_query_type_follows_prologue_and_comments(self, mock_sparql_interface_class):
+        """Test that the query type is the first keyword after PREFIX/BASE declarations and comments."""
+        mock_interface = mock_sparql_interface_class.return_value
+        mock_interface.select.return_value = []
+        sparql_service = SparqlService(self.mock_config)
+
+        select = "PREFIX ex:<http://example.org/>\nBASE <http://example.org/>\n# INSERT nothing\nselect ?s WHERE { ?s ?p ?o }"
+        sparql_service.execute_query(select)
+        mock_interface.select.assert_called_once_with(select, timeout=30)
+        mock_interface.update.assert_not_called()
+
+        update = "# load people\nWITH <http://example.org/g> DELETE { ?s ?p ?o } WHERE { ?s ?p ?o }"
+        self.assertEqual(sparql_service.execute_query(update), "Update query executed successfully.")
+        mock_interface.update.assert_called_once_with(update, timeout=30)
+
+    @patch('knowledgebase_processor.services.sparql_service.SparqlQueryInterface')
+    def test_execute_query_caches_read_only_results(self, mock_sparql_interface_class):
+        """Test that repeated read-only queries are answered from the cache until an update."""
+        mock_interface = mock_sparql_interface_class.return_value
+        mock_interface.select.return_value = [{"name": "John"}]
+        self.mock_config.sparql_cache_ttl = 60
+        sparql_service = SparqlService(self.mock_config)
+        query = "SELECT ?name WHERE { ?s ?p ?name }"
+
+        first = sparql_service.execute_query(query)
+        self.assertEqual(sparql_service.execute_query(query), first)
+        self.assertEqual(mock_interface.select.call_count, 1)
+
+        sparql_service.execute_query(query, format="table")
+        sparql_service.execute_query(query, use_cache=False)
+        self.assertEqual(mock_interface.select.call_count, 3)
+
+        sparql_service.execute_query("INSERT DATA { <http://example.org/a> <http://example.org/b> 1 }")
+        sparql_service.execute_query(query)
+        self.assertEqual(mock_interface.select.call_count, 4)
+
+        self.mock_config.sparql_cache_ttl = 0
+        uncached_service = SparqlService(self.mock_config)
+        uncached_service.execute_query(query)
+        uncached_service.execute_query(query)
+        self.assertEqual(mock_interface.select.call_count, 6)
+
+        # Caching is off unless configured
+        default_service = SparqlService()
+        default_service.sparql_interface = mock_interface
+        default_service.execute_query(query, endpoint_url=mock_interface.endpoint_url)
+        default_service.execute_query(query, endpoint_url=mock_interface.endpoint_url)
+        self.assertEqual(mock_interface.select.call_count, 8)
+
     @patch('knowledgebase_processor.services.sparql_service.SparqlQueryInterface')
     def test_execute_query_no_endpoint_configured(self, mock_sparql_interface_class):
         """Test executing query without configured endpoint raises error."""
@@ -268,6 +348,102 @@ class TestSparqlService(unittest.TestCase):
         finally:
             tmp_file_path.unlink()
 
+    @patch('knowledgebase_processor.services.sparql_service.SparqlQueryInterface')
+    def test_load_rdf_files_batched_uses_format_of_file_suffix(self, mock_sparql_interface_class):
+        """Test that files are parsed in the format their suffix names, each format batched together."""
+        mock_interface = mock_sparql_interface_class.return_value
+        mock_interface.load_files.return_value = []
+        sparql_service = SparqlService(self.mock_config)
+        file_paths = [Path("a.nt"), Path("b.ttl"), Path("c.nt")]
+
+        failures = sparql_service.load_rdf_files_batched(file_paths, graph_uri="http://example.org/graph1")
+
+        self.assertEqual(failures, [])
+        self.assertEqual(
+            [(call.args[0], call.kwargs["format"]) for call in mock_interface.load_files.call_args_list],
+            [([Path("a.nt"), Path("c.nt")], "nt"), ([Path("b.ttl")], "turtle")]
+        )
+
+    @patch('knowledgebase_processor.services.sparql_service.SparqlQueryInterface')
+    def test_load_rdf_files_batch_loads_files_concurrently(self, mock_sparql_interface_class):
+        """Test that a batch's files are loaded at once through one interface, failures collected."""
+        import threading
+
+        mock_interface = mock_sparql_interface_class.return_value
+        barrier = threading.Barrier(3, timeout=5)
+
+        def load_file(file_path, **kwargs):
+            # Only returns once all three files of the batch are being loaded
+            barrier.wait()
+            if file_path == "b.ttl":
+                raise RuntimeError("load failed")
+
+        mock_interface.load_file.side_effect = load_file
+        sparql_service = SparqlService(self.mock_config)
+
+        with patch.object(sparql_service.logger, "error") as log_error:
+            sparql_service.load_rdf_files_batch(
+                [Path("a.ttl"), Path("b.ttl"), Path("c.nt")], batch_size=3, workers=3
+            )
+
+        self.assertEqual(mock_sparql_interface_class.call_count, 1)
+        self.assertEqual(
+            sorted((call.kwargs["file_path"], call.kwargs["format"]) for call in mock_interface.load_file.call_args_list),
+            [("a.ttl", "turtle"), ("b.ttl", "turtle"), ("c.nt", "nt")]
+        )
+        log_error.assert_any_call("File: b.ttl | Error: load failed")
+
+    @patch('knowledgebase_processor.services.sparql_service.SparqlQueryInterface')
+    def test_load_rdf_file_prefers_server_load(self, mock_sparql_interface_class):
+        """Test that the store is asked to LOAD the file unless upserting."""
+        mock_interface = mock_sparql_interface_class.return_value
+        sparql_service = SparqlService(self.mock_config)
+        file_path = Path("/data/rdf/doc 1.ttl")
+
+        sparql_service.load_rdf_file(
+            file_path=file_path,
+            graph_uri="http://example.org/graph1",
+            prefer_server_load=True
+        )
+        sparql_service.load_rdf_files_batched(
+            [file_path, Path("/data/rdf/doc2.ttl")],
+            prefer_server_load=True
+        )
+
+        mock_interface.update.assert_called_once_with(
+            "LOAD <file:///data/rdf/doc%201.ttl> INTO GRAPH <http://example.org/graph1>"
+        )
+        mock_interface.update_many.assert_called_once_with([
+            "LOAD <file:///data/rdf/doc%201.ttl>",
+            "LOAD <file:///data/rdf/doc2.ttl>",
+        ])
+        mock_interface.load_file.assert_not_called()
+        mock_interface.load_files.assert_not_called()
+
+        sparql_service.load_rdf_file(file_path=file_path, upsert=True, prefer_server_load=True)
+
+        mock_interface.load_file.assert_called_once_with(
+            file_path=str(file_path), graph_uri=None, format="turtle", upsert=True
+        )
+
+    @patch('knowledgebase_processor.services.sparql_service.SparqlQueryInterface')
+    def test_load_rdf_file_reuses_interface_for_same_credentials(self, mock_sparql_interface_class):
+        """Test that repeated authenticated loads share one SPARQL interface."""
+        sparql_service = SparqlService(self.mock_config)
+        mock_sparql_interface_class.reset_mock()
+
+        for name in ("a.ttl", "b.ttl"):
+            sparql_service.load_rdf_file(file_path=Path(name), username="testuser", password="testpass")
+        sparql_service.load_rdf_file(file_path=Path("c.ttl"), username="other", password="testpass")
+
+        self.assertEqual(
+            [call.kwargs["username"] for call in mock_sparql_interface_class.call_args_list],
+            ["testuser", "other"]
+        )
+
+        sparql_service.close()
+        self.assertTrue(mock_sparql_interface_class.return_value.close.called)
+
     @patch('knowledgebase_processor.services.sparql_service.SparqlQueryInterface')
     def test_load_rdf_file_inferred_query_endpoint(self, mock_sparql_interface_class):
         """Test RDF file loading with inferred query endpoint."""
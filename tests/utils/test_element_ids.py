@@ -0,0 +1,67 @@
+"""Tests for parsed content element ID generation and ID text normalization."""
+
+import re
+import unicodedata
+
+from knowledgebase_processor.utils.id_generator import EntityIdGenerator, new_element_id
+from knowledgebase_processor.models.markdown import Heading
+
+
+class TestNewElementId:
+    """Test process-unique element ID generation."""
+
+    def test_ids_are_unique(self):
+        """Test that consecutive element IDs never repeat."""
+        ids = [new_element_id() for _ in range(10_000)]
+
+        assert len(set(ids)) == len(ids)
+
+    def test_ids_share_the_process_prefix(self):
+        """Test that element IDs differ only in their sequence part."""
+        first, second = new_element_id(), new_element_id()
+
+        assert first.rsplit("-", 1)[0] == second.rsplit("-", 1)[0]
+        assert int(second.rsplit("-", 1)[1], 16) == int(first.rsplit("-", 1)[1], 16) + 1
+
+    def test_element_without_id_gets_one_when_preserved(self):
+        """Test that preserving content assigns a generated ID to elements without one."""
+        heading = Heading(level=1, text="Title", content="Title", position={"start": 0, "end": 0})
+        heading.id = None
+
+        heading.preserve_original_content("# Title\n")
+
+        assert heading.id
+
+
+class TestNormalizeTextForId:
+    """Test ADR-0013 text normalization for deterministic IDs."""
+
+    def test_matches_stepwise_normalization(self):
+        """Test that the single-pass substitution matches replacing then collapsing hyphens."""
+        generator = EntityIdGenerator("http://example.org/kb/")
+        samples = [
+            "John Doe", "  Acme -- Corp. ", "a--b", "---", "Café Münster",
+            "ﬁle №5", "notes/2024-01-01 meeting.md", "使用中文", "x_y z",
+        ]
+
+        for text in samples:
+            expected = unicodedata.normalize('NFKD', text).lower()
+            expected = re.sub(r'-+', '-', re.sub(r'[^a-z0-9]', '-', expected)).strip('-')
+            assert generator._normalize_text_for_id(text) == expected
+
+
+class TestWikilinkId:
+    """Test deterministic hashed WikiLink IDs."""
+
+    def test_hash_is_16_url_safe_characters(self):
+        """Test that link IDs are unchanged, 16 URL-safe characters and differ per document."""
+        generator = EntityIdGenerator("http://example.org/kb/")
+        doc = "http://example.org/kb/Document/notes"
+
+        link_id = generator.generate_wikilink_id(doc, "[[Other Note]]")
+        link_hash = link_id.rsplit("/", 1)[1]
+
+        assert link_hash == "vFEs4Ow7dO7eG82W"
+        assert link_id == EntityIdGenerator("http://example.org/kb").generate_wikilink_id(doc, "[[Other Note]]")
+        assert re.fullmatch(r"[A-Za-z0-9_-]{16}", link_hash)
+        assert generator.generate_wikilink_id(doc + "2", "[[Other Note]]") != link_id
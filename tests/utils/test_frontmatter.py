@@ -0,0 +1,71 @@
+"""Tests for YAML frontmatter loading."""
+
+import datetime
+
+import pytest
+import yaml
+
+from knowledgebase_processor.utils.frontmatter import _parse_simple_yaml, load_frontmatter_yaml
+
+
+class TestLoadFrontmatterYaml:
+    """Test that the simple-frontmatter fast path agrees with the YAML loader."""
+
+    SIMPLE_BLOCKS = [
+        "title: My Note",
+        'title: "Weekly sync: planning"\ndate: 2024-03-05\ntags: [meeting, planning]',
+        "title: 'Quoted # not a comment'\ncount: 42\nempty:",
+        "# a comment\n\ntags: []\nurl: http://example.org/a#b\nlang: C#",
+        "tags: [ a ,  b c , 'd' ]",
+        "",
+        "# only a comment",
+    ]
+
+    FALLBACK_BLOCKS = [
+        "tags:\n  - a\n  - b",
+        "published: yes",
+        "ratio: 1.5",
+        "version: 007",
+        "when: 2024-03-05T10:00:00",
+        "tags: [a, 'b, c']",
+        "title: value # comment",
+        "title: &anchor value",
+        "summary: |\n  text",
+        "title: 'it''s'",
+        'title: "tab\\there"',
+        "tags: [a, [b]]",
+        "title: one\ntitle: two",
+        "on: value",
+    ]
+
+    @pytest.mark.parametrize("text", SIMPLE_BLOCKS)
+    def test_simple_blocks_match_yaml(self, text):
+        """Test that simple blocks are parsed directly with the loader's result."""
+        assert _parse_simple_yaml(text) is not None
+        assert load_frontmatter_yaml(text) == yaml.safe_load(text)
+
+    @pytest.mark.parametrize("text", FALLBACK_BLOCKS)
+    def test_other_blocks_fall_back_to_yaml(self, text):
+        """Test that blocks outside the simple subset are left to the YAML loader."""
+        assert _parse_simple_yaml(text) is None
+        assert load_frontmatter_yaml(text) == yaml.safe_load(text)
+
+    def test_scalar_types(self):
+        """Test that integers and dates are constructed like YAML does."""
+        data = load_frontmatter_yaml("count: 3\ndate: 2024-03-05\ntags: [1, x]")
+
+        assert data == {"count": 3, "date": datetime.date(2024, 3, 5), "tags": [1, "x"]}
+        assert type(data["date"]) is datetime.date
+
+    @pytest.mark.parametrize("text", ["tags: [a?b]", "tags: [a, b?]", "tags: [why ?]"])
+    def test_flow_items_rejected_by_yaml_fall_back(self, text):
+        """Test that flow items the pure-Python loader rejects are not parsed directly."""
+        with pytest.raises(yaml.YAMLError):
+            yaml.safe_load(text)
+        assert _parse_simple_yaml(text) is None
+
+    @pytest.mark.parametrize("text", ["title: [unclosed", "title: a: b"])
+    def test_invalid_yaml_raises(self, text):
+        """Test that invalid frontmatter still raises a YAML error."""
+        with pytest.raises(yaml.YAMLError):
+            load_frontmatter_yaml(text)
@@ -1,5 +1,7 @@
 """Tests for todo IRI generation in EntityIdGenerator."""
 
+import re
+
 import pytest
 from knowledgebase_processor.utils.id_generator import EntityIdGenerator
 
@@ -129,4 +131,17 @@ class TestTodoIdGeneration:
                 expected = f"{self.doc_uri}/todo/{expected_suffix}"
             else:
                 expected = f"{self.doc_uri}/todo/{expected_suffix}"
-            assert todo_id == expected
\ No newline at end of file
+            assert todo_id == expected
+
+    def test_matches_stepwise_normalization(self):
+        """Test that the two-pass normalization matches the original step-by-step rules."""
+        samples = [
+            "  Fix bug #123 -- now!  ", "a - b", "a-!-b", "tab\tand\nnewline", "x__y",
+            "don't stop", "---", "émoji 🎉 -- party", "使用 中文", "",
+        ]
+
+        for text in samples:
+            expected = re.sub(r'[^\w\s-]', '', text.strip().lower())
+            expected = re.sub(r'\s+', ' ', expected).replace(' ', '-')
+            expected = re.sub(r'-+', '-', expected).strip('-') or "unnamed-todo"
+            assert self.generator.generate_todo_id(self.doc_uri, text) == f"{self.doc_uri}/todo/{expected}"